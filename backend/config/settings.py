@@ -14,13 +14,15 @@ from pathlib import Path
 from dotenv import load_dotenv
 import os
 from datetime import timedelta
-
-
-load_dotenv()  # .env dosyasını yükle
+from copy import deepcopy
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# .env dosyasını yükle. Yol açıkça verilir; aksi hâlde python-dotenv dosyayı
+# çağrı yığınında ve üst dizinlerde arar, bu da her açılışta zaman kaybettirir.
+load_dotenv(BASE_DIR / ".env")
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -53,14 +55,19 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.request_context.RequestContextMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    # CORS'tan sonra: reddedilen (429/503) yanıtlar da CORS başlıklarını taşır
+    "core.middleware.admission.AdmissionControlMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.query_plans.QueryPlanCaptureMiddleware",
+    "core.middleware.profiling.ProfilingMiddleware",
 ]
 
 CORS_ALLOW_ALL_ORIGINS = True
@@ -89,15 +96,232 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Bağlantı havuzu: psycopg3 + psycopg_pool ile Django'nun yerleşik havuzu kullanılır.
+# Havuz süreç başına tutulur; WSGI (sync) ve ASGI (sync_to_async thread'leri) altında
+# aynı şekilde çalışır. Havuz kapatılırsa CONN_MAX_AGE ile kalıcı bağlantıya düşülür.
+POSTGRES_POOL_ENABLED = os.getenv("POSTGRES_POOL_ENABLED", "True") == "True"
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": os.getenv("POSTGRES_DB"),
         "USER": os.getenv("POSTGRES_USER"),
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
-        "HOST": "db",
-        "PORT": "5432",
+        "HOST": os.getenv("POSTGRES_HOST", "db"),
+        "PORT": os.getenv("POSTGRES_PORT", "5432"),
+        # Havuz ile birlikte kalıcı bağlantı kullanılamaz, bu yüzden 0 olmalıdır
+        "CONN_MAX_AGE": (
+            0
+            if POSTGRES_POOL_ENABLED
+            else int(os.getenv("POSTGRES_CONN_MAX_AGE", "60"))
+        ),
+        # Havuzdan alınan bağlantılar kullanılmadan önce kontrol edilir
+        "CONN_HEALTH_CHECKS": os.getenv("POSTGRES_HEALTH_CHECKS", "True") == "True",
+        "OPTIONS": {},
+    }
+}
+
+if POSTGRES_POOL_ENABLED:
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("POSTGRES_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+        # Bağlantının en fazla yaşayabileceği süre (saniye)
+        "max_lifetime": float(os.getenv("POSTGRES_POOL_MAX_LIFETIME", "3600")),
+        # Boşta bekleyen fazla bağlantıların kapatılma süresi (saniye)
+        "max_idle": float(os.getenv("POSTGRES_POOL_MAX_IDLE", "600")),
+        # Havuzdan bağlantı almak için beklenecek en uzun süre (saniye)
+        "timeout": float(os.getenv("POSTGRES_POOL_TIMEOUT", "10")),
     }
+
+
+# Okuma replikaları: virgülle ayrılmış host listesi (ör. "replica1,replica2:5433").
+# Her host "replica_<n>" takma adıyla eklenir. Yerel testte aynı host iki kez
+# verilebilir (ör. POSTGRES_REPLICA_HOSTS=db). Replikalar sadece ortak bir önbellek
+# (DJANGO_CACHE_BACKEND) tanımlıysa kullanılır; aksi halde tüm sorgular birincile gider.
+DB_REPLICA_ALIASES = []
+for index, replica in enumerate(
+    filter(None, os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")), start=1
+):
+    host, _, port = replica.strip().partition(":")
+    alias = f"replica_{index}"
+    DATABASES[alias] = {
+        **deepcopy(DATABASES["default"]),
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        # Testlerde replika, birincil veritabanının aynası olarak kullanılır
+        "TEST": {"MIRROR": "default"},
+    }
+    DB_REPLICA_ALIASES.append(alias)
+
+DATABASE_ROUTERS = ["core.db.routers.ReplicaRouter"]
+
+# Yazma işleminden sonra kullanıcının birincil veritabanından okuyacağı süre (saniye)
+DB_PRIMARY_STICKY_SECONDS = int(os.getenv("DB_PRIMARY_STICKY_SECONDS", "5"))
+
+# Montajı bu kadar günden eski uçaklar ve parçaları arşiv tablolarına taşınır (archive_parts)
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "365"))
+
+
+# Admin listelerinde bu sayının üzerindeki sonuçlar için COUNT(*) yerine
+# planlayıcı tahmini gösterilir
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(
+    os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "10000")
+)
+
+# Uçak modeli / parça tipi silinirken bağlı kayıt sayısı bu sınırı aşarsa
+# silme arka plandaki işe (run_deletion_jobs) devredilir
+CASCADE_DELETE_INLINE_LIMIT = int(os.getenv("CASCADE_DELETE_INLINE_LIMIT", "1000"))
+CASCADE_DELETE_BATCH_SIZE = int(os.getenv("CASCADE_DELETE_BATCH_SIZE", "1000"))
+# Bu süre boyunca ilerlemeyen çalışan iş, başka bir worker tarafından devralınır
+DELETION_JOB_STALE_SECONDS = int(os.getenv("DELETION_JOB_STALE_SECONDS", "600"))
+# Bu süre boyunca ilerlemeyen parça takımı eşitleme işi (run_part_team_jobs),
+# başka bir worker tarafından devralınır
+PART_TEAM_JOB_STALE_SECONDS = int(os.getenv("PART_TEAM_JOB_STALE_SECONDS", "600"))
+
+# Idempotency-Key kayıtlarının saklanma süresi ve aynı anahtarlı
+# eşzamanlı isteğin ilk isteği bekleme süresi (saniye)
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "10"))
+# Yanıtı bu süre içinde kaydedilmeyen (worker'ı ölmüş) ilk istek terk edilmiş sayılır
+# ve anahtar tekrar deneyen istek tarafından devralınır (saniye)
+IDEMPOTENCY_LEASE_SECONDS = int(os.getenv("IDEMPOTENCY_LEASE_SECONDS", "60"))
+IDEMPOTENCY_POLL_INTERVAL = 0.1
+
+# İstek profilleme (X-Profile token'ı, süper kullanıcı ?_profile=1 veya örnekleme)
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "True") == "True"
+PROFILING_DIR = os.getenv("PROFILING_DIR", str(BASE_DIR / "profiles"))
+# Diskte tutulacak en fazla profil sayısı; fazlası en eskiden silinir
+PROFILING_MAX_PROFILES = int(os.getenv("PROFILING_MAX_PROFILES", "200"))
+# Rastgele profillenecek isteklerin oranı (0 = kapalı, 0.001 = binde bir)
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+# İstatistiksel profiler'ın örnekleme aralığı (saniye)
+PROFILING_SAMPLE_INTERVAL = float(os.getenv("PROFILING_SAMPLE_INTERVAL", "0.005"))
+# X-Profile token'larının geçerlilik süresi (saniye)
+PROFILING_TOKEN_MAX_AGE = int(os.getenv("PROFILING_TOKEN_MAX_AGE", "3600"))
+PROFILING_SQL_MAX_LENGTH = 2000
+
+# Yavaş sorgu planı yakalama (QueryPlan, query_plan_report)
+QUERY_PLAN_CAPTURE_ENABLED = os.getenv("QUERY_PLAN_CAPTURE_ENABLED", "True") == "True"
+# Sorguları izlenecek isteklerin oranı
+QUERY_PLAN_SAMPLE_RATE = float(os.getenv("QUERY_PLAN_SAMPLE_RATE", "0.01"))
+# Bu süreyi (ms) aşan okuma sorgularının planı yakalanır
+QUERY_PLAN_THRESHOLD_MS = float(os.getenv("QUERY_PLAN_THRESHOLD_MS", "200"))
+# Bir istekte planı yakalanacak en fazla sorgu (en yavaşlar)
+QUERY_PLAN_MAX_PER_REQUEST = int(os.getenv("QUERY_PLAN_MAX_PER_REQUEST", "1"))
+# Aynı sorgu için iki plan yakalama arasındaki en kısa süre (saniye)
+QUERY_PLAN_CAPTURE_INTERVAL = int(os.getenv("QUERY_PLAN_CAPTURE_INTERVAL", "3600"))
+# Planların karşılaştırıldığı sürüm etiketi
+QUERY_PLAN_RELEASE = os.getenv("APP_VERSION") or "dev"
+
+# Toplu istek endpoint'i (POST /api/v1/batch/): istek başına en fazla alt istek
+# ve eşzamanlı çalışacak alt istek sayısı (sadece bağlantı havuzu varsa)
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "4"))
+
+# Üretim analizlerinde bir istekte dönebilecek en fazla dilim sayısı
+# (ör. 2000 saatlik dilim ≈ 83 gün, 2000 günlük dilim ≈ 5,5 yıl)
+ANALYTICS_MAX_BUCKETS = int(os.getenv("ANALYTICS_MAX_BUCKETS", "2000"))
+# Teslim süresi ve üretim hızı raporlarında en uzun tarih aralığı (gün) ve
+# veritabanından tek seferde okunan satır sayısı
+LEAD_TIME_MAX_DAYS = int(os.getenv("LEAD_TIME_MAX_DAYS", "366"))
+LEAD_TIME_CHUNK_SIZE = int(os.getenv("LEAD_TIME_CHUNK_SIZE", "100000"))
+
+# Parquet/Arrow dışa aktarmada satır grubu (ve veritabanından tek seferde okunan
+# satır) sayısı ile Parquet sıkıştırma algoritması
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "65536"))
+EXPORT_PARQUET_COMPRESSION = os.getenv("EXPORT_PARQUET_COMPRESSION", "zstd")
+
+# Genel arama: veritabanına gidilen en kısa sorgu, en fazla sonuç sayısı, yanıtın
+# tarayıcıda önbelleklenme süresi (saniye) ve trigram indeksi olmayan veritabanlarında
+# (SQLite) Python'da puanlanan en fazla aday satır sayısı
+SEARCH_MIN_LENGTH = int(os.getenv("SEARCH_MIN_LENGTH", "2"))
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "50"))
+SEARCH_CACHE_SECONDS = int(os.getenv("SEARCH_CACHE_SECONDS", "10"))
+SEARCH_FALLBACK_MAX_CANDIDATES = int(
+    os.getenv("SEARCH_FALLBACK_MAX_CANDIDATES", "5000")
+)
+
+# Kabul kontrolü (admission control)
+# Sınırlar worker süreci başınadır. Sınıflar: write (montaj/üretim), interactive
+# (normal okumalar), bulk (raporlar, dışa aktarımlar, derin sayfalama).
+ADMISSION_CONTROL_ENABLED = os.getenv("ADMISSION_CONTROL_ENABLED", "True") == "True"
+ADMISSION_PATH_PREFIX = "/api/"
+# Aşırı yükte de erişilebilmesi gereken izleme endpoint'leri
+ADMISSION_EXEMPT_PATHS = ["/api/v1/system/"]
+# POST ile gelse de sadece okuma yapan endpoint'ler (yazma sınıfına girmez)
+ADMISSION_READ_ONLY_PATHS = ["/api/v1/batch/"]
+# POST ile gelen ama ucuz olan kimlik doğrulama endpoint'leri interactive sınıfta çalışır
+ADMISSION_INTERACTIVE_PATHS = ["/api/v1/auth/", "/api/v1/auth/refresh/"]
+ADMISSION_BULK_PATHS = [
+    path.strip()
+    for path in os.getenv(
+        "ADMISSION_BULK_PATHS",
+        "/api/v1/parts/stock/,/api/v1/analytics/lead-times/,"
+        "/api/v1/analytics/production-rates/,/api/v1/exports/",
+    ).split(",")
+    if path.strip()
+]
+# Bu offset ve üzerindeki liste istekleri bulk sayılır
+ADMISSION_DEEP_OFFSET = int(os.getenv("ADMISSION_DEEP_OFFSET", "1000"))
+ADMISSION_RETRY_AFTER = int(os.getenv("ADMISSION_RETRY_AFTER", "2"))
+ADMISSION_TEAM_CACHE_SECONDS = int(os.getenv("ADMISSION_TEAM_CACHE_SECONDS", "300"))
+ADMISSION_CLASSES = {
+    "write": {
+        "concurrency": int(os.getenv("ADMISSION_WRITE_CONCURRENCY", "16")),
+        "team_concurrency": int(os.getenv("ADMISSION_WRITE_TEAM_CONCURRENCY", "8")),
+        "queue_timeout": float(os.getenv("ADMISSION_WRITE_QUEUE_TIMEOUT", "2")),
+        "statement_timeout_ms": int(
+            os.getenv("ADMISSION_WRITE_STATEMENT_TIMEOUT_MS", "5000")
+        ),
+    },
+    "interactive": {
+        "concurrency": int(os.getenv("ADMISSION_INTERACTIVE_CONCURRENCY", "16")),
+        "team_concurrency": int(
+            os.getenv("ADMISSION_INTERACTIVE_TEAM_CONCURRENCY", "6")
+        ),
+        "queue_timeout": float(os.getenv("ADMISSION_INTERACTIVE_QUEUE_TIMEOUT", "0.5")),
+        "statement_timeout_ms": int(
+            os.getenv("ADMISSION_INTERACTIVE_STATEMENT_TIMEOUT_MS", "3000")
+        ),
+    },
+    "bulk": {
+        "concurrency": int(os.getenv("ADMISSION_BULK_CONCURRENCY", "2")),
+        "team_concurrency": int(os.getenv("ADMISSION_BULK_TEAM_CONCURRENCY", "1")),
+        "queue_timeout": float(os.getenv("ADMISSION_BULK_QUEUE_TIMEOUT", "0")),
+        "statement_timeout_ms": int(
+            os.getenv("ADMISSION_BULK_STATEMENT_TIMEOUT_MS", "15000")
+        ),
+    },
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Varsayılan önbellek süreç içidir. Birden fazla worker ile paylaşılan durum
+# (ör. birincil veritabanı sabitleme) için Redis gibi ortak bir önbellek verilmelidir.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", ""),
+    },
+    # Uçak detay yanıtları. Varsayılan LocMem önbelleği LRU'dur ve MAX_ENTRIES ile sınırlıdır.
+    # Ortak bir önbellekte (ör. Redis) kayıtlar uçak bazında çıkarılır ve okumada
+    # veritabanına gidilmez. Süreç içi önbellekte kayıtlar, mevcut uçakları değiştiren
+    # yazmaların sayacıyla (ChangeWatermark) doğrulanır; yeni montajlar bu sayacı artırmaz.
+    "aircraft_detail": {
+        "BACKEND": os.getenv(
+            "AIRCRAFT_DETAIL_CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.getenv("AIRCRAFT_DETAIL_CACHE_LOCATION", "aircraft-detail"),
+        "TIMEOUT": int(os.getenv("AIRCRAFT_DETAIL_CACHE_TIMEOUT", "300")),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("AIRCRAFT_DETAIL_CACHE_MAX_ENTRIES", "5000")),
+        },
+    },
 }
 
 
@@ -159,6 +383,24 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
 }
 
+# Kara listedeki refresh token'lar için süreç içi Bloom filtresi. Filtrede olmayan
+# token için veritabanına gidilmez. Diğer süreçlerin eklediği kayıtlar önbellekteki
+# sürüm sayacı değişince, en geç SYNC_INTERVAL saniyede bir okunur. Filtre sadece
+# varsayılan önbellek ortak (ör. Redis) olduğunda kullanılır; LocMem önbellekte kara
+# liste her yenilemede veritabanından kontrol edilir.
+TOKEN_REVOCATION_FILTER_ENABLED = (
+    os.getenv("TOKEN_REVOCATION_FILTER_ENABLED", "True") == "True"
+)
+TOKEN_REVOCATION_FILTER_CAPACITY = int(
+    os.getenv("TOKEN_REVOCATION_FILTER_CAPACITY", "100000")
+)
+TOKEN_REVOCATION_FILTER_ERROR_RATE = float(
+    os.getenv("TOKEN_REVOCATION_FILTER_ERROR_RATE", "0.001")
+)
+TOKEN_REVOCATION_FILTER_SYNC_INTERVAL = float(
+    os.getenv("TOKEN_REVOCATION_FILTER_SYNC_INTERVAL", "1")
+)
+
 SWAGGER_SETTINGS = {
     "USE_SESSION_AUTH": False,
     "SECURITY_DEFINITIONS": {
@@ -170,6 +412,8 @@ SWAGGER_SETTINGS = {
         }
     },
     "URL": "http://localhost:8000",
+    # Swagger arayüzü önceden üretilmiş şemayı bu adresten okur
+    "SPEC_URL": "schema-json",
     "OPERATIONS_SORTER": "alpha",
     "TAGS_SORTER": "alpha",
     "DOC_EXPANSION": "none",
@@ -177,39 +421,49 @@ SWAGGER_SETTINGS = {
     "APIS_SORTER": "alpha",
 }
 
+# Önceden üretilen OpenAPI şema dosyalarının dizini
+OPENAPI_SCHEMA_DIR = os.getenv("OPENAPI_SCHEMA_DIR", str(BASE_DIR / "openapi"))
+
+# Soğuk açılış bütçeleri (saniye); core.tests içindeki regresyon testleri kullanır
+STARTUP_BUDGET_CHECK_SECONDS = float(os.getenv("STARTUP_BUDGET_CHECK_SECONDS", "1.0"))
+STARTUP_BUDGET_WSGI_SECONDS = float(os.getenv("STARTUP_BUDGET_WSGI_SECONDS", "1.0"))
+
 # Logging Configuration
+# Kayıtlar sınırlı bir kuyruğa bırakılır ve arka plandaki bir thread tarafından
+# konsola ve JSON formatında, döndürülen log dosyasına yazılır.
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
-    "formatters": {
-        "verbose": {
-            "format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
-            "style": "{",
+    "filters": {
+        "request_context": {
+            "()": "core.logs.RequestContextFilter",
         },
-        "simple": {
-            "format": "{levelname} {message}",
-            "style": "{",
+        "sampling": {
+            "()": "core.logs.SamplingFilter",
+            # Örn: "django.server=0.1,core.views=0.5"
+            "rates": os.getenv("LOG_SAMPLING_RATES", ""),
         },
     },
     "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "verbose",
-        },
-        "file": {
-            "class": "logging.FileHandler",
-            "filename": "debug.log",
-            "formatter": "verbose",
+        "queue": {
+            "class": "core.logs.AsyncQueueHandler",
+            "filters": ["sampling", "request_context"],
+            "filename": os.getenv("LOG_FILE", "debug.log"),
+            # Boyut bazlı döndürme; LOG_ROTATE_WHEN verilirse zaman bazlı (ör. "midnight")
+            "max_bytes": int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+            "backup_count": int(os.getenv("LOG_BACKUP_COUNT", "5")),
+            "when": os.getenv("LOG_ROTATE_WHEN") or None,
+            "queue_size": int(os.getenv("LOG_QUEUE_SIZE", "10000")),
         },
     },
     "loggers": {
         "django": {
-            "handlers": ["console", "file"],
+            "handlers": ["queue"],
             "level": "INFO",
             "propagate": True,
         },
         "core": {
-            "handlers": ["console", "file"],
+            "handlers": ["queue"],
             "level": "DEBUG",
             "propagate": True,
         },
@@ -1,23 +1,11 @@
 from django.contrib import admin
 from django.urls import path, include
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Uçak Üretim API",
-        default_version="v1",
-        description="JWT tabanlı uçak üretim sistemi",
-    ),
-    public=True,
-)
+from core.views.docs import OpenAPISchemaView, swagger_ui_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/", include("core.urls.v1")),
-    path(
-        "docs/",
-        schema_view.with_ui("swagger", cache_timeout=0),
-        name="schema-swagger-ui",
-    ),
+    # Arayüz şemayı her seferinde üretmez, önceden üretilmiş dosyayı SPEC_URL'den okur
+    path("docs/", swagger_ui_view, name="schema-swagger-ui"),
+    path("docs/openapi.json", OpenAPISchemaView.as_view(), name="schema-json"),
 ]
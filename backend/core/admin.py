@@ -1,4 +1,19 @@
-from django.contrib import admin
+import json
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.auth import get_permission_codename
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.http import HttpResponseRedirect
+from django.urls import reverse
+from django.utils.functional import cached_property
+from django.utils.html import format_html
+from .aircraft_cache import clear_aircraft_detail_cache, evict_aircraft_detail
+from .deletion import cascade_steps, enqueue_deletion, exceeds_inline_limit
+from .part_teams import enqueue_team_sync
+from .stock import adjust_stock, free_counts, part_counts
+from .rollups import adjust_rollups
+from .watermarks import AIRCRAFT, PARTS, bump
 from .models import (
     Team,
     Personnel,
@@ -6,11 +21,562 @@ from .models import (
     Part,
     AircraftModel,
     Aircraft,
+    ArchivedAircraft,
+    ArchivedPart,
+    ArchivedPartCount,
+    PartStockCount,
+    PartProductionRollup,
+    AircraftAssemblyRollup,
+    IdempotencyKey,
+    DeletionJob,
+    PartTeamSyncJob,
+    QueryPlan,
 )
 
-admin.site.register(Team)
-admin.site.register(Personnel)
-admin.site.register(PartType)
-admin.site.register(Part)
-admin.site.register(AircraftModel)
-admin.site.register(Aircraft)
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Büyük tablolarda COUNT(*) yerine PostgreSQL planlayıcısının satır tahminini kullanan paginator.
+    Tahmin ADMIN_ESTIMATED_COUNT_THRESHOLD altındaysa gerçek sayım yapılır.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == "postgresql":
+            sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = int(plan[0]["Plan"]["Plan Rows"])
+            if estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+class SerialNumberSearchMixin:
+    """
+    Seri numarası aramasını indeksli tam eşleşme veya önek (LIKE 'x%') olarak yapar.
+    Varsayılan icontains araması tüm tabloyu tarar.
+    """
+
+    search_fields = ("serial_number",)
+    search_help_text = "Seri numarası veya başlangıcı"
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        return queryset.filter(serial_number__startswith=search_term), False
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Milyonlarca satırlı tablolar için ortak admin ayarları.
+    """
+
+    paginator = EstimatedCountPaginator
+    # Filtre uygulandığında ikinci bir COUNT(*) çalıştırılmaz
+    show_full_result_count = False
+    list_per_page = 50
+    # Sıralama birincil anahtar indeksi üzerinden yapılır
+    ordering = ("-id",)
+
+
+class UsageFilter(admin.SimpleListFilter):
+    """
+    Parçaları uçakta kullanılıp kullanılmadığına göre filtreler.
+    Uçak listesini yüklemeden indeksli used_in_aircraft alanı üzerinden çalışır.
+    """
+
+    title = "kullanım durumu"
+    parameter_name = "used"
+
+    def lookups(self, request, model_admin):
+        return (("yes", "Uçakta kullanılıyor"), ("no", "Stokta"))
+
+    def queryset(self, request, queryset):
+        if self.value() == "yes":
+            return queryset.filter(used_in_aircraft__isnull=False)
+        if self.value() == "no":
+            return queryset.filter(used_in_aircraft__isnull=True)
+        return queryset
+
+
+class WatermarkBumpMixin:
+    """
+    Admin üzerinden yapılan değişikliklerde parça ve uçak koleksiyonlarının
+    sayaçlarını artırır; böylece API liste ETag'leri geçersiz olur.
+    Kayıt uçak detay yanıtlarında iç içe dönüyorsa (clears_aircraft_detail)
+    detay önbelleği de temizlenir.
+    """
+
+    clears_aircraft_detail = False
+
+    def _bump(self):
+        bump(PARTS, AIRCRAFT)
+        if self.clears_aircraft_detail:
+            clear_aircraft_detail_cache()
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self._bump()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self._bump()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        self._bump()
+
+
+class RollupAdminMixin:
+    """
+    Admin üzerinden eklenen, değiştirilen ve silinen parça ve uçakları saatlik
+    üretim/montaj sayaçlarına yansıtır. Değişiklikte kaydın eski hali sayaçlardan
+    düşülür, yeni hali eklenir.
+    """
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            if change:
+                adjust_rollups(self.model.objects.filter(pk=obj.pk), sign=-1)
+            super().save_model(request, obj, form, change)
+            adjust_rollups(self.model.objects.filter(pk=obj.pk))
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            adjust_rollups(self.model.objects.filter(pk=obj.pk), sign=-1)
+            super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            adjust_rollups(queryset, sign=-1)
+            super().delete_queryset(request, queryset)
+
+
+class BackgroundCascadeDeleteMixin:
+    """
+    Bağlı kayıt sayısı CASCADE_DELETE_INLINE_LIMIT üzerindeyse silmeyi
+    istek içinde yapmak yerine arka planda çalışan bir DeletionJob'a devreder.
+    Onay sayfasında bağlı kayıtlar tek tek yüklenip listelenmez.
+    """
+
+    deletion_target_type = None
+
+    def _is_large(self, obj):
+        return exceeds_inline_limit(self.deletion_target_type, obj.pk)
+
+    def get_deleted_objects(self, objs, request):
+        objs = list(objs)
+        if not any(self._is_large(obj) for obj in objs):
+            return super().get_deleted_objects(objs, request)
+
+        _, steps = cascade_steps(self.deletion_target_type)
+        perms_needed = set()
+        for model, _ in steps:
+            opts = model._meta
+            codename = get_permission_codename("delete", opts)
+            if not request.user.has_perm(f"{opts.app_label}.{codename}"):
+                perms_needed.add(opts.verbose_name)
+
+        summary = [
+            f"{obj} ve bağlı tüm kayıtlar arka planda partiler halinde silinecek."
+            for obj in objs
+        ]
+        return (
+            summary,
+            {self.model._meta.verbose_name_plural: len(objs)},
+            perms_needed,
+            [],
+        )
+
+    def _delete_inline(self, obj):
+        """
+        Hedefi bağlı kayıtlarıyla birlikte istek içinde siler; silinen parça ve
+        uçaklar üretim/montaj sayaçlarından düşülür.
+        """
+        _, steps = cascade_steps(self.deletion_target_type)
+        with transaction.atomic():
+            for model, field in steps:
+                adjust_rollups(model.objects.filter(**{field: obj.pk}), sign=-1)
+            obj.delete()
+
+    def delete_model(self, request, obj):
+        if not self._is_large(obj):
+            self._delete_inline(obj)
+            clear_aircraft_detail_cache()
+            return
+        request.deletion_job = enqueue_deletion(
+            self.deletion_target_type, obj, request.user
+        )
+
+    def delete_queryset(self, request, queryset):
+        for obj in queryset:
+            if self._is_large(obj):
+                job = enqueue_deletion(self.deletion_target_type, obj, request.user)
+                self.message_user(
+                    request,
+                    f"{obj} arka planda silinmek üzere kuyruğa alındı (iş #{job.pk}).",
+                    level=messages.WARNING,
+                )
+            else:
+                self._delete_inline(obj)
+        clear_aircraft_detail_cache()
+
+    def response_delete(self, request, obj_display, obj_id):
+        job = getattr(request, "deletion_job", None)
+        if job is None:
+            return super().response_delete(request, obj_display, obj_id)
+        self.message_user(
+            request,
+            f"{obj_display} çok sayıda bağlı kayda sahip; arka planda silinmek "
+            f"üzere kuyruğa alındı (iş #{job.pk}).",
+            level=messages.WARNING,
+        )
+        return HttpResponseRedirect(
+            reverse("admin:core_deletionjob_change", args=[job.pk])
+        )
+
+
+@admin.register(Team)
+class TeamAdmin(WatermarkBumpMixin, admin.ModelAdmin):
+    ordering = ("name",)
+    list_display = ("name", "responsibility")
+    search_fields = ("name",)
+
+
+@admin.register(Personnel)
+class PersonnelAdmin(WatermarkBumpMixin, admin.ModelAdmin):
+    # Montajı yapan personel ve uçak modeli uçak detayında iç içe döner
+    clears_aircraft_detail = True
+    list_display = ("full_name", "user", "team")
+    list_select_related = ("user", "team")
+    list_filter = ("team",)
+    search_fields = ("full_name", "user__username")
+    raw_id_fields = ("user",)
+    autocomplete_fields = ("team",)
+
+
+@admin.register(PartType)
+class PartTypeAdmin(WatermarkBumpMixin, BackgroundCascadeDeleteMixin, admin.ModelAdmin):
+    deletion_target_type = DeletionJob.TARGET_PART_TYPE
+    ordering = ("name",)
+    list_display = ("name", "allowed_team")
+    list_select_related = ("allowed_team",)
+    search_fields = ("name",)
+    autocomplete_fields = ("allowed_team",)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change and "allowed_team" in form.changed_data:
+            # Parçaların team alanı arka plandaki işte (run_part_team_jobs) partiler
+            # halinde güncellenir; iş, tip kaydıyla aynı transaction'da oluşturulur
+            job = enqueue_team_sync(obj, request.user)
+            self.message_user(
+                request,
+                format_html(
+                    'Parçalar arka planda yeni takıma ({}) aktarılacak: <a href="{}">iş #{}</a>.',
+                    obj.allowed_team,
+                    reverse("admin:core_partteamsyncjob_change", args=[job.pk]),
+                    job.pk,
+                ),
+            )
+
+
+@admin.register(AircraftModel)
+class AircraftModelAdmin(
+    WatermarkBumpMixin, BackgroundCascadeDeleteMixin, admin.ModelAdmin
+):
+    deletion_target_type = DeletionJob.TARGET_AIRCRAFT_MODEL
+    clears_aircraft_detail = True
+    ordering = ("name",)
+    list_display = ("name",)
+    search_fields = ("name",)
+
+
+@admin.register(Part)
+class PartAdmin(
+    RollupAdminMixin, WatermarkBumpMixin, SerialNumberSearchMixin, LargeTableAdmin
+):
+    list_display = (
+        "serial_number",
+        "type",
+        "aircraft_model",
+        "used_in_aircraft",
+        "produced_by",
+        "created_at",
+    )
+    list_select_related = (
+        "type__allowed_team",
+        "aircraft_model",
+        "used_in_aircraft__model",
+        "produced_by",
+    )
+    list_filter = (UsageFilter, "team", "type", "aircraft_model")
+    autocomplete_fields = ("type", "aircraft_model")
+    raw_id_fields = ("used_in_aircraft", "produced_by")
+    actions = ("recycle_parts", "release_from_aircraft")
+
+    def save_model(self, request, obj, form, change):
+        if "type" in form.changed_data:
+            obj.team_id = obj.type.allowed_team_id
+        # Parçanın eski hali stoktan düşülür, yeni hali eklenir
+        if change:
+            adjust_stock(
+                part_counts(
+                    Part.objects.filter(pk=obj.pk, used_in_aircraft__isnull=True)
+                ),
+                sign=-1,
+            )
+        super().save_model(request, obj, form, change)
+        adjust_stock(free_counts([obj]))
+        # Parçanın eski ve yeni uçağının detay yanıtı değişmiştir
+        evict_aircraft_detail(
+            {form.initial.get("used_in_aircraft"), obj.used_in_aircraft_id} - {None}
+        )
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        adjust_stock(free_counts([obj]), sign=-1)
+        evict_aircraft_detail({obj.used_in_aircraft_id} - {None})
+
+    def get_actions(self, request):
+        # Varsayılan toplu silme tüm kayıtları onay sayfasında belleğe yükler
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
+        return actions
+
+    @admin.action(
+        description="Seçili parçaları geri dönüşüme gönder", permissions=["delete"]
+    )
+    def recycle_parts(self, request, queryset):
+        """
+        Uçakta kullanılmayan parçaları tek sorguda siler.
+        Uçakta kullanılan parçalar atlanır.
+        """
+        skipped = queryset.filter(used_in_aircraft__isnull=False).count()
+        free = queryset.filter(used_in_aircraft__isnull=True)
+        with transaction.atomic():
+            removed = part_counts(free)
+            adjust_rollups(free, sign=-1)
+            deleted, _ = free.delete()
+            adjust_stock(removed, sign=-1)
+            bump(PARTS)
+        self.message_user(request, f"{deleted} parça geri dönüşüme gönderildi.")
+        if skipped:
+            self.message_user(
+                request,
+                f"Uçakta kullanılan {skipped} parça atlandı.",
+                level=messages.WARNING,
+            )
+
+    @admin.action(description="Seçili parçaları uçaktan çıkar", permissions=["change"])
+    def release_from_aircraft(self, request, queryset):
+        """
+        Parçaların uçak ilişkisini tek UPDATE ile kaldırır.
+        """
+        used = queryset.filter(used_in_aircraft__isnull=False)
+        aircraft_ids = set(used.values_list("used_in_aircraft_id", flat=True))
+        with transaction.atomic():
+            released = part_counts(used)
+            updated = used.update(used_in_aircraft=None)
+            adjust_stock(released)
+            # Uçakların detay yanıtları da değiştiği için uçak sayacı da artırılır
+            bump(PARTS, AIRCRAFT)
+            evict_aircraft_detail(aircraft_ids)
+        self.message_user(request, f"{updated} parça uçaktan çıkarıldı.")
+
+
+@admin.register(Aircraft)
+class AircraftAdmin(
+    RollupAdminMixin, WatermarkBumpMixin, SerialNumberSearchMixin, LargeTableAdmin
+):
+    list_display = ("serial_number", "model", "assembled_by", "assembled_at")
+    list_select_related = ("model", "assembled_by")
+    list_filter = ("model",)
+    autocomplete_fields = ("model",)
+    raw_id_fields = ("assembled_by",)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        evict_aircraft_detail([obj.pk])
+
+    def delete_model(self, request, obj):
+        aircraft_id = obj.pk
+        # Uçak silinince parçaları stoğa döner
+        released = part_counts(Part.objects.filter(used_in_aircraft_id=aircraft_id))
+        super().delete_model(request, obj)
+        adjust_stock(released)
+        evict_aircraft_detail([aircraft_id])
+
+    def delete_queryset(self, request, queryset):
+        aircraft_ids = list(queryset.values_list("pk", flat=True))
+        with transaction.atomic():
+            released = part_counts(
+                Part.objects.filter(used_in_aircraft_id__in=aircraft_ids)
+            )
+            super().delete_queryset(request, queryset)
+            adjust_stock(released)
+            evict_aircraft_detail(aircraft_ids)
+
+
+@admin.register(ArchivedAircraft)
+class ArchivedAircraftAdmin(
+    RollupAdminMixin, WatermarkBumpMixin, SerialNumberSearchMixin, LargeTableAdmin
+):
+    list_display = ("serial_number", "model", "assembled_at", "archived_at")
+    list_select_related = ("model",)
+    list_filter = ("model",)
+    raw_id_fields = ("model", "assembled_by")
+
+
+@admin.register(ArchivedPart)
+class ArchivedPartAdmin(
+    RollupAdminMixin, WatermarkBumpMixin, SerialNumberSearchMixin, LargeTableAdmin
+):
+    list_display = ("serial_number", "type", "aircraft_model", "archived_at")
+    list_select_related = ("type__allowed_team", "aircraft_model")
+    list_filter = ("type", "aircraft_model")
+    raw_id_fields = ("type", "aircraft_model", "produced_by", "used_in_aircraft")
+
+
+@admin.register(ArchivedPartCount)
+class ArchivedPartCountAdmin(admin.ModelAdmin):
+    list_display = ("aircraft_model", "part_type", "count")
+    list_select_related = ("aircraft_model", "part_type__allowed_team")
+
+
+@admin.register(PartStockCount)
+class PartStockCountAdmin(admin.ModelAdmin):
+    list_display = ("aircraft_model", "part_type", "count")
+    list_select_related = ("aircraft_model", "part_type__allowed_team")
+
+
+@admin.register(PartProductionRollup)
+class PartProductionRollupAdmin(admin.ModelAdmin):
+    list_display = ("bucket", "team", "part_type", "count")
+    list_select_related = ("team", "part_type__allowed_team")
+    list_filter = ("team", "part_type")
+    date_hierarchy = "bucket"
+
+
+@admin.register(AircraftAssemblyRollup)
+class AircraftAssemblyRollupAdmin(admin.ModelAdmin):
+    list_display = ("bucket", "aircraft_model", "count")
+    list_select_related = ("aircraft_model",)
+    list_filter = ("aircraft_model",)
+    date_hierarchy = "bucket"
+
+
+@admin.register(IdempotencyKey)
+class IdempotencyKeyAdmin(LargeTableAdmin):
+    list_display = ("key", "user", "endpoint", "status_code", "expires_at")
+    list_select_related = ("user",)
+    search_fields = ("=key",)
+    raw_id_fields = ("user",)
+
+
+@admin.register(DeletionJob)
+class DeletionJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "target_type",
+        "target_repr",
+        "status",
+        "progress_display",
+        "created_by",
+        "created_at",
+        "finished_at",
+    )
+    list_select_related = ("created_by",)
+    list_filter = ("status", "target_type")
+    ordering = ("-id",)
+    readonly_fields = [field.name for field in DeletionJob._meta.fields]
+    actions = ("requeue_jobs",)
+
+    def has_add_permission(self, request):
+        # İşler sadece silme işlemi sırasında oluşturulur
+        return False
+
+    @admin.display(description="İlerleme")
+    def progress_display(self, obj):
+        if not obj.estimated_total:
+            return f"{obj.deleted_total}"
+        percent = obj.deleted_total * 100 // obj.estimated_total
+        return f"{obj.deleted_total}/{obj.estimated_total} (%{percent})"
+
+    @admin.action(description="Seçili işleri tekrar kuyruğa al")
+    def requeue_jobs(self, request, queryset):
+        """
+        Hata almış işleri kaldıkları yerden devam etmek üzere bekleyen duruma çeker.
+        """
+        updated = queryset.filter(status=DeletionJob.STATUS_FAILED).update(
+            status=DeletionJob.STATUS_PENDING
+        )
+        self.message_user(request, f"{updated} iş tekrar kuyruğa alındı.")
+
+
+@admin.register(PartTeamSyncJob)
+class PartTeamSyncJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "part_type",
+        "status",
+        "progress_display",
+        "created_by",
+        "created_at",
+        "finished_at",
+    )
+    list_select_related = ("part_type__allowed_team", "created_by")
+    list_filter = ("status",)
+    ordering = ("-id",)
+    readonly_fields = [field.name for field in PartTeamSyncJob._meta.fields]
+    actions = ("requeue_jobs",)
+
+    def has_add_permission(self, request):
+        # İşler sadece parça tipinin takımı değiştirildiğinde oluşturulur
+        return False
+
+    @admin.display(description="İlerleme")
+    def progress_display(self, obj):
+        if not obj.estimated_total:
+            return f"{obj.updated_total}"
+        # Sayımdan sonra eski takımla kaydedilen parçalar da güncellenebilir
+        percent = min(obj.updated_total * 100 // obj.estimated_total, 100)
+        return f"{obj.updated_total}/{obj.estimated_total} (%{percent})"
+
+    @admin.action(description="Seçili işleri tekrar kuyruğa al")
+    def requeue_jobs(self, request, queryset):
+        """
+        Hata almış işleri kaldıkları yerden devam etmek üzere bekleyen duruma çeker.
+        """
+        updated = queryset.filter(status=PartTeamSyncJob.STATUS_FAILED).update(
+            status=PartTeamSyncJob.STATUS_PENDING
+        )
+        self.message_user(request, f"{updated} iş tekrar kuyruğa alındı.")
+
+
+@admin.register(QueryPlan)
+class QueryPlanAdmin(admin.ModelAdmin):
+    list_display = (
+        "view_name",
+        "fingerprint",
+        "release",
+        "total_cost",
+        "execution_ms",
+        "samples",
+        "last_seen_at",
+    )
+    list_filter = ("release",)
+    search_fields = ("=fingerprint", "view_name")
+    ordering = ("-last_seen_at",)
+    readonly_fields = [field.name for field in QueryPlan._meta.fields]
+
+    def has_add_permission(self, request):
+        # Planlar sadece QueryPlanCaptureMiddleware tarafından kaydedilir
+        return False
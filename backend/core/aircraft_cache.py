@@ -0,0 +1,95 @@
+import hashlib
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from core.serializers.aircraft import AircraftDetailSerializer
+from core.watermarks import AIRCRAFT_DETAIL, bump, get_versions
+
+# Uçak detay yanıtlarının tutulduğu önbellek (settings.CACHES)
+CACHE_ALIAS = "aircraft_detail"
+
+
+def _key(aircraft_id):
+    return f"aircraft:detail:{aircraft_id}"
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def is_shared():
+    """
+    Detay önbelleğinin tüm worker'larca paylaşılıp paylaşılmadığını döndürür.
+    Ortak önbellekte uçak bazında çıkarma her worker için geçerlidir.
+    """
+    return not isinstance(_cache(), (LocMemCache, DummyCache))
+
+
+def current_version():
+    """
+    Önbellek kayıtlarının doğrulandığı sayaç. Ortak önbellekte kayıtlar uçak bazında
+    çıkarıldığı için sayaç okunmaz ve None döner. Süreç içi önbellekte diğer
+    worker'ların kayıtları çıkarılamadığından, mevcut uçakların detayını değiştiren
+    yazmaların sayacı (AIRCRAFT_DETAIL) okunur; yeni montajlar bu sayacı artırmaz.
+    """
+    if is_shared():
+        return None
+    return get_versions([AIRCRAFT_DETAIL])[0]
+
+
+def build_entry(aircraft, version):
+    """
+    Uçağın detay yanıtını JSON olarak üretir ve içeriğin özetinden güçlü bir ETag hesaplar.
+    """
+    body = JSONRenderer().render(AircraftDetailSerializer(aircraft).data)
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return {"body": body, "etag": etag, "version": version}
+
+
+def get_aircraft_detail(aircraft_id, version):
+    """
+    Önbellekteki detay yanıtını döndürür; yoksa veya yanıt sayacın başka bir
+    değerinde üretildiyse None.
+    """
+    entry = _cache().get(_key(aircraft_id))
+    if entry is None or entry.get("version") != version:
+        return None
+    return entry
+
+
+def cache_aircraft_detail(aircraft, version=None):
+    """
+    Uçağın detay yanıtını üretip önbelleğe yazar ve döndürür.
+    Sayaç uçak okunmadan önce okunmalıdır; arada yapılan yazma yanıtı eskitir.
+    """
+    if version is None:
+        version = current_version()
+    entry = build_entry(aircraft, version)
+    _cache().set(_key(aircraft.pk), entry)
+    return entry
+
+
+def evict_aircraft_detail(aircraft_ids):
+    """
+    Silinen veya parçaları değişen uçakların detay yanıtlarını önbellekten çıkarır.
+    Yazma ile aynı transaction içinde çağrılmalıdır: süreç içi önbellekte detay
+    sayacı yazmayla birlikte artırılır, kayıtlar commit'ten sonra çıkarılır;
+    böylece commit'ten önce okunup tekrar yazılan eski yanıt kalmaz.
+    """
+    keys = [_key(aircraft_id) for aircraft_id in aircraft_ids]
+    if not keys:
+        return
+    if not is_shared():
+        bump(AIRCRAFT_DETAIL)
+    transaction.on_commit(lambda: _cache().delete_many(keys))
+
+
+def clear_aircraft_detail_cache():
+    """
+    Toplu silme gibi hangi uçakların etkilendiğinin bilinmediği durumlarda tüm önbelleği temizler.
+    """
+    if not is_shared():
+        bump(AIRCRAFT_DETAIL)
+    transaction.on_commit(_cache().clear)
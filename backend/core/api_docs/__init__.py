@@ -0,0 +1,59 @@
+import copy
+from collections.abc import Mapping
+from django.utils.module_loading import import_string
+
+
+class LazySwaggerOverrides(Mapping):
+    """
+    swagger_auto_schema verisini ilk erişimde üreten sözlük.
+    drf_yasg bu veriyi sadece şema üretilirken okur; böylece büyük openapi.Schema
+    ağaçları modül import edilirken değil, şema ilk üretildiğinde oluşturulur.
+    """
+
+    def __init__(self, path, view_method):
+        self._path = path
+        self._view_method = view_method
+        self._data = None
+
+    def _resolve(self):
+        if self._data is None:
+            from drf_yasg.utils import swagger_auto_schema
+
+            # Dekoratörün @action eşleşmelerini görebilmesi için metodun
+            # adı ve mapping bilgisi taşınır
+            def placeholder(*args, **kwargs):
+                pass
+
+            placeholder.__name__ = self._view_method.__name__
+            if hasattr(self._view_method, "mapping"):
+                placeholder.mapping = self._view_method.mapping
+
+            swagger_auto_schema(**import_string(self._path)())(placeholder)
+            self._data = placeholder._swagger_auto_schema
+        return self._data
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._resolve(), memo)
+
+
+def lazy_swagger_auto_schema(path):
+    """
+    swagger_auto_schema'nın tembel (lazy) sürümü.
+    `path`, swagger_auto_schema argümanlarını döndüren fonksiyonun noktalı yoludur
+    (ör. "core.api_docs.part.list_schema").
+    """
+
+    def decorator(view_method):
+        view_method._swagger_auto_schema = LazySwaggerOverrides(path, view_method)
+        return view_method
+
+    return decorator
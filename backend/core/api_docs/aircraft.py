@@ -0,0 +1,198 @@
+from drf_yasg import openapi
+from core.api_docs.common import idempotency_key_parameter, sparse_fields_parameters
+from core.serializers.aircraft import (
+    AircraftSerializer,
+    AircraftDetailSerializer,
+    AircraftDisassembleSerializer,
+)
+
+
+def viewset_schema():
+    return dict(
+        tags=["Aircraft"],
+        operation_summary="Uçak İşlemleri",
+        operation_description="Uçak montajı ve detaylarını görüntüleme işlemleri. Sadece Montaj takımı üyeleri erişebilir.",
+    )
+
+
+def list_schema():
+    return dict(
+        operation_summary="Uçak Listesi",
+        operation_description="Tüm uçakların listesini getirir. Sadece Montaj takımı üyeleri erişebilir.",
+        responses={200: AircraftDetailSerializer(many=True)},
+        manual_parameters=[
+            openapi.Parameter(
+                "archived",
+                openapi.IN_QUERY,
+                description="true verilirse arşive taşınmış (eski) kayıtlar listelenir",
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="Sayfalama için limit değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            openapi.Parameter(
+                "offset",
+                openapi.IN_QUERY,
+                description="Sayfalama için offset değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            *sparse_fields_parameters(),
+        ],
+        tags=["Aircraft"],
+    )
+
+
+def retrieve_schema():
+    return dict(
+        operation_summary="Uçak Detaylarını Getir",
+        operation_description="Belirtilen ID'ye sahip uçağın detaylarını getirir. Sadece Montaj takımı üyeleri erişebilir.",
+        responses={200: AircraftDetailSerializer},
+        manual_parameters=sparse_fields_parameters(),
+        tags=["Aircraft"],
+    )
+
+
+def create_schema():
+    return dict(
+        operation_summary="Yeni Uçak Montajı",
+        operation_description="""
+Montaj takımı, parçaları birleştirerek yeni bir uçak oluşturur.
+
+Kurallar:
+- Parçalar, sadece tanımlı uçak modeli için üretilmiş olmalıdır
+- Aynı parça başka uçakta daha önce kullanılmamış olmalıdır
+- Parça seri kodları geçerli olmalıdır
+
+`Idempotency-Key` başlığı ile tekrar gönderilen istek yeniden işlenmez, ilk yanıt
+`Idempotent-Replayed: true` başlığı ile döner.
+        """,
+        manual_parameters=[idempotency_key_parameter()],
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=["serial_number", "model_id", "parts"],
+            properties={
+                "serial_number": openapi.Schema(
+                    type=openapi.TYPE_STRING, description="Uçak seri numarası"
+                ),
+                "model_id": openapi.Schema(
+                    type=openapi.TYPE_INTEGER, description="Uçak modeli ID"
+                ),
+                "parts": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_STRING),
+                    description="Bu uçak ile ilişkilendirilecek parçaların seri numaralarının listesi",
+                ),
+            },
+        ),
+        responses={201: AircraftSerializer},
+        tags=["Aircraft"],
+    )
+
+
+def destroy_schema():
+    return dict(
+        operation_summary="Uçak Sil",
+        operation_description="Belirtilen ID'ye sahip uçağı siler. Sadece Montaj takımı üyeleri erişebilir.",
+        responses={204: "Uçak başarıyla silindi"},
+        tags=["Aircraft"],
+    )
+
+
+def disassemble_schema():
+    return dict(
+        operation_summary="Toplu Uçak Sökümü",
+        operation_description="""
+Verilen uçakları söker ve parçalarını stoğa geri döndürür. Sadece Montaj takımı üyeleri erişebilir.
+
+- Uçaklar `ids` veya `serial_numbers` ile belirtilebilir (en fazla 1000)
+- Bulunamayan uçaklar `not_found` altında döner
+- `released_parts`: Stoğa dönen parça sayısı (parça tipine göre)
+        """,
+        request_body=AircraftDisassembleSerializer,
+        responses={
+            200: openapi.Response(
+                description="Uçaklar söküldü",
+                examples={
+                    "application/json": {
+                        "disassembled_count": 2,
+                        "disassembled": ["TB2-001", "TB2-002"],
+                        "released_parts": {"kanat": 2, "gövde": 2},
+                        "released_total": 4,
+                        "not_found": {"ids": [], "serial_numbers": ["TB2-999"]},
+                    }
+                },
+            ),
+            404: "Belirtilen uçaklar bulunamadı",
+        },
+        tags=["Aircraft"],
+    )
+
+
+def capacity_schema():
+    return dict(
+        operation_summary="Montaj Kapasitesi",
+        operation_description="""
+Her uçak modeli için stoktaki (uçakta kullanılmayan) parçalarla kaç tam uçak monte edilebileceğini döner. Sadece Montaj takımı üyeleri erişebilir.
+
+- `buildable`: Monte edilebilecek tam uçak sayısı
+- `bottleneck`: Kapasiteyi sınırlayan parça tipi
+- `parts`: Parça tipi başına gereken miktar, stok ve bu stokla yetecek uçak sayısı
+
+Hesap parça tablosu taranmadan stok sayaçlarından yapılır; sık sorgulanabilir.
+        """,
+        responses={
+            200: openapi.Response(
+                description="Montaj kapasitesi başarıyla getirildi",
+                examples={
+                    "application/json": {
+                        "total": 1,
+                        "data": [
+                            {
+                                "aircraft_model_id": 1,
+                                "aircraft_model_name": "TB2",
+                                "buildable": 3,
+                                "bottleneck": "kuyruk",
+                                "parts": [
+                                    {
+                                        "part_type_name": "kanat",
+                                        "required": 1,
+                                        "stock_count": 8,
+                                        "buildable": 8,
+                                    },
+                                    {
+                                        "part_type_name": "kuyruk",
+                                        "required": 1,
+                                        "stock_count": 3,
+                                        "buildable": 3,
+                                    },
+                                ],
+                            }
+                        ],
+                    }
+                },
+            )
+        },
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="Sayfalama için limit değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            openapi.Parameter(
+                "offset",
+                openapi.IN_QUERY,
+                description="Sayfalama için offset değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+        ],
+        tags=["Aircraft"],
+    )
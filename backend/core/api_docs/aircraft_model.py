@@ -0,0 +1,79 @@
+from drf_yasg import openapi
+
+
+def list_schema():
+    return dict(
+        operation_summary="Uçak Modellerini Listele",
+        operation_description="Sistemdeki tüm uçak modellerini listeler",
+        responses={
+            200: openapi.Response(
+                description="Başarılı yanıt",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "total": openapi.Schema(
+                            type=openapi.TYPE_INTEGER, description="Toplam kayıt sayısı"
+                        ),
+                        "data": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "id": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        description="Uçak modeli ID",
+                                    ),
+                                    "name": openapi.Schema(
+                                        type=openapi.TYPE_STRING,
+                                        description="Uçak modeli adı",
+                                    ),
+                                },
+                            ),
+                            description="Uçak modelleri listesi",
+                        ),
+                    },
+                ),
+            )
+        },
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="Sayfalama için limit değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            openapi.Parameter(
+                "offset",
+                openapi.IN_QUERY,
+                description="Sayfalama için offset değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+        ],
+        tags=["Aircraft Models"],
+    )
+
+
+def retrieve_schema():
+    return dict(
+        operation_summary="Uçak Model Detayı",
+        operation_description="Belirli bir uçak modelinin detaylarını gösterir",
+        responses={
+            200: openapi.Response(
+                description="Başarılı yanıt",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "id": openapi.Schema(
+                            type=openapi.TYPE_INTEGER, description="Uçak modeli ID"
+                        ),
+                        "name": openapi.Schema(
+                            type=openapi.TYPE_STRING, description="Uçak modeli adı"
+                        ),
+                    },
+                ),
+            )
+        },
+        tags=["Aircraft Models"],
+    )
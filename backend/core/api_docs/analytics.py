@@ -0,0 +1,183 @@
+from drf_yasg import openapi
+from core.serializers.analytics import (
+    AircraftAnalyticsQuerySerializer,
+    LeadTimeQuerySerializer,
+    PartAnalyticsQuerySerializer,
+    ProductionRateQuerySerializer,
+)
+
+
+def part_production_schema():
+    return dict(
+        operation_summary="Parça Üretim Analizi",
+        operation_description="""
+Verilen tarih aralığında takım ve parça tipi bazında dilim başına üretilen parça sayısını döner.
+Montaj takımı tüm takımları görür (`team_id` ile filtrelenebilir), diğer takımlar sadece kendi üretimlerini görür.
+
+- `interval`: `hour` veya `day` (varsayılan `day`); dilimler UTC'dir
+- Sonuçlar saatlik üretim sayaçlarından okunur; sorgu süresi parça sayısından bağımsızdır
+- Silinen (geri dönüşüme gönderilen) parçalar üretimden düşülmez
+        """,
+        query_serializer=PartAnalyticsQuerySerializer,
+        responses={
+            200: openapi.Response(
+                description="Üretim serisi",
+                examples={
+                    "application/json": {
+                        "start": "2026-10-01",
+                        "end": "2026-10-07",
+                        "interval": "day",
+                        "total": 12,
+                        "data": [
+                            {
+                                "period": "2026-10-01T00:00:00+00:00",
+                                "team_id": 2,
+                                "team_name": "Kanat Takımı",
+                                "part_type_id": 2,
+                                "part_type_name": "kanat",
+                                "count": 12,
+                            }
+                        ],
+                    }
+                },
+            ),
+            400: "Geçersiz tarih aralığı",
+        },
+        tags=["Analytics"],
+    )
+
+
+def aircraft_assembly_schema():
+    return dict(
+        operation_summary="Uçak Montaj Analizi",
+        operation_description="""
+Verilen tarih aralığında uçak modeli bazında dilim başına monte edilen uçak sayısını döner. Sadece Montaj takımı üyeleri erişebilir.
+
+- `interval`: `hour` veya `day` (varsayılan `day`); dilimler UTC'dir
+- Sonuçlar saatlik montaj sayaçlarından okunur; sorgu süresi uçak sayısından bağımsızdır
+- Sökülen uçaklar montaj sayısından düşülmez
+        """,
+        query_serializer=AircraftAnalyticsQuerySerializer,
+        responses={
+            200: openapi.Response(
+                description="Montaj serisi",
+                examples={
+                    "application/json": {
+                        "start": "2026-10-01",
+                        "end": "2026-10-07",
+                        "interval": "day",
+                        "total": 3,
+                        "data": [
+                            {
+                                "period": "2026-10-02T00:00:00+00:00",
+                                "aircraft_model_id": 1,
+                                "aircraft_model_name": "TB2",
+                                "count": 3,
+                            }
+                        ],
+                    }
+                },
+            ),
+            400: "Geçersiz tarih aralığı",
+        },
+        tags=["Analytics"],
+    )
+
+
+def lead_time_schema():
+    return dict(
+        operation_summary="Parça Teslim Süresi Analizi",
+        operation_description="""
+Verilen tarih aralığında monte edilen uçaklardaki parçalar için, parçanın üretiminden uçağın montajına kadar geçen sürenin (saat) dağılımını parça tipi ve uçak modeli bazında döner. Sadece Montaj takımı üyeleri erişebilir.
+
+- Her grup için adet, ortalama, en küçük/büyük, p50/p90/p95/p99 ve histogram döner
+- Histogram anahtarları dilimin üst sınırıdır (saat); son dilim açık uçludur
+- Arşivlenmiş uçakların parçaları da dahildir
+- Aralık en fazla `LEAD_TIME_MAX_DAYS` gün olabilir
+        """,
+        query_serializer=LeadTimeQuerySerializer,
+        responses={
+            200: openapi.Response(
+                description="Teslim süresi dağılımı",
+                examples={
+                    "application/json": {
+                        "start": "2026-10-01",
+                        "end": "2026-10-07",
+                        "total": 40,
+                        "data": [
+                            {
+                                "part_type_id": 2,
+                                "aircraft_model_id": 1,
+                                "count": 10,
+                                "mean_hours": 30.4,
+                                "min_hours": 2.1,
+                                "max_hours": 96.0,
+                                "p50_hours": 26.5,
+                                "p90_hours": 70.2,
+                                "p95_hours": 83.1,
+                                "p99_hours": 93.4,
+                                "histogram": {
+                                    "<= 1": 0,
+                                    "<= 4": 1,
+                                    "<= 8": 0,
+                                    "<= 24": 3,
+                                    "<= 48": 4,
+                                    "<= 72": 1,
+                                    "<= 168": 1,
+                                    "<= 336": 0,
+                                    "<= 720": 0,
+                                    "<= 2160": 0,
+                                    "> 2160": 0,
+                                },
+                                "part_type_name": "kanat",
+                                "aircraft_model_name": "TB2",
+                            }
+                        ],
+                    }
+                },
+            ),
+            400: "Geçersiz tarih aralığı",
+        },
+        tags=["Analytics"],
+    )
+
+
+def production_rate_schema():
+    return dict(
+        operation_summary="Personel Üretim Hızı Analizi",
+        operation_description="""
+Verilen tarih aralığında personel başına üretilen parça sayısını ve üretim hızını döner. Sadece Montaj takımı üyeleri erişebilir.
+
+- `mean_per_day`: aralıktaki günlük ortalama üretim
+- `current_rate`: son `window` günün günlük ortalaması
+- `peak_rate`: aralıktaki en yüksek `window` günlük ortalama
+- Günler UTC'dir; arşivlenmiş parçalar dahildir, silinen parçalar dahil değildir
+        """,
+        query_serializer=ProductionRateQuerySerializer,
+        responses={
+            200: openapi.Response(
+                description="Personel üretim hızları",
+                examples={
+                    "application/json": {
+                        "start": "2026-10-01",
+                        "end": "2026-10-14",
+                        "window": 7,
+                        "total": 42,
+                        "data": [
+                            {
+                                "personnel_id": 3,
+                                "total": 42,
+                                "active_days": 9,
+                                "mean_per_day": 3.0,
+                                "current_rate": 2.571,
+                                "peak_rate": 4.286,
+                                "full_name": "Ali Yılmaz",
+                            }
+                        ],
+                    }
+                },
+            ),
+            400: "Geçersiz tarih aralığı",
+        },
+        tags=["Analytics"],
+    )
@@ -0,0 +1,42 @@
+from drf_yasg import openapi
+from core.serializers.batch import BatchSerializer
+
+
+def batch_schema():
+    return dict(
+        operation_summary="Toplu İstek",
+        operation_description="""
+Birden fazla GET isteğini tek HTTP isteğinde çalıştırır. Kimlik doğrulaması bir kez yapılır ve
+alt isteklerle paylaşılır. Bağımsız alt istekler mümkünse eşzamanlı çalışır.
+
+- Yanıtlar istek sırasıyla döner; her birinde `status`, `headers` (ETag) ve `body` bulunur
+- Alt isteklere `If-None-Match` başlığı verilirse değişmeyen kaynaklar için `304` ve boş gövde döner
+- Bir alt isteğin hatası diğerlerini etkilemez
+        """,
+        request_body=BatchSerializer,
+        responses={
+            200: openapi.Response(
+                description="Alt isteklerin sonuçları",
+                examples={
+                    "application/json": {
+                        "responses": [
+                            {
+                                "id": "me",
+                                "status": 200,
+                                "headers": {},
+                                "body": {"id": 3, "username": "kanat"},
+                            },
+                            {
+                                "id": "parts",
+                                "status": 304,
+                                "headers": {"ETag": 'W/"91172f35"'},
+                                "body": None,
+                            },
+                        ]
+                    }
+                },
+            ),
+            400: "Geçersiz istek listesi",
+        },
+        tags=["Batch"],
+    )
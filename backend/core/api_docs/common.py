@@ -0,0 +1,30 @@
+from drf_yasg import openapi
+
+
+def idempotency_key_parameter():
+    return openapi.Parameter(
+        "Idempotency-Key",
+        openapi.IN_HEADER,
+        description="Verilirse aynı anahtarla tekrarlanan istek yeniden işlenmez, ilk yanıt döner",
+        type=openapi.TYPE_STRING,
+        required=False,
+    )
+
+
+def sparse_fields_parameters():
+    return [
+        openapi.Parameter(
+            "fields",
+            openapi.IN_QUERY,
+            description="Virgülle ayrılmış alan listesi; verilirse sadece bu alanlar döner (örn. id,serial_number,type)",
+            type=openapi.TYPE_STRING,
+            required=False,
+        ),
+        openapi.Parameter(
+            "expand",
+            openapi.IN_QUERY,
+            description="İç içe nesne olarak dönecek ilişkiler; verilmeyen ilişkiler ID olarak döner (boş verilirse tüm ilişkiler ID olur)",
+            type=openapi.TYPE_STRING,
+            required=False,
+        ),
+    ]
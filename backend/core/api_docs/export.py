@@ -0,0 +1,26 @@
+from drf_yasg import openapi
+from core.serializers.export import ExportQuerySerializer
+
+
+def export_schema():
+    return dict(
+        operation_summary="Veri Dışa Aktarma",
+        operation_description="""
+Veri setini sütunlu biçimde indirir. Sadece yöneticiler erişebilir.
+
+- Veri setleri: `parts`, `aircraft`, `personnel`, `teams`. Arşivlenmiş parça ve uçaklar `archived` sütunuyla dahildir
+- `file_format=parquet` (varsayılan): Tek Parquet dosyası (zstd); parça tipi, uçak modeli, takım ve sorumluluk sütunları sözlük kodludur
+- `file_format=arrow`: Arrow IPC akışı (`.arrows`)
+- `start` / `end`: Parça ve uçaklar için üretim/montaj günü aralığı (UTC, ikisi de dahil)
+- Yanıt, veri setinin tamamı belleğe alınmadan satır grubu satır grubu akıtılır
+
+Tarihe göre bölümlenmiş (`date=YYYY-MM-DD`) dosyalar için `export_data` komutu kullanılır.
+        """,
+        query_serializer=ExportQuerySerializer,
+        responses={
+            200: openapi.Response(description="Parquet dosyası veya Arrow IPC akışı"),
+            400: "Geçersiz biçim veya tarih aralığı",
+            404: openapi.Response(description="Veri seti bulunamadı"),
+        },
+        tags=["Export"],
+    )
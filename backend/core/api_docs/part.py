@@ -0,0 +1,270 @@
+from drf_yasg import openapi
+from core.api_docs.common import idempotency_key_parameter, sparse_fields_parameters
+
+
+def list_schema():
+    return dict(
+        operation_summary="Parçaları Listele",
+        operation_description="Tüm üretilmiş parçaların listesini döner. Montaj takımı tüm parçaları görebilirken, diğer takımlar sadece kendilerine ait parçaları görürler.",
+        responses={
+            200: openapi.Response(
+                description="Parçalar başarıyla listelendi",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "total": openapi.Schema(
+                            type=openapi.TYPE_INTEGER, description="Toplam kayıt sayısı"
+                        ),
+                        "data": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "id": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        description="Parça ID",
+                                    ),
+                                    "serial_number": openapi.Schema(
+                                        type=openapi.TYPE_STRING,
+                                        description="Parça seri numarası",
+                                    ),
+                                    "type": openapi.Schema(
+                                        type=openapi.TYPE_OBJECT,
+                                        properties={
+                                            "id": openapi.Schema(
+                                                type=openapi.TYPE_INTEGER,
+                                                description="Parça tipi ID",
+                                            ),
+                                            "name": openapi.Schema(
+                                                type=openapi.TYPE_STRING,
+                                                description="Parça tipi adı",
+                                            ),
+                                            "allowed_team": openapi.Schema(
+                                                type=openapi.TYPE_STRING,
+                                                description="Yetkili takım",
+                                            ),
+                                        },
+                                    ),
+                                    "aircraft_model": openapi.Schema(
+                                        type=openapi.TYPE_OBJECT,
+                                        properties={
+                                            "id": openapi.Schema(
+                                                type=openapi.TYPE_INTEGER,
+                                                description="Uçak modeli ID",
+                                            ),
+                                            "name": openapi.Schema(
+                                                type=openapi.TYPE_STRING,
+                                                description="Uçak modeli adı",
+                                            ),
+                                        },
+                                    ),
+                                    "used_in_aircraft": openapi.Schema(
+                                        type=openapi.TYPE_OBJECT,
+                                        properties={
+                                            "id": openapi.Schema(
+                                                type=openapi.TYPE_INTEGER,
+                                                description="Uçak ID",
+                                            ),
+                                            "serial_number": openapi.Schema(
+                                                type=openapi.TYPE_STRING,
+                                                description="Uçak seri numarası",
+                                            ),
+                                            "model": openapi.Schema(
+                                                type=openapi.TYPE_STRING,
+                                                description="Uçak modeli adı",
+                                            ),
+                                        },
+                                        nullable=True,
+                                    ),
+                                    "produced_by": openapi.Schema(
+                                        type=openapi.TYPE_OBJECT,
+                                        properties={
+                                            "id": openapi.Schema(
+                                                type=openapi.TYPE_INTEGER,
+                                                description="Personel ID",
+                                            ),
+                                            "full_name": openapi.Schema(
+                                                type=openapi.TYPE_STRING,
+                                                description="Personel adı",
+                                            ),
+                                            "team": openapi.Schema(
+                                                type=openapi.TYPE_STRING,
+                                                description="Personel takımı",
+                                            ),
+                                        },
+                                    ),
+                                    "created_at": openapi.Schema(
+                                        type=openapi.TYPE_STRING,
+                                        format="date-time",
+                                        description="Oluşturulma tarihi",
+                                    ),
+                                },
+                            ),
+                        ),
+                    },
+                ),
+            )
+        },
+        manual_parameters=[
+            openapi.Parameter(
+                "aircraft_id",
+                openapi.IN_QUERY,
+                description="Belirli bir uçağa ait parçaları filtrelemek için uçak ID'si",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            openapi.Parameter(
+                "archived",
+                openapi.IN_QUERY,
+                description="true verilirse arşive taşınmış (eski) kayıtlar listelenir",
+                type=openapi.TYPE_BOOLEAN,
+                required=False,
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="Sayfalama için limit değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            openapi.Parameter(
+                "offset",
+                openapi.IN_QUERY,
+                description="Sayfalama için offset değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            *sparse_fields_parameters(),
+        ],
+        tags=["Parts"],
+    )
+
+
+def retrieve_schema():
+    return dict(
+        operation_summary="Parça Detayı",
+        operation_description="Belirli bir parçanın detay bilgisini döner.",
+        manual_parameters=sparse_fields_parameters(),
+        tags=["Parts"],
+    )
+
+
+def create_schema():
+    return dict(
+        operation_summary="Parça Oluştur",
+        operation_description="""
+Takımınızın yetkili olduğu bir parça türü ile parça üretebilirsiniz.
+
+Eğer takımınız type ile eşleşmiyorsa **403 hatası** döner.
+
+`Idempotency-Key` başlığı ile tekrar gönderilen istek yeniden işlenmez, ilk yanıt
+`Idempotent-Replayed: true` başlığı ile döner. Aynı anahtar farklı bir gövde ile
+kullanılırsa **422 hatası** döner.
+        """,
+        manual_parameters=[idempotency_key_parameter()],
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=["serial_number", "type_id", "aircraft_model_id"],
+            properties={
+                "serial_number": openapi.Schema(
+                    type=openapi.TYPE_STRING, description="Parça seri numarası"
+                ),
+                "type_id": openapi.Schema(
+                    type=openapi.TYPE_INTEGER, description="Parça türü ID"
+                ),
+                "aircraft_model_id": openapi.Schema(
+                    type=openapi.TYPE_INTEGER, description="Uçak modeli ID"
+                ),
+            },
+        ),
+        tags=["Parts"],
+    )
+
+
+def destroy_schema():
+    return dict(
+        operation_summary="Parça Sil (Geri Dönüşüm)",
+        operation_description="Belirli bir parçayı veritabanından kalıcı olarak siler. Eğer parça bir uçakta kullanılıyorsa silinemez.",
+        tags=["Parts"],
+    )
+
+
+def stock_schema():
+    return dict(
+        operation_summary="Parça Stok Durumu",
+        operation_description="""Parçaların uçak modeline göre stok durumunu listeler. 
+        Her uçak modeli için:
+        - Parça tipi adı
+        - Toplam üretilen parça sayısı
+        - Kullanılan parça sayısı
+        - Stokta kalan parça sayısı
+        
+        bilgilerini içeren bir rapor oluşturur.
+        """,
+        responses={
+            200: openapi.Response(
+                description="Stok durumu başarıyla getirildi",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "total": openapi.Schema(
+                            type=openapi.TYPE_INTEGER, description="Toplam kayıt sayısı"
+                        ),
+                        "data": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "aircraft_model_name": openapi.Schema(
+                                        type=openapi.TYPE_STRING,
+                                        description="Uçak modeli adı",
+                                    ),
+                                    "parts": openapi.Schema(
+                                        type=openapi.TYPE_ARRAY,
+                                        items=openapi.Schema(
+                                            type=openapi.TYPE_OBJECT,
+                                            properties={
+                                                "part_type_name": openapi.Schema(
+                                                    type=openapi.TYPE_STRING,
+                                                    description="Parça tipi adı",
+                                                ),
+                                                "total_produced": openapi.Schema(
+                                                    type=openapi.TYPE_INTEGER,
+                                                    description="Toplam üretilen parça sayısı",
+                                                ),
+                                                "used_count": openapi.Schema(
+                                                    type=openapi.TYPE_INTEGER,
+                                                    description="Kullanılan parça sayısı",
+                                                ),
+                                                "stock_count": openapi.Schema(
+                                                    type=openapi.TYPE_INTEGER,
+                                                    description="Stokta kalan parça sayısı",
+                                                ),
+                                            },
+                                        ),
+                                    ),
+                                },
+                            ),
+                        ),
+                    },
+                ),
+            )
+        },
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="Sayfalama için limit değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            openapi.Parameter(
+                "offset",
+                openapi.IN_QUERY,
+                description="Sayfalama için offset değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+        ],
+        tags=["Parts"],
+    )
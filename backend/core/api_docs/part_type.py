@@ -0,0 +1,103 @@
+from drf_yasg import openapi
+
+
+def list_schema():
+    return dict(
+        operation_summary="Parça Tiplerini Listele",
+        operation_description="Sistemdeki tüm parça tiplerini listeler",
+        responses={
+            200: openapi.Response(
+                description="Başarılı yanıt",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "total": openapi.Schema(
+                            type=openapi.TYPE_INTEGER, description="Toplam kayıt sayısı"
+                        ),
+                        "data": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "id": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        description="Parça tipi ID",
+                                    ),
+                                    "name": openapi.Schema(
+                                        type=openapi.TYPE_STRING,
+                                        description="Parça tipi adı",
+                                    ),
+                                    "allowed_team": openapi.Schema(
+                                        type=openapi.TYPE_OBJECT,
+                                        properties={
+                                            "id": openapi.Schema(
+                                                type=openapi.TYPE_INTEGER,
+                                                description="Takım ID",
+                                            ),
+                                            "name": openapi.Schema(
+                                                type=openapi.TYPE_STRING,
+                                                description="Takım adı",
+                                            ),
+                                        },
+                                    ),
+                                },
+                            ),
+                            description="Parça tipleri listesi",
+                        ),
+                    },
+                ),
+            )
+        },
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="Sayfalama için limit değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+            openapi.Parameter(
+                "offset",
+                openapi.IN_QUERY,
+                description="Sayfalama için offset değeri",
+                type=openapi.TYPE_INTEGER,
+                required=False,
+            ),
+        ],
+        tags=["Part Types"],
+    )
+
+
+def retrieve_schema():
+    return dict(
+        operation_summary="Parça Tipi Detayı",
+        operation_description="Belirli bir parça tipinin detaylarını gösterir",
+        responses={
+            200: openapi.Response(
+                description="Başarılı yanıt",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "id": openapi.Schema(
+                            type=openapi.TYPE_INTEGER, description="Parça tipi ID"
+                        ),
+                        "name": openapi.Schema(
+                            type=openapi.TYPE_STRING, description="Parça tipi adı"
+                        ),
+                        "allowed_team": openapi.Schema(
+                            type=openapi.TYPE_OBJECT,
+                            properties={
+                                "id": openapi.Schema(
+                                    type=openapi.TYPE_INTEGER, description="Takım ID"
+                                ),
+                                "name": openapi.Schema(
+                                    type=openapi.TYPE_STRING, description="Takım adı"
+                                ),
+                            },
+                        ),
+                    },
+                ),
+            )
+        },
+        tags=["Part Types"],
+    )
@@ -0,0 +1,45 @@
+from drf_yasg import openapi
+from core.serializers.search import SearchQuerySerializer
+
+
+def search_schema():
+    return dict(
+        operation_summary="Genel Arama",
+        operation_description="""
+Parça ve uçak seri numaralarında ve personel adlarında bulanık (fuzzy) arama yapar. Sonuçlar tipten bağımsız olarak benzerliğe göre sıralanır.
+
+- Seri numarasının veya adın bir kısmı yazılabilir; büyük/küçük harf ve küçük yazım hataları tolere edilir
+- `score`: 0-1 arası benzerlik (sorgunun kaydın bir kısmıyla eşleşme oranı)
+- Montaj takımı tüm kayıtları, diğer takımlar sadece kendi parçalarını ve takım arkadaşlarını bulur
+- `SEARCH_MIN_LENGTH` karakterden kısa sorgular boş sonuç döner
+- Yanıt kısa süre (`SEARCH_CACHE_SECONDS`) tarayıcıda önbelleklenebilir
+        """,
+        query_serializer=SearchQuerySerializer,
+        responses={
+            200: openapi.Response(
+                description="Arama sonuçları",
+                examples={
+                    "application/json": {
+                        "query": "knt-00",
+                        "results": [
+                            {
+                                "type": "part",
+                                "id": 12,
+                                "text": "KNT-0012",
+                                "score": 1.0,
+                            },
+                            {
+                                "type": "aircraft",
+                                "id": 3,
+                                "text": "TB2-KNT-0001",
+                                "score": 0.857,
+                            },
+                        ],
+                    }
+                },
+            ),
+            400: "Geçersiz sorgu",
+            403: "Kullanıcı bir takıma ait değil",
+        },
+        tags=["Search"],
+    )
@@ -0,0 +1,207 @@
+from drf_yasg import openapi
+
+
+def db_pool_stats_schema():
+    return dict(
+        operation_summary="Bağlantı Havuzu İstatistikleri",
+        operation_description="""
+İsteği karşılayan worker sürecinin veritabanı bağlantı havuzu istatistiklerini döner:
+
+- `in_use`: Kullanımdaki bağlantı sayısı
+- `waiting`: Bağlantı bekleyen istek sayısı
+- `avg_acquire_ms`: Ortalama bağlantı alma gecikmesi
+
+> **Not:** Her worker kendi havuzunu tutar, değerler süreç başınadır.
+        """,
+        tags=["System"],
+        responses={
+            200: openapi.Response(
+                description="Havuz istatistikleri",
+                examples={
+                    "application/json": {
+                        "pid": 12,
+                        "pools": [
+                            {
+                                "alias": "default",
+                                "size": 4,
+                                "in_use": 1,
+                                "waiting": 0,
+                                "avg_acquire_ms": 0.12,
+                            }
+                        ],
+                    }
+                },
+            ),
+        },
+    )
+
+
+def logging_stats_schema():
+    return dict(
+        operation_summary="Loglama İstatistikleri",
+        operation_description="""
+İsteği karşılayan worker sürecinin log kuyruğu istatistiklerini döner:
+
+- `enqueued`: Kuyruğa bırakılan kayıt sayısı
+- `dropped`: Kuyruk dolu olduğu için düşürülen kayıt sayısı
+- `avg_emit_us` / `max_emit_us`: İstek thread'inde kayıt başına harcanan süre (mikrosaniye)
+- `sampled_out`: Örnekleme ile elenen kayıt sayısı
+        """,
+        tags=["System"],
+        responses={
+            200: openapi.Response(
+                description="Loglama istatistikleri",
+                examples={
+                    "application/json": {
+                        "pid": 12,
+                        "handlers": [
+                            {
+                                "name": "queue",
+                                "queue_depth": 0,
+                                "enqueued": 120,
+                                "dropped": 0,
+                                "avg_emit_us": 14.2,
+                                "max_emit_us": 95.1,
+                            }
+                        ],
+                        "sampled_out": 0,
+                    }
+                },
+            ),
+        },
+    )
+
+
+def admission_stats_schema():
+    return dict(
+        operation_summary="Kabul Kontrolü İstatistikleri",
+        operation_description="""
+İsteği karşılayan worker sürecinin öncelik sınıfı bazında kabul kontrolü istatistiklerini döner:
+
+- `in_flight` / `team_in_flight`: İşlenmekte olan istek sayısı (toplam ve takım bazında)
+- `queued` / `avg_wait_ms`: Kapasite dolu olduğu için bekleyen istek sayısı ve ortalama bekleme
+- `rejected_overload`: Kapasite dolu olduğu için 503 dönen istek sayısı
+- `rejected_team`: Takım sınırı aşıldığı için 429 dönen istek sayısı
+- `statement_timeouts`: statement_timeout ile iptal edilen istek sayısı
+        """,
+        tags=["System"],
+        responses={
+            200: openapi.Response(
+                description="Kabul kontrolü istatistikleri",
+                examples={
+                    "application/json": {
+                        "pid": 12,
+                        "enabled": True,
+                        "classes": [
+                            {
+                                "class": "bulk",
+                                "concurrency": 2,
+                                "team_concurrency": 1,
+                                "in_flight": 1,
+                                "team_in_flight": {"2": 1},
+                                "admitted": 40,
+                                "queued": 0,
+                                "avg_wait_ms": 0.0,
+                                "rejected_overload": 3,
+                                "rejected_team": 12,
+                                "statement_timeouts": 0,
+                            }
+                        ],
+                    }
+                },
+            ),
+        },
+    )
+
+
+def profile_list_schema():
+    return dict(
+        operation_summary="Profil Listesi",
+        operation_description="""
+Kaydedilmiş istek profillerini yeniden eskiye listeler.
+
+Bir isteğin profilini almak için:
+- `create_profiling_token` komutuyla üretilen token'ı `X-Profile` başlığında gönderin, veya
+- Süper kullanıcı olarak isteğe `?_profile=1` (istatistiksel) ya da `?_profile=cprofile` ekleyin.
+
+Profillenen isteğin yanıtında `X-Profile-Id` başlığı döner.
+
+> **Not:** Profiller isteği karşılayan sunucunun diskinde tutulur.
+        """,
+        tags=["System"],
+        responses={
+            200: openapi.Response(
+                description="Profil özetleri",
+                examples={
+                    "application/json": [
+                        {
+                            "id": "1760870400000-3f2a9c1e",
+                            "mode": "sampling",
+                            "method": "GET",
+                            "path": "/api/v1/parts/stock/?_profile=1",
+                            "status_code": 200,
+                            "duration_ms": 84.2,
+                            "created_at": "2025-10-19T10:40:00Z",
+                            "sql_count": 3,
+                            "sql_ms": 61.7,
+                        }
+                    ]
+                },
+            ),
+        },
+    )
+
+
+def profile_detail_schema():
+    return dict(
+        operation_summary="Profil Detayı",
+        operation_description="""
+Profilin özetini ve istek boyunca çalışan SQL sorgularının zaman çizelgesini döner.
+`start_ms` isteğin başlangıcına göre sorgunun başladığı anı gösterir.
+        """,
+        tags=["System"],
+        responses={
+            200: openapi.Response(
+                description="Profil detayı",
+                examples={
+                    "application/json": {
+                        "id": "1760870400000-3f2a9c1e",
+                        "mode": "sampling",
+                        "method": "GET",
+                        "path": "/api/v1/parts/stock/?_profile=1",
+                        "status_code": 200,
+                        "duration_ms": 84.2,
+                        "created_at": "2025-10-19T10:40:00Z",
+                        "sql_count": 1,
+                        "sql_ms": 61.7,
+                        "sql": [
+                            {
+                                "alias": "default",
+                                "start_ms": 12.4,
+                                "duration_ms": 61.7,
+                                "sql": "SELECT ...",
+                            }
+                        ],
+                    }
+                },
+            ),
+            404: openapi.Response(description="Profil bulunamadı"),
+        },
+    )
+
+
+def profile_download_schema():
+    return dict(
+        operation_summary="Profil Dosyasını İndir",
+        operation_description="""
+Profil dosyasını indirir:
+
+- `sampling`: Folded stacks (`.folded`); speedscope veya flamegraph.pl ile açılabilir
+- `cprofile`: pstats (`.prof`); snakeviz veya flameprof ile açılabilir
+        """,
+        tags=["System"],
+        responses={
+            200: openapi.Response(description="Profil dosyası"),
+            404: openapi.Response(description="Profil bulunamadı"),
+        },
+    )
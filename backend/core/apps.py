@@ -1,5 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def create_search_indexes(using, **kwargs):
+    from core.search import create_trigram_indexes
+
+    create_trigram_indexes(using)
+
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # Arama indeksleri PostgreSQL'e özgü olduğu için migration dışında oluşturulur
+        post_migrate.connect(create_search_indexes, sender=self)
@@ -0,0 +1,180 @@
+import contextvars
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.http import Http404, HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from core.middleware.admission import class_statement_timeout, is_query_canceled
+
+logger = logging.getLogger(__name__)
+
+BATCH_PATH_PREFIX = "/api/v1/"
+# Alt yanıtlardan batch yanıtına aktarılan başlıklar
+FORWARDED_HEADERS = ("ETag", "Cache-Control")
+# Alt isteğe geçirilmeyen üst istek başlıkları (gövde ve koşullu istek başlıkları)
+_SKIPPED_META = {
+    "CONTENT_LENGTH",
+    "CONTENT_TYPE",
+    "HTTP_IF_NONE_MATCH",
+    "HTTP_IF_MODIFIED_SINCE",
+    "HTTP_IDEMPOTENCY_KEY",
+    "wsgi.input",
+}
+
+
+def _error(item, status, message):
+    return {
+        "id": item.get("id"),
+        "status": status,
+        "headers": {},
+        "body": {"details": message},
+    }
+
+
+def build_subrequest(request, path, query, headers):
+    """
+    Batch isteğinin kimliğini ve META bilgilerini paylaşan bir GET alt isteği oluşturur.
+    DRF kimliği tekrar doğrulamaz; JWT çözümü ve kullanıcı sorgusu bir kez yapılır.
+    """
+    parent = request._request
+    subrequest = HttpRequest()
+    subrequest.method = "GET"
+    subrequest.path = subrequest.path_info = path
+    subrequest.META = {
+        key: value for key, value in parent.META.items() if key not in _SKIPPED_META
+    }
+    subrequest.META.update(
+        {"REQUEST_METHOD": "GET", "PATH_INFO": path, "QUERY_STRING": query}
+    )
+    for name, value in headers.items():
+        subrequest.META["HTTP_" + name.upper().replace("-", "_")] = value
+    subrequest.GET = QueryDict(query)
+    subrequest.user = request.user
+    subrequest.request_id = getattr(parent, "request_id", None)
+    # DRF Request bu alanlar varsa kimlik doğrulayıcıları çalıştırmaz
+    subrequest._force_auth_user = request.user
+    subrequest._force_auth_token = request.auth
+    return subrequest
+
+
+class _UnsupportedBody(Exception):
+    """
+    Alt yanıtın gövdesi toplu yanıta gömülemiyor (akış veya metin dışı içerik).
+    """
+
+
+def _body(response):
+    """
+    Alt yanıtın gövdesini toplu yanıta gömülecek biçimde döndürür.
+    DRF yanıtları render edilmeden verisiyle alınır; gövde bir kez serileştirilir.
+    """
+    if response.streaming:
+        # Akış üretilmeden kapatılır; dışa aktarma gibi yanıtlar toplu yanıta sığmaz
+        response.close()
+        raise _UnsupportedBody
+    if response.status_code == 304:
+        return None
+    if hasattr(response, "data"):
+        return response.data
+    if not response.content:
+        return None
+    content_type = response.get("Content-Type", "")
+    if content_type.startswith("application/json"):
+        return json.loads(response.content)
+    if content_type.startswith("text/"):
+        return response.content.decode(response.charset or "utf-8")
+    raise _UnsupportedBody
+
+
+def run_subrequest(request, item):
+    """
+    Tek bir alt isteği ilgili view üzerinde çalıştırır; durum kodu ve gövdeyi döndürür.
+    """
+    url = urlsplit(item["path"])
+    path = url.path
+    if not path.startswith(BATCH_PATH_PREFIX):
+        return _error(item, 400, "Sadece /api/v1/ altındaki endpoint'ler çağrılabilir.")
+    if path == request.path:
+        return _error(item, 400, "Toplu istek içinden toplu istek yapılamaz.")
+
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return _error(item, 404, "Endpoint bulunamadı.")
+
+    subrequest = build_subrequest(request, path, url.query, item.get("headers", {}))
+    subrequest.resolver_match = match
+    try:
+        response = match.func(subrequest, *match.args, **match.kwargs)
+        body = _body(response)
+    except _UnsupportedBody:
+        return _error(
+            item, 415, "Akış veya metin dışı yanıtlar toplu istekte döndürülemez."
+        )
+    except Http404:
+        return _error(item, 404, "Bulunamadı.")
+    except DatabaseError as exc:
+        if not is_query_canceled(exc):
+            logger.exception("Batch alt isteği başarısız: %s", item["path"])
+            return _error(item, 500, "Sunucu hatası.")
+        return _error(item, 503, "İstek zaman aşımına uğradı.")
+    except Exception:
+        logger.exception("Batch alt isteği başarısız: %s", item["path"])
+        return _error(item, 500, "Sunucu hatası.")
+
+    return {
+        "id": item.get("id"),
+        "status": response.status_code,
+        "headers": {
+            name: response[name]
+            for name in FORWARDED_HEADERS
+            if response.has_header(name)
+        },
+        "body": body,
+    }
+
+
+def _run_in_thread(request, item):
+    # Thread'in bağlantısı kabul kontrolü middleware'inin dışındadır; toplu isteğin
+    # sınıfına ait statement_timeout burada uygulanır
+    priority_class = getattr(request._request, "admission_class", None)
+    timeout = (
+        class_statement_timeout(priority_class) if priority_class else nullcontext()
+    )
+    try:
+        with timeout:
+            return run_subrequest(request, item)
+    finally:
+        # Thread'in bağlantısı havuza geri verilir (havuz yoksa kapatılır)
+        connections.close_all()
+
+
+def run_batch(request, items):
+    """
+    Alt istekleri çalıştırır ve sonuçları istek sırasıyla döndürür.
+
+    Alt istekler sadece okuma (GET) yaptığı için birbirinden bağımsızdır. Bağlantı
+    havuzu varsa BATCH_MAX_WORKERS thread ile eşzamanlı, yoksa isteğin kendi
+    bağlantısı üzerinde sırayla çalıştırılır.
+    """
+    workers = min(settings.BATCH_MAX_WORKERS, len(items))
+    pooled = all(
+        getattr(connections[alias], "pool", None) is not None for alias in connections
+    )
+    if workers <= 1 or not pooled:
+        return [run_subrequest(request, item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Okuma yönlendirmesi ve log bağlamı context variable'larda tutulur;
+        # her alt istek batch isteğinin bağlamının bir kopyasıyla çalışır
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run, _run_in_thread, request, item
+            )
+            for item in items
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,51 @@
+from django.db import connections
+
+
+def get_pool_stats(alias="default"):
+    """
+    Belirtilen veritabanı bağlantısının havuz istatistiklerini döndürür.
+    Havuz kullanılmıyorsa None döner.
+
+    İstatistikler süreç başınadır; her worker kendi havuzunu tutar.
+    """
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+    requests = stats.get("requests_num", 0)
+    queued = stats.get("requests_queued", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+
+    return {
+        "alias": alias,
+        "min_size": stats.get("pool_min", pool.min_size),
+        "max_size": stats.get("pool_max", pool.max_size),
+        "size": size,
+        "in_use": size - available,
+        "available": available,
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": requests,
+        "queued": queued,
+        "errors": stats.get("requests_errors", 0),
+        # Bağlantı alma gecikmesi: kuyrukta beklemeyen istekler ~0 ms sayılır
+        "avg_acquire_ms": round(wait_ms / requests, 3) if requests else 0.0,
+        "avg_queued_wait_ms": round(wait_ms / queued, 3) if queued else 0.0,
+        "connections_opened": stats.get("connections_num", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+        "returns_bad": stats.get("returns_bad", 0),
+    }
+
+
+def get_all_pool_stats():
+    """
+    Havuz kullanan tüm veritabanı bağlantılarının istatistiklerini döndürür.
+    """
+    result = []
+    for alias in connections:
+        stats = get_pool_stats(alias)
+        if stats is not None:
+            result.append(stats)
+    return result
@@ -0,0 +1,79 @@
+import logging
+import random
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+logger = logging.getLogger(__name__)
+
+# Geçerli isteğin okuma sorgularının replikaya yönlendirilip yönlendirilmeyeceği
+use_replica = ContextVar("use_replica", default=False)
+
+_local_cache_warned = False
+
+
+def replica_aliases():
+    """
+    Tanımlı okuma replikalarının takma adlarını döndürür.
+    Birincil veritabanına sabitleme bilgisi süreç içi bir önbellekte (LocMem, Dummy)
+    tutulursa diğer worker'lar bunu görmez ve kullanıcı az önce yazdığı kaydı
+    bulamayabilir; bu durumda replikalar kullanılmaz ve boş liste döner.
+    """
+    global _local_cache_warned
+
+    aliases = getattr(settings, "DB_REPLICA_ALIASES", [])
+    if aliases and isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache)):
+        if not _local_cache_warned:
+            _local_cache_warned = True
+            logger.warning(
+                "Okuma replikaları ortak bir önbellek gerektirir "
+                "(DJANGO_CACHE_BACKEND); tüm sorgular birincil veritabanına gidecek."
+            )
+        return []
+    return aliases
+
+
+def _pin_key(user_id):
+    return f"db:primary-pin:{user_id}"
+
+
+def pin_to_primary(user_id):
+    """
+    Yazma yapan kullanıcıyı kısa bir süre için birincil veritabanına sabitler.
+    Böylece kullanıcı, az önce oluşturduğu kaydı sonraki listede görür.
+    """
+    cache.set(_pin_key(user_id), True, settings.DB_PRIMARY_STICKY_SECONDS)
+
+
+def is_pinned_to_primary(user_id):
+    """
+    Kullanıcının birincil veritabanına sabitlenip sabitlenmediğini kontrol eder.
+    """
+    return bool(cache.get(_pin_key(user_id)))
+
+
+class ReplicaRouter:
+    """
+    Okuma sorgularını, istek replikaya uygun işaretlendiyse okuma replikalarından
+    birine; diğer tüm sorguları birincil veritabanına yönlendirir.
+    """
+
+    def db_for_read(self, model, **hints):
+        if use_replica.get():
+            aliases = replica_aliases()
+            if aliases:
+                return random.choice(aliases)
+        return "default"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replikalar birincil veritabanının kopyasıdır
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Migration'lar sadece birincil veritabanında çalışır
+        return db == "default"
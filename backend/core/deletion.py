@@ -0,0 +1,177 @@
+import traceback
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from core.aircraft_cache import clear_aircraft_detail_cache, evict_aircraft_detail
+from core.rollups import adjust_rollups
+from core.watermarks import AIRCRAFT, PARTS, bump
+from core.models import (
+    Aircraft,
+    AircraftAssemblyRollup,
+    AircraftModel,
+    ArchivedAircraft,
+    ArchivedPart,
+    ArchivedPartCount,
+    DeletionJob,
+    Part,
+    PartProductionRollup,
+    PartStockCount,
+    PartTeamSyncJob,
+    PartType,
+)
+
+
+def cascade_steps(target_type):
+    """
+    Hedef model ve hedefe bağlı kayıtların silinme sırasını döndürür.
+    Parçalar uçaklardan önce silinir; böylece uçak silinirken parçalar
+    için ayrıca SET NULL güncellemesi yapılmaz. Stok, üretim ve montaj sayaçları
+    ile takım eşitleme işleri ilk adımlarda silinir; silme sürerken hedefin montaj
+    kapasitesi 0 görünür ve eşitleme işi silinmekte olan parçalara dokunmaz.
+    """
+    if target_type == DeletionJob.TARGET_AIRCRAFT_MODEL:
+        return AircraftModel, [
+            (PartStockCount, "aircraft_model_id"),
+            (AircraftAssemblyRollup, "aircraft_model_id"),
+            (Part, "aircraft_model_id"),
+            (ArchivedPart, "aircraft_model_id"),
+            (ArchivedAircraft, "model_id"),
+            (ArchivedPartCount, "aircraft_model_id"),
+            (Aircraft, "model_id"),
+        ]
+    if target_type == DeletionJob.TARGET_PART_TYPE:
+        return PartType, [
+            (PartStockCount, "part_type_id"),
+            (PartProductionRollup, "part_type_id"),
+            (PartTeamSyncJob, "part_type_id"),
+            (Part, "type_id"),
+            (ArchivedPart, "type_id"),
+            (ArchivedPartCount, "part_type_id"),
+        ]
+    raise ValueError(f"Bilinmeyen silme hedefi: {target_type}")
+
+
+def exceeds_inline_limit(target_type, target_id, limit=None):
+    """
+    Hedefe bağlı kayıt sayısının satır içi silme sınırını aşıp aşmadığını döndürür.
+    Tüm kayıtlar sayılmaz, her adımda en fazla limit + 1 satır okunur.
+    """
+    limit = settings.CASCADE_DELETE_INLINE_LIMIT if limit is None else limit
+    _, steps = cascade_steps(target_type)
+    remaining = limit
+    for model, field in steps:
+        found = (
+            model.objects.filter(**{field: target_id})
+            .values("pk")[: remaining + 1]
+            .count()
+        )
+        remaining -= found
+        if remaining < 0:
+            return True
+    return False
+
+
+def enqueue_deletion(target_type, target, user=None):
+    """
+    Hedef için silme işi oluşturur. Aynı hedefe ait tamamlanmamış bir iş varsa onu döndürür.
+    """
+    active = DeletionJob.objects.filter(
+        target_type=target_type,
+        target_id=target.pk,
+        status__in=[DeletionJob.STATUS_PENDING, DeletionJob.STATUS_RUNNING],
+    ).first()
+    if active is not None:
+        return active
+    return DeletionJob.objects.create(
+        target_type=target_type,
+        target_id=target.pk,
+        target_repr=str(target)[:200],
+        created_by=user,
+    )
+
+
+def claim_next_job():
+    """
+    Sıradaki bekleyen işi veya takılı kalmış (uzun süredir ilerlemeyen) işi alır.
+    Birden fazla worker aynı işi almaz.
+    """
+    stale_before = timezone.now() - timedelta(
+        seconds=settings.DELETION_JOB_STALE_SECONDS
+    )
+    with transaction.atomic():
+        job = (
+            DeletionJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=DeletionJob.STATUS_PENDING)
+                | Q(status=DeletionJob.STATUS_RUNNING, updated_at__lt=stale_before)
+            )
+            .order_by("id")
+            .first()
+        )
+        if job is not None:
+            job.status = DeletionJob.STATUS_RUNNING
+            job.save(update_fields=["status", "updated_at"])
+    return job
+
+
+def run_job(job, batch_size=None, report=None):
+    """
+    Silme işini partiler halinde çalıştırır.
+    Her parti ve işin ilerlemesi aynı transaction'da kaydedilir; iş yarıda
+    kesilirse bir sonraki çalıştırmada kalan kayıtlardan devam edilir.
+    """
+    batch_size = batch_size or settings.CASCADE_DELETE_BATCH_SIZE
+    target_model, steps = cascade_steps(job.target_type)
+
+    if not job.estimated_total:
+        job.estimated_total = sum(
+            model.objects.filter(**{field: job.target_id}).count()
+            for model, field in steps
+        )
+    job.status = DeletionJob.STATUS_RUNNING
+    job.error = ""
+    job.save(update_fields=["estimated_total", "status", "error", "updated_at"])
+
+    try:
+        for model, field in steps:
+            label = model._meta.label
+            queryset = model.objects.filter(**{field: job.target_id}).order_by("pk")
+            while True:
+                ids = list(queryset.values_list("pk", flat=True)[:batch_size])
+                if not ids:
+                    break
+                with transaction.atomic():
+                    if model is Aircraft:
+                        evict_aircraft_detail(ids)
+                    # Üretim ve montaj sayaçları silinen kayıtlar kadar azaltılır
+                    adjust_rollups(model.objects.filter(pk__in=ids), sign=-1)
+                    _, deleted = model.objects.filter(pk__in=ids).delete()
+                    bump(AIRCRAFT, PARTS)
+                    for deleted_label, count in deleted.items():
+                        job.progress[deleted_label] = (
+                            job.progress.get(deleted_label, 0) + count
+                        )
+                        job.deleted_total += count
+                    job.save(update_fields=["progress", "deleted_total", "updated_at"])
+                if report is not None:
+                    report(job, label)
+
+        # Bağlı kayıtlar bittiğinde hedefin kendisi silinir
+        with transaction.atomic():
+            target_model.objects.filter(pk=job.target_id).delete()
+            bump(AIRCRAFT, PARTS)
+    except Exception:
+        job.status = DeletionJob.STATUS_FAILED
+        job.error = traceback.format_exc()
+        job.save(update_fields=["status", "error", "updated_at"])
+        raise
+
+    # Silinen parçaların ait olduğu uçakların detayları da değişmiştir
+    clear_aircraft_detail_cache()
+
+    job.status = DeletionJob.STATUS_DONE
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at", "updated_at"])
+    return job
@@ -0,0 +1,295 @@
+from itertools import islice
+from pathlib import Path
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from django.conf import settings
+from core.models import (
+    Aircraft,
+    AircraftModel,
+    ArchivedAircraft,
+    ArchivedPart,
+    Part,
+    PartType,
+    Personnel,
+    Team,
+)
+from core.rollups import date_range_bounds
+
+FORMAT_PARQUET = "parquet"
+FORMAT_ARROW = "arrow"
+# Dışa aktarma biçimi: (pyarrow dataset biçimi, dosya uzantısı)
+FORMATS = {FORMAT_PARQUET: ("parquet", ".parquet"), FORMAT_ARROW: ("ipc", ".arrow")}
+
+TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+# Veri setleri: kaynak tablolar (model, arşiv mi), tarih bölümlemesi yapılan alan ve
+# sütunlar (sütun adı, ORM alanı, Arrow tipi). Tip yerine sözlük adı verilen düşük
+# kardinaliteli sütunlar ilgili tablonun isimleriyle sözlük kodlanır (dictionary).
+EXPORTS = {
+    "parts": {
+        "sources": [(Part, False), (ArchivedPart, True)],
+        "date_field": "created_at",
+        "columns": [
+            ("id", "id", pa.int64()),
+            ("serial_number", "serial_number", pa.string()),
+            ("part_type", "type_id", "part_types"),
+            ("aircraft_model", "aircraft_model_id", "aircraft_models"),
+            ("team", "team_id", "teams"),
+            ("produced_by_id", "produced_by_id", pa.int64()),
+            ("used_in_aircraft_id", "used_in_aircraft_id", pa.int64()),
+            ("created_at", "created_at", TIMESTAMP),
+        ],
+    },
+    "aircraft": {
+        "sources": [(Aircraft, False), (ArchivedAircraft, True)],
+        "date_field": "assembled_at",
+        "columns": [
+            ("id", "id", pa.int64()),
+            ("serial_number", "serial_number", pa.string()),
+            ("aircraft_model", "model_id", "aircraft_models"),
+            ("assembled_by_id", "assembled_by_id", pa.int64()),
+            ("assembled_at", "assembled_at", TIMESTAMP),
+        ],
+    },
+    "personnel": {
+        "sources": [(Personnel, False)],
+        "date_field": None,
+        "columns": [
+            ("id", "id", pa.int64()),
+            ("username", "user__username", pa.string()),
+            ("full_name", "full_name", pa.string()),
+            ("team", "team_id", "teams"),
+        ],
+    },
+    "teams": {
+        "sources": [(Team, False)],
+        "date_field": None,
+        "columns": [
+            ("id", "id", pa.int64()),
+            ("name", "name", pa.string()),
+            ("responsibility", "responsibility", "responsibilities"),
+        ],
+    },
+}
+
+
+class Dictionary:
+    """
+    Kimlikleri sabit bir sözlüğün indekslerine çevirir. Sözlük her partide aynı
+    olduğu için Arrow IPC dosyaları da tek sözlükle yazılır.
+    """
+
+    def __init__(self, pairs):
+        pairs = list(pairs)
+        self.values = pa.array([str(name) for _, name in pairs], pa.string())
+        self.positions = {key: index for index, (key, _) in enumerate(pairs)}
+
+    def encode(self, keys):
+        indices = pa.array([self.positions.get(key) for key in keys], pa.int32())
+        return pa.DictionaryArray.from_arrays(indices, self.values)
+
+
+def load_dictionaries(using=None):
+    return {
+        "part_types": Dictionary(
+            PartType.objects.using(using).order_by("pk").values_list("pk", "name")
+        ),
+        "aircraft_models": Dictionary(
+            AircraftModel.objects.using(using).order_by("pk").values_list("pk", "name")
+        ),
+        "teams": Dictionary(
+            Team.objects.using(using).order_by("pk").values_list("pk", "name")
+        ),
+        "responsibilities": Dictionary(
+            (value, value) for value, _ in Team.RESPONSIBILITY_CHOICES
+        ),
+    }
+
+
+def _has_archive(spec):
+    return any(archived for _, archived in spec["sources"])
+
+
+def export_schema(name):
+    """
+    Veri setinin Arrow şemasını döndürür.
+    """
+    spec = EXPORTS[name]
+    fields = [
+        pa.field(
+            column,
+            pa.dictionary(pa.int32(), pa.string()) if isinstance(kind, str) else kind,
+        )
+        for column, _, kind in spec["columns"]
+    ]
+    if _has_archive(spec):
+        fields.append(pa.field("archived", pa.bool_()))
+    return pa.schema(fields)
+
+
+def dictionary_columns(name):
+    return [
+        column for column, _, kind in EXPORTS[name]["columns"] if isinstance(kind, str)
+    ]
+
+
+def record_batches(name, start=None, end=None, chunk_size=None, using=None):
+    """
+    Veri setini chunk_size satırlık Arrow partileri halinde üretir.
+
+    Satırlar ORM nesnesine çevrilmeden values_list().iterator() ile okunur
+    (PostgreSQL'de sunucu taraflı imleç); bellekte aynı anda tek parti bulunur.
+    start/end verilirse tarih alanı olan veri setleri bu günlerle (UTC, ikisi de
+    dahil) sınırlanır.
+    """
+    spec = EXPORTS[name]
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    schema = export_schema(name)
+    dictionaries = load_dictionaries(using)
+    fields = [field for _, field, _ in spec["columns"]]
+
+    date_filter = {}
+    if spec["date_field"] and start is not None:
+        date_filter[f"{spec['date_field']}__gte"] = date_range_bounds(start, start)[0]
+    if spec["date_field"] and end is not None:
+        date_filter[f"{spec['date_field']}__lt"] = date_range_bounds(end, end)[1]
+
+    for model, archived in spec["sources"]:
+        rows = (
+            model.objects.using(using)
+            .filter(**date_filter)
+            .order_by("pk")
+            .values_list(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            arrays = [
+                (
+                    dictionaries[kind].encode(values)
+                    if isinstance(kind, str)
+                    else pa.array(values, kind)
+                )
+                for (_, _, kind), values in zip(spec["columns"], zip(*chunk))
+            ]
+            if _has_archive(spec):
+                arrays.append(pa.array([archived] * len(chunk), pa.bool_()))
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _file_options(name, fmt):
+    if fmt != FORMAT_PARQUET:
+        return None
+    return ds.ParquetFileFormat().make_write_options(
+        compression=settings.EXPORT_PARQUET_COMPRESSION,
+        use_dictionary=dictionary_columns(name),
+    )
+
+
+def write_dataset(
+    name, directory, fmt=FORMAT_PARQUET, start=None, end=None, chunk_size=None
+):
+    """
+    Veri setini directory/name altına yazar ve yazılan satır sayısını döndürür.
+
+    Tarih alanı olan veri setleri UTC güne göre Hive biçiminde bölümlenir
+    (parts/date=2026-10-01/parts-0.parquet). Satırlar kimlik sırasıyla, dolayısıyla
+    büyük ölçüde tarih sırasıyla geldiği için aynı anda az sayıda dosya açıktır.
+    Yazılan günlerin eski dosyaları silinir, diğer günlere dokunulmaz.
+    """
+    spec = EXPORTS[name]
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    dataset_format, extension = FORMATS[fmt]
+    schema = export_schema(name)
+    batches = record_batches(name, start, end, chunk_size)
+    written = 0
+
+    partitioning = None
+    if spec["date_field"]:
+        partitioning = ds.partitioning(
+            pa.schema([("date", pa.date32())]), flavor="hive"
+        )
+        schema = schema.append(pa.field("date", pa.date32()))
+
+    def counted():
+        nonlocal written
+        for batch in batches:
+            written += batch.num_rows
+            if partitioning is not None:
+                batch = batch.append_column(
+                    "date", pc.cast(batch.column(spec["date_field"]), pa.date32())
+                )
+            yield batch
+
+    ds.write_dataset(
+        pa.RecordBatchReader.from_batches(schema, counted()),
+        Path(directory) / name,
+        format=dataset_format,
+        partitioning=partitioning,
+        basename_template=f"{name}-{{i}}{extension}",
+        file_options=_file_options(name, fmt),
+        max_rows_per_group=chunk_size,
+        existing_data_behavior="delete_matching",
+    )
+    return written
+
+
+class _ChunkSink:
+    """
+    Yazılan baytları biriktirip drain() ile teslim eden dosya benzeri nesne.
+    Yanıt gövdesi dosyaya yazılmadan parça parça akıtılır.
+    """
+
+    closed = False
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_export(name, fmt, start=None, end=None, chunk_size=None, using=None):
+    """
+    Veri setini tek bir Parquet dosyası veya Arrow IPC akışı olarak parça parça
+    üretir. Her parti yazıldıktan sonra oluşan baytlar hemen döndürülür; bellekte
+    tek parti ve tek satır grubu bulunur.
+    """
+    schema = export_schema(name)
+    sink = _ChunkSink()
+    if fmt == FORMAT_PARQUET:
+        writer = pq.ParquetWriter(
+            sink,
+            schema,
+            compression=settings.EXPORT_PARQUET_COMPRESSION,
+            use_dictionary=dictionary_columns(name),
+        )
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    with writer:
+        for batch in record_batches(name, start, end, chunk_size, using):
+            writer.write_batch(batch)
+            yield sink.drain()
+    yield sink.drain()
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import time
+from datetime import timedelta
+from functools import wraps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+from core.models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+# Tekrar oynatılan yanıtlarda dönen başlık
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyKeyInUse(APIException):
+    """
+    Aynı anahtarlı ilk istek beklenen süre içinde tamamlanmadı.
+    """
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = {
+        "details": "Bu Idempotency-Key ile gönderilen istek hâlâ işleniyor."
+    }
+
+
+class IdempotencyKeyMismatch(APIException):
+    """
+    Anahtar daha önce farklı bir istek için kullanıldı.
+    """
+
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = {
+        "details": "Bu Idempotency-Key farklı bir istek için kullanılmış."
+    }
+
+
+def request_fingerprint(request):
+    """
+    İsteğin metodu, yolu ve gövdesinden özet üretir.
+    Gövde anahtar sırasından bağımsız olarak karşılaştırılır.
+    """
+    body = json.dumps(
+        request.data, sort_keys=True, cls=DjangoJSONEncoder, ensure_ascii=False
+    )
+    raw = f"{request.method}\n{request.path}\n{body}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _lease_cutoff():
+    """
+    Bu zamandan önce ayrılıp hâlâ tamamlanmamış kayıtlar terk edilmiş sayılır.
+    """
+    return timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_LEASE_SECONDS)
+
+
+def _is_abandoned(record):
+    return record.status_code is None and record.created_at <= _lease_cutoff()
+
+
+def _claim(request, key, fingerprint):
+    """
+    Anahtarı bu istek adına ayırır. Anahtar başka bir istek tarafından
+    kullanılıyorsa None döndürür. Süresi dolmuş veya işleyen worker'ı ölmüş
+    (süresi geçmiş, tamamlanmamış) kayıt silinip yeniden ayrılır.
+    """
+    now = timezone.now()
+    fields = {
+        "endpoint": f"{request.method} {request.path}"[:255],
+        "fingerprint": fingerprint,
+        "expires_at": now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS),
+    }
+    IdempotencyKey.objects.filter(user=request.user, key=key).filter(
+        Q(expires_at__lte=now)
+        | Q(status_code__isnull=True, created_at__lte=_lease_cutoff())
+    ).delete()
+    try:
+        with transaction.atomic():
+            return IdempotencyKey.objects.create(user=request.user, key=key, **fields)
+    except IntegrityError:
+        return None
+
+
+def _wait_for_completion(request, key):
+    """
+    Aynı anahtarlı ilk isteğin tamamlanmasını bekler ve kaydını döndürür.
+    İlk istek hata ile sonuçlanıp kaydı silindiyse veya kayıt terk edildiyse None döner.
+    """
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+    while True:
+        record = IdempotencyKey.objects.filter(user=request.user, key=key).first()
+        if record is None or _is_abandoned(record):
+            return None
+        if record.status_code is not None:
+            return record
+        if time.monotonic() >= deadline:
+            raise IdempotencyKeyInUse()
+        time.sleep(settings.IDEMPOTENCY_POLL_INTERVAL)
+
+
+def _replay(record):
+    response = Response(record.response_body, status=record.status_code)
+    response[REPLAYED_HEADER] = "true"
+    return response
+
+
+def idempotent(view_method):
+    """
+    Yazma view metodunu Idempotency-Key başlığına duyarlı hale getirir.
+
+    - Başlık yoksa metot her zamanki gibi çalışır.
+    - Anahtar ilk kez geliyorsa metot çalışır ve yanıtı (5xx hariç) saklanır.
+    - Aynı anahtar ve aynı gövde ile tekrar gelirse metot çalıştırılmadan saklanan yanıt döner.
+    - İlk istek hâlâ işleniyorsa tamamlanması beklenir.
+    - Anahtar farklı bir gövde ile gelirse 422 döner.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > 255:
+            raise ValidationError(
+                {"details": "Idempotency-Key en fazla 255 karakter olabilir."}
+            )
+
+        fingerprint = request_fingerprint(request)
+        while True:
+            record = _claim(request, key, fingerprint)
+            if record is not None:
+                break
+            existing = _wait_for_completion(request, key)
+            if existing is None:
+                # İlk istek başarısız oldu veya terk edildi, anahtar tekrar ayrılmayı dener
+                continue
+            if existing.fingerprint != fingerprint:
+                raise IdempotencyKeyMismatch()
+            return _replay(existing)
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except Exception as exc:
+            try:
+                response = self.handle_exception(exc)
+            except Exception:
+                record.delete()
+                raise
+
+        # Süre aşılıp kayıt başka bir istek tarafından devralındıysa bu sorgular
+        # hiçbir satırı etkilemez
+        if response.status_code >= 500:
+            # Sunucu hatalarında istemcinin aynı anahtarla tekrar denemesine izin ver
+            record.delete()
+        else:
+            IdempotencyKey.objects.filter(pk=record.pk).update(
+                status_code=response.status_code, response_body=response.data
+            )
+        return response
+
+    return wrapper
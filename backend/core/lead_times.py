@@ -0,0 +1,263 @@
+import numpy as np
+from itertools import chain
+from django.conf import settings
+from django.db import connections, router
+from core.models import AircraftModel, Part, PartType, Personnel
+from core.rollups import date_range_bounds
+
+# Teslim süresi histogramının üst sınırları (saat); son dilim açık uçludur
+LEAD_TIME_BUCKETS_HOURS = (1, 4, 8, 24, 48, 72, 168, 336, 720, 2160)
+PERCENTILES = (50, 90, 95, 99)
+# Bu değerin altındaki tamsayı anahtarlar sıralamasız (bincount ile) gruplanır
+DENSE_KEY_LIMIT = 1 << 24
+
+# (parça tablosu, uçak tablosu); arşivlenmiş parçalar arşiv uçaklarına bağlıdır
+PART_TABLES = (
+    ("core_part", "core_aircraft"),
+    ("core_archivedpart", "core_archivedaircraft"),
+)
+
+
+def _epoch(connection, expression):
+    """
+    Zaman ifadesini veritabanında epoch saniyesine (double) çeviren SQL parçası.
+    """
+    if connection.vendor == "postgresql":
+        return f"CAST(EXTRACT(EPOCH FROM {expression}) AS DOUBLE PRECISION)"
+    return f"((julianday({expression}) - 2440587.5) * 86400.0)"
+
+
+def rows_to_columns(rows, dtypes):
+    """
+    İmleçten gelen bir parti tuple'ı sütun başına bir NumPy dizisine çevirir.
+    Sütunların NULL içermemesi gerekir.
+    """
+    block = np.fromiter(
+        chain.from_iterable(rows), dtype=np.float64, count=len(rows) * len(dtypes)
+    ).reshape(len(rows), len(dtypes))
+    return [block[:, index].astype(dtype) for index, dtype in enumerate(dtypes)]
+
+
+def fetch_columns(connection, sql, params, dtypes, chunk_size=None):
+    """
+    Sorgu sonucunu parça parça okuyup sütun başına bir NumPy dizisi döndürür.
+
+    Satırlar ORM nesnesine çevrilmez; sunucu taraflı imleçten (PostgreSQL'de named
+    cursor) chunk_size'lık partiler halinde alınır ve her parti tek seferde sayısal
+    diziye dönüştürülür. Bellekte sadece sıkıştırılmış sütunlar birikir.
+    """
+    chunk_size = chunk_size or settings.LEAD_TIME_CHUNK_SIZE
+    chunks = [[] for _ in dtypes]
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for index, column in enumerate(rows_to_columns(rows, dtypes)):
+                chunks[index].append(column)
+    return [
+        np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+        for parts, dtype in zip(chunks, dtypes)
+    ]
+
+
+def _concat(column_sets):
+    return [np.concatenate(columns) for columns in zip(*column_sets)]
+
+
+def load_lead_times(start, end, chunk_size=None):
+    """
+    Verilen tarih aralığında monte edilen uçaklardaki parçaların parça tipi, uçak
+    modeli ve üretimden montaja kadar geçen süresini (saat) sütunlar halinde döndürür.
+    """
+    connection = connections[router.db_for_read(Part)]
+    lower, upper = date_range_bounds(start, end)
+    column_sets = []
+    for part_table, aircraft_table in PART_TABLES:
+        sql = f"""
+            SELECT
+                p.type_id,
+                p.aircraft_model_id,
+                ({_epoch(connection, "a.assembled_at")}
+                 - {_epoch(connection, "p.created_at")}) / 3600.0
+            FROM {part_table} p
+            JOIN {aircraft_table} a ON a.id = p.used_in_aircraft_id
+            WHERE a.assembled_at >= %s AND a.assembled_at < %s
+        """
+        column_sets.append(
+            fetch_columns(
+                connection,
+                sql,
+                [lower, upper],
+                (np.int32, np.int32, np.float32),
+                chunk_size,
+            )
+        )
+    return _concat(column_sets)
+
+
+def load_production(start, end, chunk_size=None):
+    """
+    Verilen tarih aralığında üretilen parçaların üreten personelini ve üretim
+    zamanını (epoch saniyesi) sütunlar halinde döndürür.
+    """
+    connection = connections[router.db_for_read(Part)]
+    lower, upper = date_range_bounds(start, end)
+    column_sets = []
+    for part_table, _ in PART_TABLES:
+        sql = f"""
+            SELECT p.produced_by_id, {_epoch(connection, "p.created_at")}
+            FROM {part_table} p
+            WHERE p.produced_by_id IS NOT NULL
+              AND p.created_at >= %s AND p.created_at < %s
+        """
+        column_sets.append(
+            fetch_columns(
+                connection, sql, [lower, upper], (np.int64, np.float64), chunk_size
+            )
+        )
+    return _concat(column_sets)
+
+
+def dense_groups(keys):
+    """
+    Negatif olmayan tamsayı anahtarlarına 0'dan başlayan grup numarası verir.
+    (grup anahtarları, satır başına grup numarası) döndürür.
+
+    Birincil anahtar gibi küçük değerlerde numaralama sıralama yapmadan bincount ile
+    O(n) yapılır; büyük anahtarlarda np.unique'e düşülür.
+    """
+    if keys.max() >= DENSE_KEY_LIMIT:
+        return np.unique(keys, return_inverse=True)
+    present = np.bincount(keys) > 0
+    lookup = np.cumsum(present) - 1
+    return np.flatnonzero(present), lookup[keys]
+
+
+def lead_time_stats(type_ids, model_ids, hours, percentiles=PERCENTILES):
+    """
+    Parça tipi ve uçak modeli grubuna göre teslim süresi dağılımını hesaplar:
+    adet, ortalama, en küçük/büyük, yüzdelikler ve histogram.
+    """
+    if not len(hours):
+        return []
+
+    width = int(model_ids.max()) + 1
+    group_keys, groups = dense_groups(type_ids.astype(np.int64) * width + model_ids)
+    counts = np.bincount(groups, minlength=len(group_keys))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    # Satırlar sadece gruba göre sıralanır; küçük tamsayılar radix sort ile
+    # sıralandığı için süreye göre tam sıralamadan belirgin hızlıdır
+    if len(group_keys) <= np.iinfo(np.uint16).max:
+        groups = groups.astype(np.uint16)
+    order = np.argsort(groups, kind="stable")
+    values = hours[order].astype(np.float64)
+
+    sums = np.add.reduceat(values, starts)
+    minimums = np.minimum.reduceat(values, starts)
+    maximums = np.maximum.reduceat(values, starts)
+    # Döngü satırlar değil gruplar (parça tipi x model) üzerindedir; np.percentile
+    # grubu sıralamak yerine kısmi sıralama (partition) kullanır
+    quantiles = np.array(
+        [
+            np.percentile(values[start : start + count], percentiles)
+            for start, count in zip(starts, counts)
+        ]
+    )
+
+    edges = np.asarray(LEAD_TIME_BUCKETS_HOURS, dtype=np.float64)
+    bins = np.searchsorted(edges, values, side="left")
+    histogram = np.bincount(
+        groups[order].astype(np.int64) * (len(edges) + 1) + bins,
+        minlength=len(group_keys) * (len(edges) + 1),
+    ).reshape(len(group_keys), len(edges) + 1)
+
+    labels = [f"<= {int(edge)}" for edge in edges] + [f"> {int(edges[-1])}"]
+    return [
+        {
+            "part_type_id": int(key // width),
+            "aircraft_model_id": int(key % width),
+            "count": int(counts[index]),
+            "mean_hours": round(float(sums[index] / counts[index]), 2),
+            "min_hours": round(float(minimums[index]), 2),
+            "max_hours": round(float(maximums[index]), 2),
+            **{
+                f"p{percentile}_hours": round(float(quantiles[index, column]), 2)
+                for column, percentile in enumerate(percentiles)
+            },
+            "histogram": dict(zip(labels, histogram[index].tolist())),
+        }
+        for index, key in enumerate(group_keys)
+    ]
+
+
+def production_rates(personnel_ids, created, start, end, window_days):
+    """
+    Personel başına günlük üretim sayılarını ve window_days günlük kayan ortalama
+    üretim hızını hesaplar.
+    """
+    if not len(created):
+        return []
+
+    lower, upper = date_range_bounds(start, end)
+    days = (upper - lower).days
+    day_index = ((created - lower.timestamp()) // 86400).astype(np.int64)
+    day_index = np.clip(day_index, 0, days - 1)
+
+    people, inverse = dense_groups(personnel_ids)
+    daily = np.bincount(
+        inverse * days + day_index, minlength=len(people) * days
+    ).reshape(len(people), days)
+
+    window = min(window_days, days)
+    cumulative = np.concatenate(
+        [np.zeros((len(people), 1), dtype=np.int64), np.cumsum(daily, axis=1)], axis=1
+    )
+    rolling = (cumulative[:, window:] - cumulative[:, :-window]) / window
+
+    totals = daily.sum(axis=1)
+    active_days = (daily > 0).sum(axis=1)
+    return [
+        {
+            "personnel_id": int(person),
+            "total": int(totals[index]),
+            "active_days": int(active_days[index]),
+            "mean_per_day": round(float(totals[index] / days), 3),
+            "current_rate": round(float(rolling[index, -1]), 3),
+            "peak_rate": round(float(rolling[index].max()), 3),
+        }
+        for index, person in enumerate(people)
+    ]
+
+
+def _with_names(rows, model, id_field, name_field, label):
+    names = dict(
+        model.objects.filter(pk__in={row[id_field] for row in rows}).values_list(
+            "pk", name_field
+        )
+    )
+    for row in rows:
+        row[label] = names.get(row[id_field])
+    return rows
+
+
+def lead_time_report(start, end, chunk_size=None):
+    """
+    Tarih aralığı için parça tipi ve uçak modeli bazında teslim süresi dağılımını döndürür.
+    """
+    rows = lead_time_stats(*load_lead_times(start, end, chunk_size))
+    _with_names(rows, PartType, "part_type_id", "name", "part_type_name")
+    _with_names(rows, AircraftModel, "aircraft_model_id", "name", "aircraft_model_name")
+    return rows
+
+
+def production_rate_report(start, end, window_days, chunk_size=None):
+    """
+    Tarih aralığı için personel başına üretim hızlarını döndürür.
+    """
+    personnel_ids, created = load_production(start, end, chunk_size)
+    rows = production_rates(personnel_ids, created, start, end, window_days)
+    _with_names(rows, Personnel, "personnel_id", "full_name", "full_name")
+    return sorted(rows, key=lambda row: row["total"], reverse=True)
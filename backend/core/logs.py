@@ -0,0 +1,291 @@
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+from django.utils.functional import SimpleLazyObject, empty
+
+# İsteğe ait log bağlamı: {"request_id": ..., "request": HttpRequest}
+log_context = ContextVar("log_context", default=None)
+
+# İstatistikleri okunabilmesi için oluşturulan kuyruk handler'ları ve filtreleri
+_handlers = weakref.WeakSet()
+_sampling_filters = weakref.WeakSet()
+
+
+def _request_user(request):
+    """
+    İsteğin kullanıcısını, ek sorgu çalıştırmadan döndürür.
+    Henüz çözülmemiş (lazy) oturum kullanıcısı değerlendirilmez.
+    """
+    user = request.__dict__.get("user")
+    if isinstance(user, SimpleLazyObject):
+        if user._wrapped is empty:
+            return None
+        user = user._wrapped
+    if user is None or not user.is_authenticated:
+        return None
+    return user
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Log kayıtlarına request id, kullanıcı ve takım bilgisini ekler.
+    Personel bilgisi sadece istek sırasında zaten yüklendiyse eklenir,
+    loglama yüzünden veritabanı sorgusu yapılmaz.
+    """
+
+    def filter(self, record):
+        context = log_context.get()
+        record.request_id = None
+        record.user_id = None
+        record.team_id = None
+
+        if context is not None:
+            record.request_id = context["request_id"]
+            user = _request_user(context["request"])
+            if user is not None:
+                record.user_id = user.pk
+                personnel = user._state.fields_cache.get("personnel")
+                if personnel is not None:
+                    record.team_id = personnel.team_id
+
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Logger bazında örnekleme yapar. Oranlar logger adı önekine göre verilir
+    (ör. {"django.server": 0.1} veya "django.server=0.1,core.views=0.5");
+    en uzun eşleşen önek kullanılır. WARNING ve üzeri kayıtlar her zaman geçer.
+    """
+
+    def __init__(self, rates=None):
+        super().__init__()
+        if isinstance(rates, str):
+            rates = dict(
+                (name.strip(), rate)
+                for name, _, rate in (
+                    item.partition("=") for item in rates.split(",") if item.strip()
+                )
+            )
+        self.rates = dict(rates or {})
+        self.sampled_out = 0
+        self._cache = {}
+        _sampling_filters.add(self)
+
+    def _rate_for(self, name):
+        rate = self._cache.get(name)
+        if rate is None:
+            rate = 1.0
+            best = -1
+            for prefix, value in self.rates.items():
+                if (name == prefix or name.startswith(prefix + ".")) and len(
+                    prefix
+                ) > best:
+                    rate, best = float(value), len(prefix)
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+
+        rate = self._rate_for(record.name)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+
+        self.sampled_out += 1
+        return False
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Log kayıtlarını tek satırlık JSON olarak biçimlendirir.
+    """
+
+    def format(self, record):
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "process": record.process,
+            "thread": record.thread,
+            "request_id": getattr(record, "request_id", None),
+            "user_id": getattr(record, "user_id", None),
+            "team_id": getattr(record, "team_id", None),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    Log kayıtlarını sınırlı bir kuyruğa bırakan ve yazma işini arka plandaki
+    bir thread'e (QueueListener) devreden handler.
+
+    İstek thread'i sadece kaydı hazırlayıp kuyruğa koyar; kuyruk doluysa kayıt
+    bekletilmeden düşürülür ve sayılır. Dosya JSON formatında, boyut
+    (max_bytes) veya zaman (when) bazlı döndürülerek yazılır.
+    """
+
+    def __init__(
+        self,
+        filename=None,
+        max_bytes=10 * 1024 * 1024,
+        backup_count=5,
+        when=None,
+        interval=1,
+        console=True,
+        console_format="{levelname} {asctime} {module} {process:d} {thread:d} {message}",
+        queue_size=10000,
+    ):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.when = when
+        self.interval = interval
+        self.console = console
+        self.console_format = console_format
+        self.queue_size = queue_size
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.emit_ns_total = 0
+        self.emit_ns_max = 0
+
+        self._listener = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        _handlers.add(self)
+
+    def _build_targets(self):
+        targets = []
+        if self.console:
+            console = logging.StreamHandler()
+            console.setFormatter(logging.Formatter(self.console_format, style="{"))
+            targets.append(console)
+        if self.filename:
+            if self.when:
+                file_handler = TimedRotatingFileHandler(
+                    self.filename,
+                    when=self.when,
+                    interval=self.interval,
+                    backupCount=self.backup_count,
+                    encoding="utf-8",
+                    delay=True,
+                )
+            else:
+                file_handler = RotatingFileHandler(
+                    self.filename,
+                    maxBytes=self.max_bytes,
+                    backupCount=self.backup_count,
+                    encoding="utf-8",
+                    delay=True,
+                )
+            file_handler.setFormatter(JsonFormatter())
+            targets.append(file_handler)
+        return targets
+
+    def _ensure_listener(self):
+        """
+        Arka plan yazıcı thread'ini süreç başına bir kez başlatır.
+        Fork edilen worker'larda (ör. gunicorn --preload) thread yeniden kurulur.
+        """
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._start_lock:
+            if self._pid == pid:
+                return
+            # Fork öncesi kuyrukta kalan kayıtlar ana sürece aittir
+            self.queue = queue.Queue(maxsize=self.queue_size)
+            self._listener = QueueListener(
+                self.queue, *self._build_targets(), respect_handler_level=True
+            )
+            self._listener.start()
+            self._pid = pid
+
+    def prepare(self, record):
+        # Mesajı ve hata bilgisini metne çevir, yapısal alanları koru
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def emit(self, record):
+        start = time.perf_counter_ns()
+        try:
+            self._ensure_listener()
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+        elapsed = time.perf_counter_ns() - start
+        self.emit_ns_total += elapsed
+        if elapsed > self.emit_ns_max:
+            self.emit_ns_max = elapsed
+
+    def close(self):
+        if self._listener is not None and self._pid == os.getpid():
+            # Kuyrukta kalan kayıtlar yazıldıktan sonra thread durur
+            self._listener.stop()
+            for target in self._listener.handlers:
+                target.close()
+            self._listener = None
+            self._pid = None
+        super().close()
+
+    def get_stats(self):
+        return {
+            "name": self.get_name(),
+            "filename": self.filename,
+            "queue_size": self.queue_size,
+            "queue_depth": self.queue.qsize(),
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "avg_emit_us": (
+                round(self.emit_ns_total / self.enqueued / 1000, 3)
+                if self.enqueued
+                else 0.0
+            ),
+            "max_emit_us": round(self.emit_ns_max / 1000, 3),
+        }
+
+
+def get_logging_stats():
+    """
+    Bu süreçteki kuyruk handler'larının ve örnekleme filtrelerinin istatistiklerini döndürür.
+    """
+    return {
+        "handlers": [handler.get_stats() for handler in _handlers],
+        "sampled_out": sum(f.sampled_out for f in _sampling_filters),
+    }
@@ -0,0 +1,171 @@
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from core.aircraft_cache import evict_aircraft_detail
+from core.watermarks import AIRCRAFT, PARTS, bump
+from core.models import (
+    Aircraft,
+    Part,
+    ArchivedAircraft,
+    ArchivedPart,
+    ArchivedPartCount,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Belirtilen süreden önce monte edilmiş uçakları ve kullanılan parçalarını "
+        "arşiv tablolarına taşır. Boştaki (stoktaki) parçalara dokunulmaz."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.ARCHIVE_AFTER_DAYS,
+            help="Bu kadar günden eski uçaklar arşivlenir",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Tek transaction'da arşivlenecek uçak sayısı",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Hiçbir şey taşımadan arşivlenecek kayıt sayısını gösterir",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+        queryset = Aircraft.objects.filter(assembled_at__lt=cutoff).order_by("id")
+
+        if options["dry_run"]:
+            aircraft_count = queryset.count()
+            part_count = Part.objects.filter(
+                used_in_aircraft__assembled_at__lt=cutoff
+            ).count()
+            self.stdout.write(
+                f"{cutoff:%Y-%m-%d} öncesi {aircraft_count} uçak ve "
+                f"{part_count} parça arşivlenecek."
+            )
+            return
+
+        total_aircraft = total_parts = 0
+        skipped = []
+        last_id = 0
+        while True:
+            aircraft_ids = list(
+                queryset.filter(id__gt=last_id).values_list("id", flat=True)[
+                    : options["batch_size"]
+                ]
+            )
+            if not aircraft_ids:
+                break
+            last_id = aircraft_ids[-1]
+
+            archived_ids, part_count = self.archive_batch(aircraft_ids)
+            skipped.extend(sorted(set(aircraft_ids) - set(archived_ids)))
+            total_parts += part_count
+            total_aircraft += len(archived_ids)
+            self.stdout.write(
+                f"{total_aircraft} uçak, {total_parts} parça arşivlendi..."
+            )
+
+        if skipped:
+            self.stderr.write(
+                self.style.WARNING(
+                    f"Seri numarası arşivde zaten bulunan {len(skipped)} uçak "
+                    f"atlandı (ID: {', '.join(map(str, skipped))})."
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Arşivleme tamamlandı: {total_aircraft} uçak, {total_parts} parça."
+            )
+        )
+
+    def colliding_aircraft_ids(self, aircraft_ids):
+        """
+        Kendisinin veya parçalarından birinin seri numarası arşiv tablolarında
+        zaten bulunan uçakların kimliklerini döndürür. Bu uçaklar taşınırsa
+        arşivdeki benzersizlik kısıtı tüm partiyi geri aldırır.
+        """
+        colliding = set(
+            Aircraft.objects.filter(
+                id__in=aircraft_ids,
+                serial_number__in=ArchivedAircraft.objects.values("serial_number"),
+            ).values_list("id", flat=True)
+        )
+        colliding.update(
+            Part.objects.filter(
+                used_in_aircraft_id__in=aircraft_ids,
+                serial_number__in=ArchivedPart.objects.values("serial_number"),
+            ).values_list("used_in_aircraft_id", flat=True)
+        )
+        return colliding
+
+    @transaction.atomic
+    def archive_batch(self, aircraft_ids):
+        """
+        Bir grup uçağı ve parçalarını tek transaction'da arşive taşır.
+        Seri numarası arşivde zaten bulunan uçaklar atlanır.
+        Taşınan uçakların kimliklerini ve parça sayısını döndürür.
+        """
+        aircraft_ids = list(
+            Aircraft.objects.select_for_update()
+            .filter(id__in=aircraft_ids)
+            .values_list("id", flat=True)
+        )
+        colliding = self.colliding_aircraft_ids(aircraft_ids)
+        aircraft_ids = [pk for pk in aircraft_ids if pk not in colliding]
+        if not aircraft_ids:
+            return [], 0
+
+        aircraft_rows = Aircraft.objects.filter(id__in=aircraft_ids).values(
+            "id", "serial_number", "model_id", "assembled_by_id", "assembled_at"
+        )
+        ArchivedAircraft.objects.bulk_create(
+            [ArchivedAircraft(**row) for row in aircraft_rows]
+        )
+
+        parts = Part.objects.filter(used_in_aircraft_id__in=aircraft_ids)
+        part_rows = list(
+            parts.values(
+                "id",
+                "serial_number",
+                "type_id",
+                "aircraft_model_id",
+                "produced_by_id",
+                "used_in_aircraft_id",
+                "created_at",
+                "team_id",
+            )
+        )
+        ArchivedPart.objects.bulk_create([ArchivedPart(**row) for row in part_rows])
+
+        # Stok raporunun kullandığı arşiv sayaçlarını güncelle
+        counts = Counter(
+            (row["aircraft_model_id"], row["type_id"]) for row in part_rows
+        )
+        for (aircraft_model_id, part_type_id), count in counts.items():
+            updated = ArchivedPartCount.objects.filter(
+                aircraft_model_id=aircraft_model_id, part_type_id=part_type_id
+            ).update(count=F("count") + count)
+            if not updated:
+                ArchivedPartCount.objects.create(
+                    aircraft_model_id=aircraft_model_id,
+                    part_type_id=part_type_id,
+                    count=count,
+                )
+
+        parts.delete()
+        Aircraft.objects.filter(id__in=aircraft_ids).delete()
+        bump(AIRCRAFT, PARTS)
+        evict_aircraft_detail(aircraft_ids)
+        return aircraft_ids, len(part_rows)
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from core.part_teams import DEFAULT_BATCH_SIZE, sync_part_teams
+
+
+class Command(BaseCommand):
+    help = (
+        "Parçaların team alanını parça tipinin yetkili takımıyla eşitler. "
+        "Takım alanı eklendikten sonra ve takım ataması değiştiğinde çalıştırılır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--part-type",
+            type=int,
+            help="Sadece bu ID'ye sahip parça tipinin parçalarını günceller",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Tek transaction'da güncellenecek parça sayısı",
+        )
+
+    def report(self, model, part_type, updated):
+        self.stdout.write(
+            f"{part_type.pk} ID'li parça tipi, {model._meta.label}: "
+            f"{updated} parça güncellendi"
+        )
+
+    def handle(self, *args, **options):
+        total = sync_part_teams(
+            part_type_id=options["part_type"],
+            batch_size=options["batch_size"],
+            report=self.report,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Toplam {total} parça güncellendi."))
@@ -0,0 +1,106 @@
+import statistics
+import time
+from contextlib import ExitStack
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+from core.views.aircraft import AircraftViewSet
+from core.views.part import PartViewSet
+
+# Arayüzün sık kullandığı alan seçimleri; boş sorgu tam yanıttır
+SCENARIOS = {
+    "parts": (
+        PartViewSet,
+        "/api/v1/parts/",
+        [
+            "",
+            "expand=",
+            "fields=id,serial_number,type&expand=type",
+            "fields=id,serial_number,used_in_aircraft&expand=",
+        ],
+    ),
+    "aircraft": (
+        AircraftViewSet,
+        "/api/v1/aircraft/",
+        [
+            "",
+            "expand=",
+            "fields=id,serial_number,model&expand=model",
+        ],
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Parça ve uçak listelerini sık kullanılan ?fields= / ?expand= seçimleriyle "
+        "çağırarak yanıt boyutunu, süreyi ve sorgu sayısını karşılaştırır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--username", required=True, help="İstekleri yapacak kullanıcı"
+        )
+        parser.add_argument(
+            "--endpoint",
+            choices=sorted(SCENARIOS),
+            default="parts",
+            help="Ölçülecek liste",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=100, help="Sayfa başına kayıt sayısı"
+        )
+        parser.add_argument(
+            "--runs", type=int, default=20, help="Her seçim için tekrar sayısı"
+        )
+
+    def measure(self, view, request):
+        """
+        İsteği bir kez çalıştırır; süreyi, yanıt boyutunu ve sorgu sayısını döndürür.
+        """
+        with ExitStack() as stack:
+            captures = [
+                stack.enter_context(CaptureQueriesContext(connections[alias]))
+                for alias in connections
+            ]
+            start = time.perf_counter()
+            response = view(request)
+            response.render()
+            elapsed = time.perf_counter() - start
+        if response.status_code != 200:
+            raise CommandError(
+                f"İstek başarısız ({response.status_code}): {response.content[:200]!r}"
+            )
+        return elapsed, len(response.content), sum(len(c) for c in captures)
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"'{options['username']}' kullanıcısı bulunamadı.")
+
+        viewset, path, queries = SCENARIOS[options["endpoint"]]
+        view = viewset.as_view({"get": "list"})
+        factory = APIRequestFactory()
+
+        self.stdout.write(
+            f"{options['endpoint']}, limit={options['limit']}, {options['runs']} tekrar\n"
+        )
+        self.stdout.write(
+            f"{'medyan ms':>10} {'p95 ms':>8} {'bayt':>9} {'sorgu':>6}  seçim"
+        )
+        for query in queries:
+            url = f"{path}?limit={options['limit']}" + (f"&{query}" if query else "")
+            timings = []
+            for _ in range(options["runs"]):
+                request = factory.get(url)
+                force_authenticate(request, user=user)
+                elapsed, size, query_count = self.measure(view, request)
+                timings.append(elapsed * 1000)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            self.stdout.write(
+                f"{statistics.median(timings):>10.2f} {p95:>8.2f} {size:>9} "
+                f"{query_count:>6}  {query or '(tam yanıt)'}"
+            )
@@ -0,0 +1,166 @@
+import bisect
+import time
+from datetime import date, timedelta
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from core.lead_times import (
+    LEAD_TIME_BUCKETS_HOURS,
+    PERCENTILES,
+    lead_time_stats,
+    production_rates,
+    rows_to_columns,
+)
+from core.rollups import date_range_bounds
+
+
+def python_lead_time_stats(type_ids, model_ids, hours):
+    """
+    Karşılaştırma için satır satır (saf Python) teslim süresi istatistikleri.
+    """
+    groups = {}
+    for key in zip(type_ids, model_ids, hours):
+        groups.setdefault(key[:2], []).append(key[2])
+
+    result = {}
+    for key, values in groups.items():
+        values.sort()
+        histogram = [0] * (len(LEAD_TIME_BUCKETS_HOURS) + 1)
+        for value in values:
+            histogram[bisect.bisect_left(LEAD_TIME_BUCKETS_HOURS, value)] += 1
+        quantiles = []
+        for percentile in PERCENTILES:
+            position = (len(values) - 1) * percentile / 100
+            lower = int(position)
+            upper = min(lower + 1, len(values) - 1)
+            quantiles.append(
+                values[lower] + (values[upper] - values[lower]) * (position - lower)
+            )
+        result[key] = (len(values), sum(values) / len(values), quantiles, histogram)
+    return result
+
+
+class Command(BaseCommand):
+    help = (
+        "Teslim süresi ve üretim hızı hesaplarını sentetik veriyle (varsayılan 10 "
+        "milyon parça) ölçer ve satır satır Python hesabıyla karşılaştırır. "
+        "Veritabanına yazmaz."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=10_000_000, help="Sentetik parça sayısı"
+        )
+        parser.add_argument(
+            "--baseline-rows",
+            type=int,
+            default=500_000,
+            help="Saf Python karşılaştırmasında kullanılacak parça sayısı",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100_000,
+            help="Satırdan diziye dönüşümde parti büyüklüğü",
+        )
+        parser.add_argument("--days", type=int, default=90, help="Tarih aralığı (gün)")
+        parser.add_argument(
+            "--personnel", type=int, default=200, help="Üreten personel sayısı"
+        )
+        parser.add_argument("--seed", type=int, default=42)
+
+    def timed(self, label, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"{label:<40} {elapsed * 1000:>10.1f} ms")
+        return result, elapsed
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        if rows < 1 or options["days"] < 1:
+            raise CommandError("--rows ve --days en az 1 olmalıdır.")
+
+        rng = np.random.default_rng(options["seed"])
+        end = date(2026, 1, 1)
+        start = end - timedelta(days=options["days"] - 1)
+        lower, upper = date_range_bounds(start, end)
+
+        type_ids = rng.integers(1, 5, rows, dtype=np.int32)
+        model_ids = rng.integers(1, 5, rows, dtype=np.int32)
+        hours = rng.gamma(2.0, 24.0, rows).astype(np.float32)
+        personnel_ids = rng.integers(1, options["personnel"] + 1, rows, dtype=np.int64)
+        created = rng.uniform(lower.timestamp(), upper.timestamp(), rows)
+
+        columns = (type_ids, model_ids, hours)
+        size = sum(column.nbytes for column in (*columns, personnel_ids, created))
+        self.stdout.write(
+            f"{rows:,} parça, {options['days']} gün, {options['personnel']} personel, "
+            f"sütunlar {size / 1024 / 1024:.0f} MiB\n"
+        )
+
+        # Veritabanı imlecinin döndürdüğü tuple partilerinin diziye dönüşümü
+        # (fetch_columns); tuple üretimi ölçüme dahil değildir
+        conversion = 0.0
+        for offset in range(0, rows, options["chunk_size"]):
+            chunk = slice(offset, offset + options["chunk_size"])
+            batch = list(zip(*(column[chunk].tolist() for column in columns)))
+            started = time.perf_counter()
+            rows_to_columns(batch, [column.dtype for column in columns])
+            conversion += time.perf_counter() - started
+        self.stdout.write(
+            f"{'satır partileri → NumPy sütunları':<40} {conversion * 1000:>10.1f} ms"
+        )
+
+        stats, vectorized = self.timed(
+            "teslim süresi istatistikleri (NumPy)", lead_time_stats, *columns
+        )
+        self.timed(
+            "üretim hızları (NumPy)",
+            production_rates,
+            personnel_ids,
+            created,
+            start,
+            end,
+            7,
+        )
+
+        baseline_rows = min(options["baseline_rows"], rows)
+        sample = [column[:baseline_rows].tolist() for column in columns]
+        expected, baseline = self.timed(
+            f"teslim süresi, saf Python ({baseline_rows:,})",
+            python_lead_time_stats,
+            *sample,
+        )
+        self.stdout.write(
+            f"{'saf Python, {:,} parçaya oranlanmış'.format(rows):<40} "
+            f"{baseline * rows / baseline_rows * 1000:>10.1f} ms"
+        )
+
+        # Aynı örnek üzerinde iki hesabın uyuştuğu doğrulanır
+        sample_stats = lead_time_stats(*(column[:baseline_rows] for column in columns))
+        for row in sample_stats:
+            count, mean, quantiles, histogram = expected[
+                (row["part_type_id"], row["aircraft_model_id"])
+            ]
+            matches = (
+                row["count"] == count
+                and abs(row["mean_hours"] - mean) < 0.01
+                and all(
+                    abs(row[f"p{percentile}_hours"] - value) < 0.01
+                    for percentile, value in zip(PERCENTILES, quantiles)
+                )
+                and list(row["histogram"].values()) == histogram
+            )
+            if not matches:
+                raise CommandError(
+                    f"Sonuçlar uyuşmuyor: {row['part_type_id']}/"
+                    f"{row['aircraft_model_id']}"
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n{len(stats)} grup; NumPy hesabı saf Python'dan yaklaşık "
+                f"{baseline * rows / baseline_rows / vectorized:.0f} kat hızlı, "
+                "sonuçlar örnek üzerinde aynı."
+            )
+        )
@@ -0,0 +1,97 @@
+import random
+import statistics
+import time
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.test import APIRequestFactory, force_authenticate
+from core.models import Part
+from core.views.search import SearchView
+
+
+def typing_queries(serials, rng):
+    """
+    Seri numaralarından kullanıcının yazarken gönderdiği sorguları üretir:
+    farklı uzunlukta önekler, ortadan parçalar ve bir harfi değiştirilmiş yazımlar.
+    """
+    queries = []
+    for serial in serials:
+        queries.append(serial[: rng.randint(2, len(serial))])
+        start = rng.randint(0, max(len(serial) - 4, 0))
+        queries.append(serial[start : start + 4])
+        index = rng.randrange(len(serial))
+        queries.append(serial[:index] + "x" + serial[index + 1 :])
+    return queries
+
+
+class Command(BaseCommand):
+    help = (
+        "Genel arama endpoint'ini mevcut seri numaralarından üretilen yazım "
+        "sorgularıyla çağırarak gecikme yüzdeliklerini (p50/p95/p99) ölçer."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--username", required=True, help="İstekleri yapacak kullanıcı"
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=50,
+            help="Sorgu üretmek için kullanılacak seri numarası sayısı",
+        )
+        parser.add_argument(
+            "--runs", type=int, default=3, help="Her sorgu için tekrar sayısı"
+        )
+        parser.add_argument("--limit", type=int, default=10, help="Sonuç sayısı")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"'{options['username']}' kullanıcısı bulunamadı.")
+
+        # Rastgele örnek için tablo sıralanmaz; kimlik aralığından seçilir
+        rng = random.Random(options["seed"])
+        last = Part.objects.order_by("-pk").values_list("pk", flat=True).first()
+        if last is None:
+            raise CommandError("Sorgu üretmek için parça bulunamadı.")
+        ids = [rng.randint(1, last) for _ in range(options["samples"])]
+        serials = list(
+            Part.objects.filter(pk__in=ids).values_list("serial_number", flat=True)
+        )
+        queries = typing_queries(serials, rng)
+
+        view = SearchView.as_view()
+        factory = APIRequestFactory()
+        timings = []
+        found = 0
+        for _ in range(options["runs"]):
+            for query in queries:
+                request = factory.get(
+                    "/api/v1/search/", {"q": query, "limit": options["limit"]}
+                )
+                force_authenticate(request, user=user)
+                start = time.perf_counter()
+                response = view(request)
+                response.render()
+                timings.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    raise CommandError(
+                        f"İstek başarısız ({response.status_code}): "
+                        f"{response.content[:200]!r}"
+                    )
+                found += bool(response.data["results"])
+
+        timings.sort()
+
+        def percentile(value):
+            return timings[min(len(timings) - 1, int(len(timings) * value))]
+
+        self.stdout.write(
+            f"{len(queries)} sorgu x {options['runs']} tekrar, "
+            f"sonuç bulunan istek oranı %{100 * found / len(timings):.0f}"
+        )
+        self.stdout.write(
+            f"p50 {statistics.median(timings):.2f} ms, p95 {percentile(0.95):.2f} ms, "
+            f"p99 {percentile(0.99):.2f} ms, en yavaş {timings[-1]:.2f} ms"
+        )
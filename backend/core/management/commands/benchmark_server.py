@@ -0,0 +1,128 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from core.startup import child_pids, process_memory
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = (
+        "gunicorn'u preload açık ve kapalı başlatarak ilk isteğe kadar geçen süreyi "
+        "ve worker başına bellek kullanımını (RSS/PSS/USS) karşılaştırır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="Worker sayısı")
+        parser.add_argument(
+            "--worker-class",
+            choices=["sync", "gthread", "async"],
+            default="sync",
+            help="Worker tipi",
+        )
+        parser.add_argument(
+            "--path",
+            default="/docs/openapi.json",
+            help="İlk istek için çağrılacak yol",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=60,
+            help="Sunucunun hazır olması için beklenecek en uzun süre (saniye)",
+        )
+
+    def first_request(self, url, deadline):
+        """
+        Sunucu yanıt verene kadar dener; ilk başarılı isteğin süresini döndürür.
+        """
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(url, timeout=10) as response:
+                    response.read()
+                return time.perf_counter() - start
+            except urllib.error.HTTPError:
+                return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.02)
+        raise CommandError(f"Sunucu {url} adresinde yanıt vermedi.")
+
+    def run(self, preload, options):
+        port = _free_port()
+        env = {
+            **os.environ,
+            "GUNICORN_BIND": f"127.0.0.1:{port}",
+            "GUNICORN_WORKERS": str(options["workers"]),
+            "GUNICORN_WORKER_CLASS": options["worker_class"],
+            "GUNICORN_PRELOAD": str(preload),
+            "GUNICORN_MAX_WORKER_RSS_MB": "0",
+        }
+        url = f"http://127.0.0.1:{port}{options['path']}"
+
+        start = time.monotonic()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn"],
+            cwd=settings.BASE_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            first_latency = self.first_request(url, start + options["timeout"])
+            ready = time.monotonic() - start
+
+            # Diğer worker'ların da açılması beklenir, sonra her birine istek gönderilir
+            deadline = time.monotonic() + options["timeout"]
+            while (
+                len(child_pids(server.pid)) < options["workers"]
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.05)
+            time.sleep(1)
+            for _ in range(options["workers"] * 4):
+                self.first_request(url, deadline)
+
+            master = process_memory(server.pid)
+            workers = [process_memory(pid) for pid in child_pids(server.pid)]
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=30)
+
+        return ready, first_latency, master, workers
+
+    def handle(self, *args, **options):
+        mb = 1024 * 1024
+        self.stdout.write(
+            f"{options['workers']} worker, {options['worker_class']}, "
+            f"ilk istek: {options['path']}\n"
+        )
+        self.stdout.write(
+            f"{'preload':>8} {'ilk yanıt s':>12} {'ilk istek ms':>13} "
+            f"{'master RSS':>11} {'worker RSS':>11} {'worker PSS':>11} {'worker USS':>11}"
+        )
+        for preload in (True, False):
+            ready, latency, master, workers = self.run(preload, options)
+            count = len(workers) or 1
+            self.stdout.write(
+                f"{'açık' if preload else 'kapalı':>8} {ready:>12.2f} "
+                f"{latency * 1000:>13.1f} {master['rss'] / mb:>10.1f}M "
+                f"{sum(w['rss'] for w in workers) / count / mb:>10.1f}M "
+                f"{sum(w['pss'] for w in workers) / count / mb:>10.1f}M "
+                f"{sum(w['uss'] for w in workers) / count / mb:>10.1f}M"
+            )
+        self.stdout.write(
+            "\nRSS paylaşılan sayfaları her worker'da tekrar sayar; gerçek maliyet "
+            "için PSS ve USS değerlerine bakılmalıdır."
+        )
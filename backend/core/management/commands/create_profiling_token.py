@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from core.profiling import MODE_SAMPLING, MODES, create_token
+
+
+class Command(BaseCommand):
+    help = (
+        "İsteklerin profillenmesi için X-Profile başlığında gönderilecek "
+        "imzalı token üretir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mode",
+            choices=MODES,
+            default=MODE_SAMPLING,
+            help="Profil türü: sampling (istatistiksel, düşük maliyet) veya cprofile",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(create_token(options["mode"]))
+        self.stderr.write(
+            f"Token {settings.PROFILING_TOKEN_MAX_AGE} saniye geçerlidir. "
+            "Kullanım: X-Profile: <token>"
+        )
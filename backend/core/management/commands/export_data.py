@@ -0,0 +1,68 @@
+import time
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from core.exports import EXPORTS, FORMAT_PARQUET, FORMATS, write_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Parça, uçak, personel ve takım verilerini Parquet veya Arrow IPC dosyalarına "
+        "yazar. Parça ve uçaklar üretim/montaj gününe göre (date=YYYY-MM-DD) bölümlenir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", required=True, help="Çıktı dizini")
+        parser.add_argument(
+            "--format",
+            choices=sorted(FORMATS),
+            default=FORMAT_PARQUET,
+            help="Dosya biçimi",
+        )
+        parser.add_argument(
+            "--dataset",
+            action="append",
+            choices=list(EXPORTS),
+            help="Yazılacak veri seti (tekrarlanabilir, varsayılan: hepsi)",
+        )
+        parser.add_argument(
+            "--start", help="Bu günden (YYYY-MM-DD, UTC, dahil) itibaren kayıtlar"
+        )
+        parser.add_argument(
+            "--end", help="Bu güne (YYYY-MM-DD, UTC, dahil) kadar kayıtlar"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Satır grubu ve veritabanı okuma partisi büyüklüğü",
+        )
+
+    def parse_date(self, value, name):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            raise CommandError(f"--{name} YYYY-MM-DD biçiminde olmalıdır.")
+
+    def handle(self, *args, **options):
+        start = self.parse_date(options["start"], "start")
+        end = self.parse_date(options["end"], "end")
+        if start and end and end < start:
+            raise CommandError("Bitiş tarihi başlangıç tarihinden önce olamaz.")
+
+        for name in options["dataset"] or EXPORTS:
+            started = time.perf_counter()
+            rows = write_dataset(
+                name,
+                options["output"],
+                options["format"],
+                start=start,
+                end=end,
+                chunk_size=options["chunk_size"],
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{name}: {rows} satır yazıldı "
+                    f"({time.perf_counter() - started:.1f} sn)."
+                )
+            )
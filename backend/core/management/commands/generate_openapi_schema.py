@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from core.schema import write_schema_artifact
+
+
+class Command(BaseCommand):
+    help = "OpenAPI şemasını üretir ve sıkıştırılmış hâliyle birlikte diske yazar."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--schema-version",
+            dest="schema_version",
+            default=None,
+            help="Şema sürümü (varsayılan: APP_VERSION veya kod özeti)",
+        )
+
+    def handle(self, *args, **options):
+        artifact = write_schema_artifact(options["schema_version"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"OpenAPI şeması üretildi: sürüm {artifact.version}, "
+                f"{len(artifact.body)} bayt ({len(artifact.gzipped)} bayt gzip)"
+            )
+        )
@@ -0,0 +1,107 @@
+import json
+from datetime import datetime, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from core.lead_times import PERCENTILES, lead_time_report, production_rate_report
+
+
+class Command(BaseCommand):
+    help = (
+        "Parça tipi ve uçak modeli bazında parça teslim süresi (üretimden montaja) "
+        "dağılımını ve personel başına üretim hızlarını raporlar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            help="Başlangıç tarihi (YYYY-MM-DD, UTC, varsayılan: 30 gün önce)",
+        )
+        parser.add_argument(
+            "--end", help="Bitiş tarihi (YYYY-MM-DD, UTC, dahil, varsayılan: bugün)"
+        )
+        parser.add_argument(
+            "--window",
+            type=int,
+            default=7,
+            help="Üretim hızı kayan ortalama penceresi (gün)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Veritabanından tek seferde okunacak satır sayısı",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Sonucu JSON olarak yazdırır"
+        )
+
+    def parse_date(self, value, name):
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            raise CommandError(f"--{name} YYYY-MM-DD biçiminde olmalıdır.")
+
+    def handle(self, *args, **options):
+        end = (
+            self.parse_date(options["end"], "end")
+            if options["end"]
+            else timezone.now().date()
+        )
+        start = (
+            self.parse_date(options["start"], "start")
+            if options["start"]
+            else end - timedelta(days=29)
+        )
+        if end < start:
+            raise CommandError("Bitiş tarihi başlangıç tarihinden önce olamaz.")
+        if options["window"] < 1:
+            raise CommandError("--window en az 1 olmalıdır.")
+
+        lead_times = lead_time_report(start, end, options["chunk_size"])
+        rates = production_rate_report(
+            start, end, options["window"], options["chunk_size"]
+        )
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {
+                        "start": start,
+                        "end": end,
+                        "lead_times": lead_times,
+                        "production_rates": rates,
+                    },
+                    cls=DjangoJSONEncoder,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            )
+            return
+
+        self.stdout.write(f"Teslim süreleri (saat), {start} - {end}\n")
+        percentile_columns = "".join(f"{f'p{p}':>9}" for p in PERCENTILES)
+        self.stdout.write(
+            f"{'parça tipi':<12} {'model':<12} {'adet':>8} {'ortalama':>9}"
+            f"{percentile_columns}"
+        )
+        for row in lead_times:
+            percentiles = "".join(f"{row[f'p{p}_hours']:>9.1f}" for p in PERCENTILES)
+            self.stdout.write(
+                f"{str(row['part_type_name']):<12} "
+                f"{str(row['aircraft_model_name']):<12} {row['count']:>8} "
+                f"{row['mean_hours']:>9.1f}{percentiles}"
+            )
+
+        self.stdout.write(
+            f"\nÜretim hızları (parça/gün, {options['window']} günlük pencere)\n"
+        )
+        self.stdout.write(
+            f"{'personel':<24} {'toplam':>8} {'aktif gün':>10} {'ortalama':>9} "
+            f"{'güncel':>8} {'en yüksek':>10}"
+        )
+        for row in rates:
+            self.stdout.write(
+                f"{str(row['full_name']):<24} {row['total']:>8} "
+                f"{row['active_days']:>10} {row['mean_per_day']:>9.2f} "
+                f"{row['current_rate']:>8.2f} {row['peak_rate']:>10.2f}"
+            )
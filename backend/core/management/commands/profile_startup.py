@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from core.startup import (
+    STARTUP_TARGETS,
+    group_by_package,
+    measure_startup,
+    parse_importtime,
+    run_startup,
+)
+
+
+class Command(BaseCommand):
+    help = "Soğuk açılış süresini ölçer ve modül bazında import maliyetini raporlar."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            choices=sorted(STARTUP_TARGETS),
+            default="wsgi",
+            help="Ölçülecek açılış (varsayılan: wsgi)",
+        )
+        parser.add_argument(
+            "--top", type=int, default=25, help="Listelenecek modül sayısı"
+        )
+        parser.add_argument(
+            "--runs", type=int, default=3, help="Süre ölçümü için tekrar sayısı"
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Modüllerin sıralanacağı süre",
+        )
+
+    def handle(self, *args, **options):
+        target = options["target"]
+        elapsed = measure_startup(target, runs=options["runs"])
+        _, output = run_startup(target, importtime=True)
+        modules = parse_importtime(output)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"'{target}' soğuk açılış süresi: {elapsed * 1000:.0f} ms "
+                f"(en iyi {options['runs']} ölçüm), {len(modules)} modül import edildi"
+            )
+        )
+
+        index = 2 if options["sort"] == "cumulative" else 1
+        self.stdout.write(f"\n{'toplam ms':>10} {'kendi ms':>10}  modül")
+        for name, self_us, cumulative_us in sorted(
+            modules, key=lambda item: item[index], reverse=True
+        )[: options["top"]]:
+            self.stdout.write(
+                f"{cumulative_us / 1000:>10.1f} {self_us / 1000:>10.1f}  {name}"
+            )
+
+        self.stdout.write(f"\n{'kendi ms':>10}  paket")
+        for package, self_us in group_by_package(modules)[: options["top"]]:
+            self.stdout.write(f"{self_us / 1000:>10.1f}  {package}")
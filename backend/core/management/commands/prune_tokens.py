@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+
+class Command(BaseCommand):
+    help = (
+        "Süresi dolmuş refresh token kayıtlarını (OutstandingToken ve bağlı "
+        "BlacklistedToken) partiler halinde siler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Tek sorguda silinecek kayıt sayısı",
+        )
+
+    def handle(self, *args, **options):
+        # Süresi dolmuş token zaten reddedildiği için kara liste kaydına gerek kalmaz
+        now = timezone.now()
+        total = blacklisted = 0
+        while True:
+            ids = list(
+                OutstandingToken.objects.filter(expires_at__lte=now)
+                .order_by("id")
+                .values_list("id", flat=True)[: options["batch_size"]]
+            )
+            if not ids:
+                break
+            _, per_model = OutstandingToken.objects.filter(id__in=ids).delete()
+            total += per_model.get("token_blacklist.OutstandingToken", 0)
+            blacklisted += per_model.get("token_blacklist.BlacklistedToken", 0)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{total} token kaydı ve {blacklisted} kara liste kaydı silindi."
+            )
+        )
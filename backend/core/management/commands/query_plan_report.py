@@ -0,0 +1,124 @@
+import textwrap
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max
+from core.models import QueryPlan
+
+
+class Command(BaseCommand):
+    help = (
+        "Yakalanan sorgu planlarını sürümler arasında karşılaştırır; plan şekli "
+        "veya maliyeti değişen sorguları raporlar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--release",
+            default=settings.QUERY_PLAN_RELEASE,
+            help="İncelenecek sürüm (varsayılan: APP_VERSION)",
+        )
+        parser.add_argument(
+            "--baseline",
+            help="Karşılaştırılacak sürüm (varsayılan: en son görülen diğer sürüm)",
+        )
+        parser.add_argument(
+            "--cost-ratio",
+            type=float,
+            default=0.5,
+            help="Bu orandan fazla değişen plan maliyeti raporlanır (0.5 = %%50)",
+        )
+        parser.add_argument(
+            "--fail-on-change",
+            action="store_true",
+            help="Değişiklik bulunursa hata koduyla çıkar (CI için)",
+        )
+
+    def plans_by_fingerprint(self, release):
+        """
+        Sürümdeki planları fingerprint'e göre, eskiden yeniye sıralı döndürür.
+        """
+        plans = {}
+        for plan in QueryPlan.objects.filter(release=release).order_by("last_seen_at"):
+            plans.setdefault(plan.fingerprint, []).append(plan)
+        return plans
+
+    def default_baseline(self, release):
+        return (
+            QueryPlan.objects.exclude(release=release)
+            .values("release")
+            .annotate(last_seen=Max("last_seen_at"))
+            .order_by("-last_seen")
+            .values_list("release", flat=True)
+            .first()
+        )
+
+    def describe(self, plan):
+        return f"  {plan.view_name} [{plan.fingerprint}]\n" f"  {plan.sql[:300]}"
+
+    def handle(self, *args, **options):
+        release = options["release"]
+        plans = self.plans_by_fingerprint(release)
+        if not plans:
+            raise CommandError(f"{release} sürümü için yakalanmış plan yok.")
+        current = {fingerprint: shapes[-1] for fingerprint, shapes in plans.items()}
+
+        changes = 0
+
+        # Aynı sürümde veri büyüdükçe planı değişen sorgular
+        for fingerprint, shapes in plans.items():
+            if len(shapes) < 2:
+                continue
+            changes += 1
+            previous, plan = shapes[-2], shapes[-1]
+            self.stdout.write(
+                self.style.WARNING(f"Plan {release} sürümü içinde değişti:")
+            )
+            self.stdout.write(self.describe(plan))
+            self.stdout.write(
+                f"  Önceki plan:\n{textwrap.indent(previous.plan_shape, '    ')}"
+            )
+            self.stdout.write(
+                f"  Güncel plan:\n{textwrap.indent(plan.plan_shape, '    ')}\n"
+            )
+
+        baseline = options["baseline"] or self.default_baseline(release)
+        if baseline is None:
+            self.stdout.write("Karşılaştırılacak önceki sürüm yok.")
+        else:
+            previous_plans = {
+                fingerprint: shapes[-1]
+                for fingerprint, shapes in self.plans_by_fingerprint(baseline).items()
+            }
+            self.stdout.write(f"{baseline} -> {release} karşılaştırılıyor.\n")
+            for fingerprint, plan in current.items():
+                base = previous_plans.get(fingerprint)
+                if base is None:
+                    continue
+                if base.plan_hash != plan.plan_hash:
+                    changes += 1
+                    self.stdout.write(self.style.WARNING("Plan şekli değişti:"))
+                    self.stdout.write(self.describe(plan))
+                    self.stdout.write(
+                        f"  {baseline}:\n{textwrap.indent(base.plan_shape, '    ')}"
+                    )
+                    self.stdout.write(
+                        f"  {release}:\n{textwrap.indent(plan.plan_shape, '    ')}\n"
+                    )
+                    continue
+                ratio = abs(plan.total_cost - base.total_cost) / max(base.total_cost, 1)
+                if ratio >= options["cost_ratio"]:
+                    changes += 1
+                    self.stdout.write(self.style.WARNING("Plan maliyeti değişti:"))
+                    self.stdout.write(self.describe(plan))
+                    self.stdout.write(
+                        f"  Maliyet: {base.total_cost:.2f} -> {plan.total_cost:.2f}, "
+                        f"süre: {base.execution_ms:.2f} ms -> {plan.execution_ms:.2f} ms\n"
+                    )
+
+        if not changes:
+            self.stdout.write(self.style.SUCCESS("Plan değişikliği bulunmadı."))
+            return
+        message = f"{changes} sorguda plan değişikliği bulundu."
+        if options["fail_on_change"]:
+            raise CommandError(message)
+        self.stdout.write(self.style.WARNING(message))
@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+from django.core.management.base import BaseCommand, CommandError
+from core.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Saatlik üretim ve montaj sayaçlarını parça ve uçak tablolarından (arşiv dahil) "
+        "yeniden hesaplar. Sayaçlar eklendikten sonra bir kez ve sapma şüphesinde çalıştırılır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            help="Sadece bu tarihten (YYYY-MM-DD, UTC) sonraki dilimleri yeniden hesaplar",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            try:
+                since = datetime.strptime(options["since"], "%Y-%m-%d").replace(
+                    tzinfo=timezone.utc
+                )
+            except ValueError:
+                raise CommandError("--since YYYY-MM-DD biçiminde olmalıdır.")
+
+        written = rebuild_rollups(since=since)
+        self.stdout.write(self.style.SUCCESS(f"{written} sayaç satırı yazıldı."))
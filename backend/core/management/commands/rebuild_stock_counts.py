@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from core.stock import rebuild_stock_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Stok sayaçlarını (core_partstockcount) parça tablosundan yeniden hesaplar. "
+        "Sayaçlar eklendikten sonra bir kez ve sapma şüphesinde çalıştırılır."
+    )
+
+    def handle(self, *args, **options):
+        updated = rebuild_stock_counts()
+        self.stdout.write(self.style.SUCCESS(f"{updated} stok sayacı güncellendi."))
@@ -0,0 +1,76 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from core.deletion import claim_next_job, run_job
+from core.models import DeletionJob
+
+
+class Command(BaseCommand):
+    help = (
+        "Uçak modeli ve parça tipi silme işlerini bağlı kayıtlarıyla birlikte "
+        "partiler halinde çalıştırır. Yarıda kalan işler kaldığı yerden devam eder."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--job",
+            type=int,
+            help="Sadece bu ID'ye sahip işi çalıştırır",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Tek transaction'da silinecek kayıt sayısı (varsayılan: CASCADE_DELETE_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Bekleyen işleri bitirip çıkar",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=5,
+            help="İş yokken iki kontrol arasında beklenecek süre (saniye)",
+        )
+
+    def report(self, job, label):
+        percent = (
+            f" (%{job.deleted_total * 100 // job.estimated_total})"
+            if job.estimated_total
+            else ""
+        )
+        self.stdout.write(
+            f"İş #{job.pk} {job.target_repr}: {label} - "
+            f"{job.deleted_total}/{job.estimated_total} kayıt silindi{percent}"
+        )
+
+    def run(self, job, batch_size):
+        self.stdout.write(f"İş #{job.pk} başladı: {job}")
+        try:
+            run_job(job, batch_size=batch_size, report=self.report)
+        except Exception as exc:
+            self.stderr.write(self.style.ERROR(f"İş #{job.pk} başarısız: {exc}"))
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"İş #{job.pk} tamamlandı: {job.deleted_total} kayıt silindi."
+            )
+        )
+
+    def handle(self, *args, **options):
+        if options["job"]:
+            try:
+                job = DeletionJob.objects.get(pk=options["job"])
+            except DeletionJob.DoesNotExist:
+                raise CommandError(f"{options['job']} ID'li silme işi bulunamadı.")
+            self.run(job, options["batch_size"])
+            return
+
+        while True:
+            job = claim_next_job()
+            if job is not None:
+                self.run(job, options["batch_size"])
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["sleep"])
@@ -0,0 +1,79 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from core.models import PartTeamSyncJob
+from core.part_teams import DEFAULT_BATCH_SIZE, claim_next_sync_job, run_sync_job
+
+
+class Command(BaseCommand):
+    help = (
+        "Yetkili takımı admin panelinden değiştirilen parça tiplerinin parçalarına "
+        "yeni takımı partiler halinde yazar. Yarıda kalan işler kaldığı yerden devam eder."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--job",
+            type=int,
+            help="Sadece bu ID'ye sahip işi çalıştırır",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Tek transaction'da güncellenecek parça sayısı",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Bekleyen işleri bitirip çıkar",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=5,
+            help="İş yokken iki kontrol arasında beklenecek süre (saniye)",
+        )
+
+    def report(self, job, model):
+        percent = (
+            f" (%{min(job.updated_total * 100 // job.estimated_total, 100)})"
+            if job.estimated_total
+            else ""
+        )
+        self.stdout.write(
+            f"İş #{job.pk}: {model._meta.label} - "
+            f"{job.updated_total}/{job.estimated_total} parça güncellendi{percent}"
+        )
+
+    def run(self, job, batch_size):
+        self.stdout.write(f"İş #{job.pk} başladı: {job}")
+        try:
+            run_sync_job(job, batch_size=batch_size, report=self.report)
+        except Exception as exc:
+            self.stderr.write(self.style.ERROR(f"İş #{job.pk} başarısız: {exc}"))
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"İş #{job.pk} tamamlandı: {job.updated_total} parça güncellendi."
+            )
+        )
+
+    def handle(self, *args, **options):
+        if options["job"]:
+            try:
+                job = PartTeamSyncJob.objects.get(pk=options["job"])
+            except PartTeamSyncJob.DoesNotExist:
+                raise CommandError(
+                    f"{options['job']} ID'li takım eşitleme işi bulunamadı."
+                )
+            self.run(job, options["batch_size"])
+            return
+
+        while True:
+            job = claim_next_sync_job()
+            if job is not None:
+                self.run(job, options["batch_size"])
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["sleep"])
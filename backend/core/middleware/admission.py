@@ -0,0 +1,443 @@
+import json
+import logging
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import RequestDataTooBig
+from django.db import DatabaseError, connections
+from django.http import JsonResponse, QueryDict
+from core.middleware.auth import jwt_user_id
+
+logger = logging.getLogger(__name__)
+
+# Öncelik sınıfları (yüksekten düşüğe)
+WRITE = "write"
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITY_CLASSES = (WRITE, INTERACTIVE, BULK)
+
+# PostgreSQL'in statement_timeout nedeniyle iptal ettiği sorgunun SQLSTATE kodu
+QUERY_CANCELED = "57014"
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class _Gate:
+    """
+    Bir öncelik sınıfı için süreç içi eşzamanlılık kapısı.
+    Kapasite doluysa en fazla queue_timeout kadar beklenir, sonra istek reddedilir.
+    Takım bazlı sınır beklemeden uygulanır.
+    """
+
+    def __init__(self, name, concurrency, team_concurrency, queue_timeout):
+        self.name = name
+        self.concurrency = concurrency
+        self.team_concurrency = team_concurrency
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.team_in_flight = {}
+        self._condition = threading.Condition()
+
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_overload = 0
+        self.rejected_team = 0
+        self.statement_timeouts = 0
+        self.wait_ms_total = 0.0
+
+    def acquire(self, team_id):
+        """
+        İsteği kabul ederse None, reddederse ret nedenini ("team" veya "overload") döndürür.
+        """
+        with self._condition:
+            if (
+                team_id is not None
+                and self.team_in_flight.get(team_id, 0) >= self.team_concurrency
+            ):
+                self.rejected_team += 1
+                return "team"
+
+            if self.in_flight >= self.concurrency:
+                self.queued += 1
+                start = time.monotonic()
+                self._condition.wait_for(
+                    lambda: self.in_flight < self.concurrency, self.queue_timeout
+                )
+                self.wait_ms_total += (time.monotonic() - start) * 1000
+                if self.in_flight >= self.concurrency:
+                    self.rejected_overload += 1
+                    return "overload"
+                # Beklerken aynı takımdan başka bir istek kabul edilmiş olabilir
+                if (
+                    team_id is not None
+                    and self.team_in_flight.get(team_id, 0) >= self.team_concurrency
+                ):
+                    self.rejected_team += 1
+                    return "team"
+
+            self.in_flight += 1
+            if team_id is not None:
+                self.team_in_flight[team_id] = self.team_in_flight.get(team_id, 0) + 1
+            self.admitted += 1
+            return None
+
+    def release(self, team_id):
+        with self._condition:
+            self.in_flight -= 1
+            if team_id is not None:
+                remaining = self.team_in_flight.get(team_id, 1) - 1
+                if remaining:
+                    self.team_in_flight[team_id] = remaining
+                else:
+                    self.team_in_flight.pop(team_id, None)
+            self._condition.notify()
+
+    def get_stats(self):
+        with self._condition:
+            return {
+                "class": self.name,
+                "concurrency": self.concurrency,
+                "team_concurrency": self.team_concurrency,
+                "in_flight": self.in_flight,
+                "team_in_flight": dict(self.team_in_flight),
+                "admitted": self.admitted,
+                "queued": self.queued,
+                "avg_wait_ms": (
+                    round(self.wait_ms_total / self.queued, 3) if self.queued else 0.0
+                ),
+                "rejected_overload": self.rejected_overload,
+                "rejected_team": self.rejected_team,
+                "statement_timeouts": self.statement_timeouts,
+            }
+
+
+_gates = {}
+_gates_lock = threading.Lock()
+
+
+def get_gate(priority_class):
+    """
+    Öncelik sınıfının kapısını ayarlardan bir kez oluşturup döndürür.
+    """
+    gate = _gates.get(priority_class)
+    if gate is None:
+        with _gates_lock:
+            gate = _gates.get(priority_class)
+            if gate is None:
+                config = settings.ADMISSION_CLASSES[priority_class]
+                gate = _Gate(
+                    priority_class,
+                    config["concurrency"],
+                    config["team_concurrency"],
+                    config["queue_timeout"],
+                )
+                _gates[priority_class] = gate
+    return gate
+
+
+def get_admission_stats():
+    """
+    Bu süreçteki kabul kararlarının istatistiklerini döndürür.
+    """
+    return {
+        "enabled": settings.ADMISSION_CONTROL_ENABLED,
+        "classes": [get_gate(name).get_stats() for name in PRIORITY_CLASSES],
+    }
+
+
+def _classify_read(path, query):
+    if any(path.startswith(prefix) for prefix in settings.ADMISSION_BULK_PATHS):
+        return BULK
+
+    offset = query.get("offset", "")
+    if offset.isdigit() and int(offset) >= settings.ADMISSION_DEEP_OFFSET:
+        return BULK
+
+    return INTERACTIVE
+
+
+def _batch_targets(request):
+    """
+    Toplu istek gövdesindeki alt isteklerin (yol, sorgu parametreleri) listesi.
+    Gövde okunamazsa boş liste döner; doğrulama hatasını view verir.
+    """
+    try:
+        items = json.loads(request.body).get("requests")
+        return [
+            (url.path, QueryDict(url.query))
+            for url in (urlsplit(item["path"]) for item in items)
+        ]
+    except (RequestDataTooBig, ValueError, AttributeError, KeyError, TypeError):
+        return []
+
+
+def classify(request):
+    """
+    İsteğin öncelik sınıfını belirler.
+    - Yazma istekleri (parça üretimi, uçak montajı): write
+    - Raporlar, dışa aktarımlar ve derin sayfalama: bulk
+    - Diğer okuma istekleri: interactive
+    - ADMISSION_READ_ONLY_PATHS altındaki toplu (POST) istekler: alt isteklerinin
+      en ağır sınıfı; bulk bir alt istek interactive kapasiteden çalıştırılamaz
+    - ADMISSION_INTERACTIVE_PATHS (giriş, token yenileme): interactive
+    """
+    path = request.path_info
+    if request.method in WRITE_METHODS:
+        if path in settings.ADMISSION_INTERACTIVE_PATHS:
+            return INTERACTIVE
+        if path not in settings.ADMISSION_READ_ONLY_PATHS:
+            return WRITE
+        classes = {_classify_read(*target) for target in _batch_targets(request)}
+        return BULK if BULK in classes else INTERACTIVE
+
+    return _classify_read(path, request.GET)
+
+
+def _team_for_user(user_id):
+    from core.models import Personnel
+
+    team_id = (
+        Personnel.objects.filter(user_id=user_id)
+        .values_list("team_id", flat=True)
+        .first()
+    )
+    # Takımı olmayan kullanıcılar da önbelleğe alınır (0)
+    return team_id or 0
+
+
+def resolve_team(request):
+    """
+    İsteğin takımını, view'a gelmeden önce JWT'den bulur.
+    Kullanıcı -> takım eşlemesi önbellekte tutulur, her istekte sorgu atılmaz.
+    Token yoksa veya geçersizse None döner (sadece sınıf sınırı uygulanır).
+    """
+    user_id = jwt_user_id(request)
+    if user_id is None:
+        return None
+
+    team_id = cache.get_or_set(
+        f"admission:team:{user_id}",
+        lambda: _team_for_user(user_id),
+        settings.ADMISSION_TEAM_CACHE_SECONDS,
+    )
+    return team_id or None
+
+
+class _StatementTimeout:
+    """
+    Postgres bağlantısında ilk sorgudan önce oturumun statement_timeout değerini
+    ayarlayan execute wrapper. Bağlantı açılmadıysa hiçbir şey yapmaz.
+    """
+
+    def __init__(self, timeout_ms):
+        self.timeout_ms = int(timeout_ms)
+        self.applied = set()
+
+    def __call__(self, execute, sql, params, many, context):
+        connection = context["connection"]
+        if connection.alias not in self.applied:
+            context["cursor"].cursor.execute(
+                f"SET statement_timeout = {self.timeout_ms}"
+            )
+            self.applied.add(connection.alias)
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def installed(self):
+        """
+        Bu thread'in Postgres bağlantılarına wrapper'ı ekler.
+        """
+        with ExitStack() as stack:
+            for alias in connections:
+                connection = connections[alias]
+                if connection.vendor == "postgresql":
+                    stack.enter_context(connection.execute_wrapper(self))
+            yield
+
+    def reset(self):
+        # Havuza veya kalıcı bağlantıya dönen oturum varsayılan değere çekilir
+        for alias in self.applied:
+            connection = connections[alias]
+            if connection.connection is None:
+                continue
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET statement_timeout TO DEFAULT")
+            except DatabaseError:
+                logger.warning("statement_timeout sıfırlanamadı: %s", alias)
+        self.applied.clear()
+
+
+@contextmanager
+def class_statement_timeout(priority_class):
+    """
+    Bu thread'in sorgularına öncelik sınıfının statement_timeout değerini uygular;
+    çıkışta oturumlar varsayılana döner. Middleware dışındaki thread'lerde açılan
+    bağlantılar (ör. toplu isteğin alt istekleri) için kullanılır.
+    """
+    statement_timeout = _StatementTimeout(
+        settings.ADMISSION_CLASSES[priority_class]["statement_timeout_ms"]
+    )
+    try:
+        with statement_timeout.installed():
+            yield
+    finally:
+        statement_timeout.reset()
+
+
+def is_query_canceled(exc):
+    cause = exc.__cause__
+    return (
+        getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+    ) == QUERY_CANCELED
+
+
+class _AdmittedStream:
+    """
+    Akış (streaming) yanıtının gövdesini saran iterator. Gövde view döndükten sonra
+    üretildiği için kabul kapısı ve statement_timeout yanıt kapatılana kadar tutulur.
+    """
+
+    def __init__(self, iterator, statement_timeout, gate, team_id):
+        self._iterator = iterator
+        self._statement_timeout = statement_timeout
+        self._gate = gate
+        self._team_id = team_id
+        self._closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            with self._statement_timeout.installed():
+                return next(self._iterator)
+        except DatabaseError as exc:
+            # Başlıklar gönderildiği için 503 dönülemez; sadece sayılır
+            if is_query_canceled(exc):
+                with self._gate._condition:
+                    self._gate.statement_timeouts += 1
+                logger.warning(
+                    "Akış sırasında sorgu zaman aşımına uğradı: class=%s",
+                    self._gate.name,
+                )
+            raise
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._statement_timeout.reset()
+        finally:
+            self._gate.release(self._team_id)
+
+
+def _reject(status, message, retry_after):
+    response = JsonResponse({"details": message}, status=status)
+    response["Retry-After"] = str(retry_after)
+    return response
+
+
+class AdmissionControlMiddleware:
+    """
+    API isteklerini öncelik sınıfına göre kabul eden veya hızlıca reddeden middleware.
+
+    Her sınıfın kendi eşzamanlılık kapasitesi vardır; böylece raporlar ve derin
+    sayfalama yazma isteklerinin (uçak montajı, parça üretimi) kapasitesini tüketemez.
+    - Sınıf kapasitesi doluysa kısa bir bekleme sonrası 503 + Retry-After döner
+    - Takım kendi sınırını aştıysa beklemeden 429 + Retry-After döner
+    - Kabul edilen isteğin Postgres sorgularına sınıfa ait statement_timeout uygulanır
+    - Akış yanıtları gövdeleri tamamen gönderilene kadar kapasiteden düşülmez
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _applies_to(self, request):
+        # CORS ön kontrol istekleri view'a ulaşmaz, kapasite tüketmez
+        if request.method == "OPTIONS":
+            return False
+        path = request.path_info
+        if not path.startswith(settings.ADMISSION_PATH_PREFIX):
+            return False
+        return not any(
+            path.startswith(prefix) for prefix in settings.ADMISSION_EXEMPT_PATHS
+        )
+
+    def __call__(self, request):
+        if not settings.ADMISSION_CONTROL_ENABLED or not self._applies_to(request):
+            return self.get_response(request)
+
+        priority_class = classify(request)
+        team_id = resolve_team(request)
+        gate = get_gate(priority_class)
+        request.admission_class = priority_class
+
+        rejection = gate.acquire(team_id)
+        if rejection == "team":
+            logger.warning(
+                "Takım eşzamanlılık sınırı aşıldı: class=%s team=%s",
+                priority_class,
+                team_id,
+            )
+            return _reject(
+                429,
+                "Takımınızın eşzamanlı istek sınırı aşıldı. Lütfen daha sonra tekrar deneyin.",
+                settings.ADMISSION_RETRY_AFTER,
+            )
+        if rejection == "overload":
+            logger.warning("Sunucu kapasitesi dolu: class=%s", priority_class)
+            return _reject(
+                503,
+                "Sunucu şu anda yoğun. Lütfen daha sonra tekrar deneyin.",
+                settings.ADMISSION_RETRY_AFTER,
+            )
+
+        statement_timeout = _StatementTimeout(
+            settings.ADMISSION_CLASSES[priority_class]["statement_timeout_ms"]
+        )
+        streaming = False
+        try:
+            with statement_timeout.installed():
+                response = self.get_response(request)
+            # Akış yanıtlarında (ör. dışa aktarma) sorgular gövde üretilirken çalışır;
+            # kapı ve zaman aşımı yanıt kapatılınca bırakılır. Async akışlar sarılamaz.
+            if response.streaming and not response.is_async:
+                response.streaming_content = _AdmittedStream(
+                    response.streaming_content, statement_timeout, gate, team_id
+                )
+                streaming = True
+            else:
+                statement_timeout.reset()
+        finally:
+            if not streaming:
+                gate.release(team_id)
+
+        response["X-Admission-Class"] = priority_class
+        return response
+
+    def process_exception(self, request, exception):
+        """
+        statement_timeout ile iptal edilen sorguları 503 yanıtına çevirir.
+        """
+        priority_class = getattr(request, "admission_class", None)
+        if (
+            priority_class is None
+            or not isinstance(exception, DatabaseError)
+            or not is_query_canceled(exception)
+        ):
+            return None
+
+        gate = get_gate(priority_class)
+        with gate._condition:
+            gate.statement_timeouts += 1
+        logger.warning("Sorgu zaman aşımına uğradı: class=%s", priority_class)
+        return _reject(
+            503,
+            "İstek zaman aşımına uğradı. Lütfen daha sonra tekrar deneyin.",
+            settings.ADMISSION_RETRY_AFTER,
+        )
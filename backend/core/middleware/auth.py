@@ -0,0 +1,17 @@
+def jwt_user_id(request):
+    """
+    İsteğin Bearer token'ından kullanıcı ID'sini, DRF kimlik doğrulamasından önce okur.
+    Veritabanı sorgusu yapılmaz; token yoksa veya geçersizse None döner.
+    """
+    header = request.headers.get("Authorization", "")
+    scheme, _, raw_token = header.partition(" ")
+    if scheme != "Bearer" or not raw_token:
+        return None
+
+    from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    try:
+        return AccessToken(raw_token.strip())["user_id"]
+    except (InvalidToken, TokenError, KeyError):
+        return None
@@ -0,0 +1,117 @@
+import logging
+import random
+import time
+import uuid
+from contextlib import ExitStack
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connections
+from core.middleware.auth import jwt_user_id
+from core import profiling
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "_profile"
+
+
+def _is_superuser(request):
+    """
+    Oturum (admin paneli) veya JWT kullanıcısının süper kullanıcı olup olmadığını döndürür.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return user.is_superuser
+
+    user_id = jwt_user_id(request)
+    if user_id is None:
+        return False
+    return cache.get_or_set(
+        f"profiling:superuser:{user_id}",
+        lambda: User.objects.filter(pk=user_id, is_superuser=True).exists(),
+        300,
+    )
+
+
+class ProfilingMiddleware:
+    """
+    İsteğe bağlı, istek bazında profil çıkaran middleware.
+
+    Profil şu durumlarda alınır:
+    - X-Profile başlığında geçerli imzalı token varsa (create_profiling_token)
+    - Süper kullanıcı ?_profile=1 (veya ?_profile=cprofile) ile istek yaparsa
+    - PROFILING_SAMPLE_RATE oranında rastgele seçilen isteklerde
+
+    Tetiklenmeyen isteklerde sadece bir başlık/parametre kontrolü yapılır.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _requested_mode(self, request):
+        token = request.headers.get(PROFILE_HEADER)
+        if token:
+            return profiling.read_token(token)
+
+        flag = request.GET.get(PROFILE_QUERY_PARAM)
+        if flag and _is_superuser(request):
+            return (
+                profiling.MODE_CPROFILE
+                if flag == profiling.MODE_CPROFILE
+                else profiling.MODE_SAMPLING
+            )
+
+        rate = settings.PROFILING_SAMPLE_RATE
+        if rate > 0 and random.random() < rate:
+            return profiling.MODE_SAMPLING
+        return None
+
+    def __call__(self, request):
+        if not settings.PROFILING_ENABLED:
+            return self.get_response(request)
+
+        mode = self._requested_mode(request)
+        if mode is None:
+            return self.get_response(request)
+
+        return self._profile(request, mode)
+
+    def _profile(self, request, mode):
+        request_id = getattr(request, "request_id", None) or uuid.uuid4().hex
+        profile_id = f"{int(time.time() * 1000)}-{request_id.replace('.', '_')}"
+
+        started = time.perf_counter()
+        timeline = profiling.SqlTimeline(started)
+        profiler = profiling.create_profiler(mode)
+
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(timeline))
+            profiler.start()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.stop()
+        duration_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        metadata = {
+            "id": profile_id,
+            "mode": mode,
+            "method": request.method,
+            "path": request.get_full_path(),
+            "status_code": response.status_code,
+            "duration_ms": duration_ms,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "sql_count": len(timeline.queries),
+            "sql_ms": round(sum(q["duration_ms"] for q in timeline.queries), 3),
+            "sql": timeline.queries,
+        }
+        try:
+            profiling.save_profile(profile_id, profiler, metadata)
+        except OSError:
+            logger.exception("Profil kaydedilemedi: %s", profile_id)
+            return response
+
+        response["X-Profile-Id"] = profile_id
+        return response
@@ -0,0 +1,40 @@
+import random
+from contextlib import ExitStack
+from django.conf import settings
+from django.db import connections
+from core.query_plans import SlowQueryCollector, capture_plans
+
+
+class QueryPlanCaptureMiddleware:
+    """
+    Örneklenen isteklerde QUERY_PLAN_THRESHOLD_MS süresini aşan okuma sorgularının
+    EXPLAIN (ANALYZE, BUFFERS) planını yakalayıp QueryPlan tablosuna kaydeder.
+
+    Plan, yanıt üretildikten sonra ve sadece PostgreSQL bağlantılarında alınır.
+    Kabul kontrolünün içinde çalıştığı için EXPLAIN de sınıfın statement_timeout
+    sınırına tabidir. Örneklenmeyen isteklerde sadece bir rastgele sayı üretilir.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if (
+            not settings.QUERY_PLAN_CAPTURE_ENABLED
+            or random.random() >= settings.QUERY_PLAN_SAMPLE_RATE
+        ):
+            return self.get_response(request)
+
+        collector = SlowQueryCollector(settings.QUERY_PLAN_THRESHOLD_MS)
+        with ExitStack() as stack:
+            for alias in connections:
+                connection = connections[alias]
+                if connection.vendor == "postgresql":
+                    stack.enter_context(connection.execute_wrapper(collector))
+            response = self.get_response(request)
+
+        if collector.queries:
+            match = request.resolver_match
+            view_name = match.view_name if match else request.path_info
+            capture_plans(view_name, collector.queries)
+        return response
@@ -0,0 +1,32 @@
+import re
+import uuid
+from core.logs import log_context
+
+# Dışarıdan gelen request id'nin kabul edileceği biçim
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestContextMiddleware:
+    """
+    Her isteğe bir request id atar ve log bağlamını kurar.
+    İstemci veya proxy X-Request-ID gönderirse o değer kullanılır.
+    Request id yanıtın X-Request-ID başlığında geri döner.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_id = request.headers.get("X-Request-ID", "")
+        if not REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        request.request_id = request_id
+        token = log_context.set({"request_id": request_id, "request": request})
+        try:
+            response = self.get_response(request)
+        finally:
+            log_context.reset(token)
+
+        response["X-Request-ID"] = request_id
+        return response
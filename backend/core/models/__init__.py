@@ -1,6 +1,17 @@
-from .team import *
-from .personnel import *
-from .aircraft_model import *
-from .part_type import *
-from .part import *
-from .aircraft import *
+from .team import Team
+from .personnel import Personnel
+from .aircraft_model import AircraftModel
+from .part_type import PartType
+from .part import Part
+from .aircraft import Aircraft
+from .archived_aircraft import ArchivedAircraft
+from .archived_part import ArchivedPart
+from .archived_part_count import ArchivedPartCount
+from .idempotency_key import IdempotencyKey
+from .deletion_job import DeletionJob
+from .change_watermark import ChangeWatermark
+from .query_plan import QueryPlan
+from .part_stock_count import PartStockCount
+from .part_production_rollup import PartProductionRollup
+from .aircraft_assembly_rollup import AircraftAssemblyRollup
+from .part_team_sync_job import PartTeamSyncJob
@@ -11,6 +11,16 @@ class Aircraft(models.Model):
     assembled_by = models.ForeignKey(Personnel, on_delete=models.SET_NULL, null=True)
     assembled_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Seri numarası önek araması (LIKE 'x%') için
+            models.Index(
+                fields=["serial_number"],
+                name="aircraft_serial_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
 
     def __str__(self):
         return f"{self.model.name} - {self.serial_number}"
@@ -0,0 +1,25 @@
+from django.db import models
+from .aircraft_model import AircraftModel
+
+
+class AircraftAssemblyRollup(models.Model):
+    """
+    Saatlik dilimde uçak modeli başına monte edilen uçak sayısı.
+    Montaj işlemi sayacı aynı transaction içinde artırır.
+    """
+
+    # Dilimin başlangıcı (UTC, saat başı)
+    bucket = models.DateTimeField()
+    aircraft_model = models.ForeignKey(AircraftModel, on_delete=models.CASCADE)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["bucket", "aircraft_model"],
+                name="unique_aircraft_assembly_rollup",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.bucket:%Y-%m-%d %H:00} - {self.aircraft_model}: {self.count}"
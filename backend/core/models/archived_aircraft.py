@@ -0,0 +1,19 @@
+from django.db import models
+from .aircraft_model import AircraftModel
+from .personnel import Personnel
+
+
+class ArchivedAircraft(models.Model):
+    """
+    Arşive taşınmış uçak. Kimliği, canlı tablodaki uçağın kimliğiyle aynıdır.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    serial_number = models.CharField(max_length=100, unique=True)
+    model = models.ForeignKey(AircraftModel, on_delete=models.CASCADE)
+    assembled_by = models.ForeignKey(Personnel, on_delete=models.SET_NULL, null=True)
+    assembled_at = models.DateTimeField(db_index=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.serial_number} (arşiv)"
@@ -0,0 +1,41 @@
+from django.db import models
+from .part_type import PartType
+from .aircraft_model import AircraftModel
+from .personnel import Personnel
+from .archived_aircraft import ArchivedAircraft
+from .team import Team
+
+
+class ArchivedPart(models.Model):
+    """
+    Arşive taşınmış, bir uçakta kullanılmış parça. Kimliği, canlı tablodaki
+    parçanın kimliğiyle aynıdır.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    serial_number = models.CharField(max_length=100, unique=True)
+    type = models.ForeignKey(PartType, on_delete=models.CASCADE)
+    aircraft_model = models.ForeignKey(AircraftModel, on_delete=models.CASCADE)
+    produced_by = models.ForeignKey(Personnel, on_delete=models.SET_NULL, null=True)
+    used_in_aircraft = models.ForeignKey(
+        ArchivedAircraft, on_delete=models.CASCADE, related_name="parts"
+    )
+    created_at = models.DateTimeField(db_index=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    team = models.ForeignKey(
+        Team,
+        on_delete=models.PROTECT,
+        null=True,
+        related_name="archived_parts",
+        db_index=False,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["team", "created_at"], name="archivedpart_team_created_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.serial_number} (arşiv)"
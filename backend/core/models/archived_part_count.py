@@ -0,0 +1,25 @@
+from django.db import models
+from .part_type import PartType
+from .aircraft_model import AircraftModel
+
+
+class ArchivedPartCount(models.Model):
+    """
+    Uçak modeli ve parça tipi başına arşivlenmiş parça sayısı.
+    Stok raporu arşiv tablosunu taramadan toplamlara eklenebilsin diye tutulur.
+    """
+
+    aircraft_model = models.ForeignKey(AircraftModel, on_delete=models.CASCADE)
+    part_type = models.ForeignKey(PartType, on_delete=models.CASCADE)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["aircraft_model", "part_type"],
+                name="unique_archived_part_count",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.aircraft_model} - {self.part_type}: {self.count}"
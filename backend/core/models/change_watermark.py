@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class ChangeWatermark(models.Model):
+    """
+    Bir koleksiyonun (ör. parçalar, uçaklar) değişiklik sayacı.
+    Koleksiyona yazan her işlem, sayacı aynı transaction içinde artırır.
+    Liste yanıtlarının ETag'i bu sayaçtan üretilir.
+    """
+
+    name = models.CharField(max_length=50, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.version}"
@@ -0,0 +1,49 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class DeletionJob(models.Model):
+    """
+    Büyük bir uçak modeli veya parça tipinin bağlı kayıtlarıyla birlikte
+    arka planda, küçük parçalar halinde silinmesi işi.
+    Her parti ayrı transaction'da silindiği için iş kaldığı yerden devam edebilir.
+    """
+
+    TARGET_AIRCRAFT_MODEL = "aircraft_model"
+    TARGET_PART_TYPE = "part_type"
+    TARGET_CHOICES = [
+        (TARGET_AIRCRAFT_MODEL, "Uçak Modeli"),
+        (TARGET_PART_TYPE, "Parça Tipi"),
+    ]
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Bekliyor"),
+        (STATUS_RUNNING, "Çalışıyor"),
+        (STATUS_DONE, "Tamamlandı"),
+        (STATUS_FAILED, "Hata"),
+    ]
+
+    target_type = models.CharField(max_length=20, choices=TARGET_CHOICES)
+    target_id = models.BigIntegerField()
+    # Hedef silindikten sonra da görüntülenebilmesi için hedefin adı
+    target_repr = models.CharField(max_length=200)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True
+    )
+    # Başlangıçta tahmin edilen bağlı kayıt sayısı
+    estimated_total = models.PositiveBigIntegerField(default=0)
+    # Adım bazında silinen kayıt sayıları (ör. {"core.Part": 120000})
+    progress = models.JSONField(default=dict)
+    deleted_total = models.PositiveBigIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.get_target_type_display()} {self.target_repr} ({self.get_status_display()})"
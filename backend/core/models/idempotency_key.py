@@ -0,0 +1,34 @@
+from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class IdempotencyKey(models.Model):
+    """
+    Idempotency-Key başlığı ile gelen yazma isteğinin kaydı.
+    Aynı anahtarla tekrar gelen istek, view çalıştırılmadan saklanan yanıtla karşılanır.
+    status_code boşsa ilk istek hâlâ işlenmektedir. Kayıt anahtar ayrılırken
+    oluşturulduğu için created_at ayırma zamanıdır; IDEMPOTENCY_LEASE_SECONDS
+    içinde tamamlanmayan kayıt terk edilmiş sayılır.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    key = models.CharField(max_length=255)
+    # İstek metodu ve yolu (ör. "POST /api/v1/parts/")
+    endpoint = models.CharField(max_length=255)
+    # İstek gövdesinin özeti; aynı anahtarla farklı istek gönderilmesini yakalar
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"], name="unique_idempotency_key_per_user"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.key}"
@@ -2,6 +2,7 @@ from django.db import models
 from .part_type import PartType
 from .aircraft_model import AircraftModel
 from .personnel import Personnel
+from .team import Team
 
 
 class Part(models.Model):
@@ -17,6 +18,34 @@ class Part(models.Model):
         related_name="parts",
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Parçayı görebilen takım (type.allowed_team kopyası). Takım bazlı listeleme ve
+    # sayım core_parttype ile join yapmadan (team, created_at) indeksinden okunur.
+    # Tek başına team indeksi gereksizdir, bileşik indeks aynı işi görür.
+    team = models.ForeignKey(
+        Team,
+        on_delete=models.PROTECT,
+        null=True,
+        related_name="parts",
+        db_index=False,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["team", "created_at"], name="part_team_created_idx"),
+            # Seri numarası önek araması (LIKE 'x%') için
+            models.Index(
+                fields=["serial_number"],
+                name="part_serial_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Takım üretimde parça tipinin yetkili takımından alınır; tip değişirse
+        # team alanı da güncellenmelidir (bkz. PartAdmin.save_model)
+        if self.team_id is None and self.type_id is not None:
+            self.team_id = self.type.allowed_team_id
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.serial_number} ({self.type.name})"
@@ -0,0 +1,34 @@
+from django.db import models
+from .team import Team
+from .part_type import PartType
+
+
+class PartProductionRollup(models.Model):
+    """
+    Saatlik dilimde takım ve parça tipi başına üretilen parça sayısı.
+    Parça üreten işlem sayacı aynı transaction içinde artırır; üretim analizleri
+    parça tablosu taranmadan bu tablodan okunur.
+    """
+
+    # Dilimin başlangıcı (UTC, saat başı)
+    bucket = models.DateTimeField()
+    team = models.ForeignKey(Team, on_delete=models.CASCADE)
+    part_type = models.ForeignKey(PartType, on_delete=models.CASCADE)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["bucket", "team", "part_type"],
+                name="unique_part_production_rollup",
+            )
+        ]
+        indexes = [
+            # Takım bazlı tarih aralığı sorguları için
+            models.Index(
+                fields=["team", "bucket"], name="partproduction_team_bucket_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.bucket:%Y-%m-%d %H:00} - {self.team} - {self.part_type}: {self.count}"
@@ -0,0 +1,26 @@
+from django.db import models
+from .part_type import PartType
+from .aircraft_model import AircraftModel
+
+
+class PartStockCount(models.Model):
+    """
+    Uçak modeli ve parça tipi başına stokta (uçakta kullanılmayan) parça sayısı.
+    Parça ekleyen, silen, uçağa takan veya uçaktan çıkaran her işlem sayacı aynı
+    transaction içinde günceller; montaj kapasitesi parça tablosu taranmadan hesaplanır.
+    """
+
+    aircraft_model = models.ForeignKey(AircraftModel, on_delete=models.CASCADE)
+    part_type = models.ForeignKey(PartType, on_delete=models.CASCADE)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["aircraft_model", "part_type"],
+                name="unique_part_stock_count",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.aircraft_model} - {self.part_type}: {self.count}"
@@ -0,0 +1,40 @@
+from django.contrib.auth.models import User
+from django.db import models
+from .part_type import PartType
+
+
+class PartTeamSyncJob(models.Model):
+    """
+    Yetkili takımı değişen parça tipinin parçalarına (canlı ve arşiv) yeni
+    takımın arka planda, partiler halinde yazılması işi.
+    Güncelleme sadece takımı farklı olan parçaları seçtiği için iş kaldığı yerden devam edebilir.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Bekliyor"),
+        (STATUS_RUNNING, "Çalışıyor"),
+        (STATUS_DONE, "Tamamlandı"),
+        (STATUS_FAILED, "Hata"),
+    ]
+
+    part_type = models.ForeignKey(
+        PartType, on_delete=models.CASCADE, related_name="team_sync_jobs"
+    )
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True
+    )
+    # Başlangıçta takımı farklı olan parça sayısı
+    estimated_total = models.PositiveBigIntegerField(default=0)
+    updated_total = models.PositiveBigIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.part_type.name} takım eşitleme ({self.get_status_display()})"
@@ -0,0 +1,41 @@
+from django.db import models
+
+
+class QueryPlan(models.Model):
+    """
+    Bir view'ın çalıştırdığı sorgunun (fingerprint) belirli bir sürümde gözlenen planı.
+    Aynı sürümde aynı plan şekli tekrar yakalanırsa yeni kayıt açılmaz, mevcut kayıt güncellenir.
+    Sürümler arasında plan şeklinin veya maliyetin değişmesi query_plan_report ile raporlanır.
+    """
+
+    # View adı ve normalize edilmiş SQL'in özeti
+    fingerprint = models.CharField(max_length=32)
+    view_name = models.CharField(max_length=200)
+    # Parametreleri ve IN listeleri sadeleştirilmiş SQL
+    sql = models.TextField()
+    release = models.CharField(max_length=64)
+    # Plan ağacındaki düğüm tipleri, tablolar ve indekslerin özeti (satır/maliyet hariç)
+    plan_hash = models.CharField(max_length=32)
+    # Okunabilir plan şekli (ör. "Hash Join > Seq Scan core_part")
+    plan_shape = models.TextField()
+    plan = models.JSONField()
+    total_cost = models.FloatField()
+    # Son yakalamadaki sorgu ve EXPLAIN ANALYZE süreleri (ms)
+    duration_ms = models.FloatField()
+    execution_ms = models.FloatField()
+    shared_read_blocks = models.BigIntegerField(default=0)
+    samples = models.PositiveIntegerField(default=1)
+    first_seen_at = models.DateTimeField(auto_now_add=True)
+    last_seen_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["fingerprint", "release", "plan_hash"],
+                name="unique_query_plan_per_release",
+            )
+        ]
+        indexes = [models.Index(fields=["release", "fingerprint"])]
+
+    def __str__(self):
+        return f"{self.view_name} {self.fingerprint} ({self.release})"
@@ -0,0 +1,133 @@
+import traceback
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from core.models import ArchivedPart, Part, PartTeamSyncJob, PartType
+from core.rollups import adjust_rollups
+from core.watermarks import PARTS, bump
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def sync_part_teams(part_type_id=None, batch_size=None, report=None):
+    """
+    Parçaların (canlı ve arşiv) team alanını parça tipinin yetkili takımıyla eşitler.
+    Güncelleme kimlik sırasıyla partiler halinde yapılır; her parti ayrı transaction'dır.
+    Güncellenen parça sayısını döndürür.
+    """
+    batch_size = batch_size or DEFAULT_BATCH_SIZE
+    part_types = PartType.objects.order_by("pk").only("pk", "allowed_team_id")
+    if part_type_id is not None:
+        part_types = part_types.filter(pk=part_type_id)
+
+    total = 0
+    for part_type in part_types:
+        for model in (Part, ArchivedPart):
+            # team boş olan (henüz doldurulmamış) kayıtlar da seçilir
+            stale = model.objects.filter(type_id=part_type.pk).exclude(
+                team_id=part_type.allowed_team_id
+            )
+            last_pk = 0
+            while True:
+                ids = list(
+                    stale.filter(pk__gt=last_pk)
+                    .order_by("pk")
+                    .values_list("pk", flat=True)[:batch_size]
+                )
+                if not ids:
+                    break
+                batch = model.objects.filter(pk__in=ids)
+                with transaction.atomic():
+                    # Üretim sayaçları takıma göre tutulur; parçalar eski takımdan
+                    # düşülüp yeni takıma eklenir
+                    adjust_rollups(batch, sign=-1)
+                    updated = batch.update(team_id=part_type.allowed_team_id)
+                    adjust_rollups(batch)
+                    bump(PARTS)
+                total += updated
+                last_pk = ids[-1]
+                if report is not None:
+                    report(model, part_type, updated)
+    return total
+
+
+def enqueue_team_sync(part_type, user=None):
+    """
+    Parça tipi için takım eşitleme işi oluşturur. Aynı tipe ait bekleyen bir iş
+    varsa onu döndürür; çalışan iş yeni takımı görmemiş olabileceği için beklenmez.
+    """
+    pending = PartTeamSyncJob.objects.filter(
+        part_type=part_type, status=PartTeamSyncJob.STATUS_PENDING
+    ).first()
+    if pending is not None:
+        return pending
+    return PartTeamSyncJob.objects.create(part_type=part_type, created_by=user)
+
+
+def claim_next_sync_job():
+    """
+    Sıradaki bekleyen işi veya takılı kalmış (uzun süredir ilerlemeyen) işi alır.
+    Birden fazla worker aynı işi almaz.
+    """
+    stale_before = timezone.now() - timedelta(
+        seconds=settings.PART_TEAM_JOB_STALE_SECONDS
+    )
+    with transaction.atomic():
+        job = (
+            PartTeamSyncJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=PartTeamSyncJob.STATUS_PENDING)
+                | Q(status=PartTeamSyncJob.STATUS_RUNNING, updated_at__lt=stale_before)
+            )
+            .order_by("id")
+            .first()
+        )
+        if job is not None:
+            job.status = PartTeamSyncJob.STATUS_RUNNING
+            job.save(update_fields=["status", "updated_at"])
+    return job
+
+
+def run_sync_job(job, batch_size=None, report=None):
+    """
+    Takım eşitleme işini partiler halinde çalıştırır ve her partiden sonra
+    ilerlemeyi kaydeder.
+    """
+    if not job.estimated_total:
+        allowed_team_id = (
+            PartType.objects.filter(pk=job.part_type_id)
+            .values_list("allowed_team_id", flat=True)
+            .get()
+        )
+        job.estimated_total = sum(
+            model.objects.filter(type_id=job.part_type_id)
+            .exclude(team_id=allowed_team_id)
+            .count()
+            for model in (Part, ArchivedPart)
+        )
+    job.status = PartTeamSyncJob.STATUS_RUNNING
+    job.error = ""
+    job.save(update_fields=["estimated_total", "status", "error", "updated_at"])
+
+    def progress(model, part_type, updated):
+        job.updated_total += updated
+        job.save(update_fields=["updated_total", "updated_at"])
+        if report is not None:
+            report(job, model)
+
+    try:
+        sync_part_teams(
+            part_type_id=job.part_type_id, batch_size=batch_size, report=progress
+        )
+    except Exception:
+        job.status = PartTeamSyncJob.STATUS_FAILED
+        job.error = traceback.format_exc()
+        job.save(update_fields=["status", "error", "updated_at"])
+        raise
+
+    job.status = PartTeamSyncJob.STATUS_DONE
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at", "updated_at"])
+    return job
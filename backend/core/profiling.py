@@ -0,0 +1,213 @@
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from django.conf import settings
+from django.core import signing
+
+# İmzalı profil token'larının tuzu
+TOKEN_SALT = "core.profiling"
+# Profil kimliklerinin (dosya adlarının) biçimi
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]+-[A-Za-z0-9_-]{1,64}$")
+
+MODE_SAMPLING = "sampling"
+MODE_CPROFILE = "cprofile"
+MODES = (MODE_SAMPLING, MODE_CPROFILE)
+
+# Profil türüne göre indirilen dosyanın uzantısı
+PROFILE_EXTENSIONS = {MODE_SAMPLING: ".folded", MODE_CPROFILE: ".prof"}
+
+
+def create_token(mode=MODE_SAMPLING):
+    """
+    X-Profile başlığında gönderilecek imzalı token üretir.
+    """
+    return signing.dumps({"mode": mode}, salt=TOKEN_SALT)
+
+
+def read_token(token):
+    """
+    Token geçerliyse profil türünü, değilse None döndürür.
+    """
+    try:
+        data = signing.loads(
+            token, salt=TOKEN_SALT, max_age=settings.PROFILING_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:
+        return None
+    mode = data.get("mode")
+    return mode if mode in MODES else None
+
+
+# Örnekleyici her örnekte yığındaki tüm çerçeveleri etiketler; etiketler kod nesnesi
+# başına bir kez üretilir. Önbellek sınırlıdır, dinamik üretilen kod nesneleri
+# (ör. exec/lambda) belleği büyütmez.
+@lru_cache(maxsize=4096)
+def _frame_label(code):
+    filename = code.co_filename
+    marker = "site-packages" + os.sep
+    if marker in filename:
+        filename = filename.split(marker, 1)[1]
+    elif filename.startswith(str(settings.BASE_DIR)):
+        filename = os.path.relpath(filename, settings.BASE_DIR)
+    # Folded formatta ";" çerçeve ayracıdır
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class StackSampler:
+    """
+    Hedef thread'in çağrı yığınını belirli aralıklarla örnekleyen istatistiksel profiler.
+    Sonuç flamegraph.pl / speedscope ile açılabilen "folded stacks" formatındadır.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.samples = Counter()
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="profiling-sampler", daemon=True
+        )
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.samples.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+class CProfiler:
+    """
+    cProfile tabanlı deterministik profiler. Sonuç pstats (.prof) formatındadır;
+    snakeviz veya flameprof ile görselleştirilebilir.
+    """
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def dump(self, path):
+        self.profile.dump_stats(path)
+
+
+def create_profiler(mode):
+    if mode == MODE_CPROFILE:
+        return CProfiler()
+    return StackSampler(settings.PROFILING_SAMPLE_INTERVAL)
+
+
+class SqlTimeline:
+    """
+    İstek boyunca çalışan SQL sorgularını başlangıç zamanı ve süresiyle kaydeden execute wrapper.
+    """
+
+    def __init__(self, started):
+        self.started = started
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            end = time.perf_counter()
+            self.queries.append(
+                {
+                    "alias": context["connection"].alias,
+                    "start_ms": round((start - self.started) * 1000, 3),
+                    "duration_ms": round((end - start) * 1000, 3),
+                    "sql": sql[: settings.PROFILING_SQL_MAX_LENGTH],
+                }
+            )
+
+
+def profile_dir():
+    path = Path(settings.PROFILING_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def save_profile(profile_id, profiler, metadata):
+    """
+    Profil çıktısını ve özet bilgisini diske yazar, eski profilleri siler.
+    """
+    directory = profile_dir()
+    profiler.dump(directory / f"{profile_id}{PROFILE_EXTENSIONS[metadata['mode']]}")
+    with open(directory / f"{profile_id}.json", "w", encoding="utf-8") as file:
+        json.dump(metadata, file, ensure_ascii=False)
+    prune_profiles()
+
+
+def prune_profiles():
+    """
+    PROFILING_MAX_PROFILES'tan fazla profil varsa en eskilerini siler.
+    """
+    directory = profile_dir()
+    metadata_files = sorted(directory.glob("*.json"), key=lambda path: path.name)
+    for path in metadata_files[: -settings.PROFILING_MAX_PROFILES or None]:
+        for extension in (".json", *PROFILE_EXTENSIONS.values()):
+            path.with_suffix(extension).unlink(missing_ok=True)
+
+
+def list_profiles():
+    """
+    Kayıtlı profillerin özetlerini yeniden eskiye döndürür (SQL zaman çizelgesi hariç).
+    """
+    profiles = []
+    for path in sorted(profile_dir().glob("*.json"), reverse=True):
+        with open(path, encoding="utf-8") as file:
+            metadata = json.load(file)
+        metadata.pop("sql", None)
+        profiles.append(metadata)
+    return profiles
+
+
+def get_profile(profile_id):
+    """
+    Profilin özetini SQL zaman çizelgesiyle birlikte döndürür, yoksa None.
+    """
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = profile_dir() / f"{profile_id}.json"
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def get_profile_file(profile_id):
+    """
+    Profilin indirilebilir dosyasının yolunu döndürür, yoksa None.
+    """
+    metadata = get_profile(profile_id)
+    if metadata is None:
+        return None
+    path = profile_dir() / f"{profile_id}{PROFILE_EXTENSIONS[metadata['mode']]}"
+    return path if path.exists() else None
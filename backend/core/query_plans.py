@@ -0,0 +1,151 @@
+import hashlib
+import json
+import logging
+import re
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+# Plan şekline dahil edilen düğüm alanları; satır sayısı ve maliyet gibi
+# veriyle değişen alanlar şekli değiştirmez
+_SHAPE_KEYS = ("Join Type", "Relation Name", "Index Name", "Strategy")
+
+
+def normalize_sql(sql):
+    """
+    Sorgudaki parametreleri, sabitleri ve IN listelerini sadeleştirir.
+    Aynı sorgunun farklı parametrelerle çalışması aynı metni üretir.
+    """
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def fingerprint(view_name, sql):
+    """
+    View adı ve normalize edilmiş SQL'den sorgunun kimliğini üretir.
+    """
+    return hashlib.sha1(f"{view_name}\n{sql}".encode()).hexdigest()[:16]
+
+
+def plan_shape(node, depth=0):
+    """
+    EXPLAIN (FORMAT JSON) plan ağacını satır/maliyet içermeyen, girintili bir metne çevirir.
+    """
+    label = " ".join(
+        [node["Node Type"]] + [str(node[key]) for key in _SHAPE_KEYS if key in node]
+    )
+    lines = ["  " * depth + label]
+    for child in node.get("Plans", []):
+        lines.append(plan_shape(child, depth + 1))
+    return "\n".join(lines)
+
+
+def _is_explainable(sql):
+    # EXPLAIN ANALYZE sorguyu gerçekten çalıştırır; sadece kilit almayan okumalar yakalanır
+    statement = sql.lstrip().upper()
+    return statement.startswith("SELECT") and " FOR UPDATE" not in statement
+
+
+class SlowQueryCollector:
+    """
+    İstek boyunca eşik süresini aşan okuma sorgularını toplayan execute wrapper.
+    """
+
+    def __init__(self, threshold_ms):
+        self.threshold_ms = threshold_ms
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            if duration_ms >= self.threshold_ms and not many and _is_explainable(sql):
+                self.queries.append(
+                    (duration_ms, context["connection"].alias, sql, params)
+                )
+
+
+def explain(alias, sql, params):
+    """
+    Sorgunun EXPLAIN (ANALYZE, BUFFERS) çıktısını JSON olarak döndürür.
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", params)
+        result = cursor.fetchone()[0]
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]
+
+
+def record_plan(view_name, sql, duration_ms, explained, release=None):
+    """
+    Planı fingerprint, sürüm ve plan şekline göre kaydeder.
+    Aynı plan daha önce görüldüyse örnek sayısı ve son değerler güncellenir.
+    """
+    from core.models import QueryPlan
+
+    release = release or settings.QUERY_PLAN_RELEASE
+    normalized = normalize_sql(sql)
+    root = explained["Plan"]
+    shape = plan_shape(root)
+    values = {
+        "plan": explained,
+        "total_cost": root["Total Cost"],
+        "duration_ms": round(duration_ms, 3),
+        "execution_ms": explained.get("Execution Time", 0.0),
+        "shared_read_blocks": root.get("Shared Read Blocks", 0),
+    }
+    plan, created = QueryPlan.objects.get_or_create(
+        fingerprint=fingerprint(view_name, normalized),
+        release=release,
+        plan_hash=hashlib.sha1(shape.encode()).hexdigest()[:16],
+        defaults={
+            "view_name": view_name[:200],
+            "sql": normalized,
+            "plan_shape": shape,
+            **values,
+        },
+    )
+    if not created:
+        QueryPlan.objects.filter(pk=plan.pk).update(
+            samples=F("samples") + 1, last_seen_at=timezone.now(), **values
+        )
+    return plan
+
+
+def capture_plans(view_name, queries):
+    """
+    Toplanan yavaş sorgulardan en yavaşlarının planını yakalar.
+    Aynı fingerprint için QUERY_PLAN_CAPTURE_INTERVAL süresinde en fazla bir plan alınır.
+    """
+    queries = sorted(queries, key=lambda query: query[0], reverse=True)
+    for duration_ms, alias, sql, params in queries[
+        : settings.QUERY_PLAN_MAX_PER_REQUEST
+    ]:
+        key = fingerprint(view_name, normalize_sql(sql))
+        if not cache.add(
+            f"query_plans:{settings.QUERY_PLAN_RELEASE}:{key}",
+            1,
+            settings.QUERY_PLAN_CAPTURE_INTERVAL,
+        ):
+            continue
+        try:
+            explained = explain(alias, sql, params)
+            record_plan(view_name, sql, duration_ms, explained)
+        except DatabaseError:
+            logger.warning("Sorgu planı yakalanamadı: %s %s", view_name, key)
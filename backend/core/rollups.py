@@ -0,0 +1,223 @@
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Greatest, TruncDay, TruncHour
+from core.models import (
+    Aircraft,
+    AircraftAssemblyRollup,
+    ArchivedAircraft,
+    ArchivedPart,
+    Part,
+    PartProductionRollup,
+)
+
+INTERVAL_HOUR = "hour"
+INTERVAL_DAY = "day"
+INTERVALS = {INTERVAL_HOUR: TruncHour, INTERVAL_DAY: TruncDay}
+INTERVAL_LENGTHS = {INTERVAL_HOUR: timedelta(hours=1), INTERVAL_DAY: timedelta(days=1)}
+
+# Sayaç tablosu ve dilim dışındaki gruplama alanları
+PART_FIELDS = ("team_id", "part_type_id")
+AIRCRAFT_FIELDS = ("aircraft_model_id",)
+
+
+def hour_bucket(value):
+    """
+    Zamanın içinde bulunduğu saatlik dilimin (UTC) başlangıcını döndürür.
+    """
+    return value.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _increment(model, fields, counts):
+    """
+    (dilim, *alanlar) anahtarlı sayaçları artırır; satır yoksa oluşturur.
+    Satırlar kilitlenme (deadlock) olmaması için hep aynı sırayla güncellenir.
+    """
+    for key, count in sorted(counts.items()):
+        lookup = dict(zip(("bucket", *fields), key))
+        if model.objects.filter(**lookup).update(count=F("count") + count):
+            continue
+        try:
+            with transaction.atomic():
+                model.objects.create(**lookup, count=count)
+        except IntegrityError:
+            model.objects.filter(**lookup).update(count=F("count") + count)
+
+
+def _decrement(model, fields, counts):
+    """
+    (dilim, *alanlar) anahtarlı sayaçları azaltır; sayaç sıfırın altına inmez.
+    """
+    for key, count in sorted(counts.items()):
+        lookup = dict(zip(("bucket", *fields), key))
+        model.objects.filter(**lookup).update(count=Greatest(F("count") - count, 0))
+
+
+def record_parts_produced(parts):
+    """
+    Üretilen parçaları saatlik üretim sayaçlarına ekler.
+    Parçayı oluşturan işlemle aynı transaction içinde çağrılmalıdır.
+    """
+    _increment(
+        PartProductionRollup,
+        PART_FIELDS,
+        Counter(
+            (hour_bucket(part.created_at), part.team_id, part.type_id) for part in parts
+        ),
+    )
+
+
+def record_aircraft_assembled(aircraft_list):
+    """
+    Monte edilen uçakları saatlik montaj sayaçlarına ekler.
+    Uçağı oluşturan işlemle aynı transaction içinde çağrılmalıdır.
+    """
+    _increment(
+        AircraftAssemblyRollup,
+        AIRCRAFT_FIELDS,
+        Counter(
+            (hour_bucket(aircraft.assembled_at), aircraft.model_id)
+            for aircraft in aircraft_list
+        ),
+    )
+
+
+def _hourly_counts(querysets, time_field):
+    counts = Counter()
+    for queryset, source_fields in querysets:
+        rows = (
+            queryset.annotate(hour=TruncHour(time_field, tzinfo=dt_timezone.utc))
+            .values("hour", *source_fields)
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+        for row in rows:
+            counts[(row["hour"], *(row[name] for name in source_fields))] += row[
+                "count"
+            ]
+    return counts
+
+
+# Sayaçlara yansıyan modeller: (sayaç tablosu, sayaç alanları, zaman alanı, kaynak alanları)
+_ROLLUP_SOURCES = {
+    Part: (PartProductionRollup, PART_FIELDS, "created_at", ("team_id", "type_id")),
+    ArchivedPart: (
+        PartProductionRollup,
+        PART_FIELDS,
+        "created_at",
+        ("team_id", "type_id"),
+    ),
+    Aircraft: (AircraftAssemblyRollup, AIRCRAFT_FIELDS, "assembled_at", ("model_id",)),
+    ArchivedAircraft: (
+        AircraftAssemblyRollup,
+        AIRCRAFT_FIELDS,
+        "assembled_at",
+        ("model_id",),
+    ),
+}
+
+
+def adjust_rollups(queryset, sign=1):
+    """
+    Queryset'teki parça veya uçakları (arşiv dahil) saatlik sayaçlara ekler
+    (sign=1) ya da sayaçlardan düşer (sign=-1). Kayıtlar silinmeden veya
+    değiştirilmeden önce -1, değiştirildikten sonra +1 ile aynı transaction içinde
+    çağrılmalıdır; böylece sayaçlar rebuild_rollups sonucuyla aynı kalır.
+    Diğer modeller için hiçbir şey yapmaz.
+    """
+    source = _ROLLUP_SOURCES.get(queryset.model)
+    if source is None:
+        return
+    model, fields, time_field, source_fields = source
+    counts = _hourly_counts([(queryset, source_fields)], time_field)
+    if model is PartProductionRollup:
+        # Takımı henüz doldurulmamış parçalar sayaçlarda yer almaz
+        counts = Counter({key: n for key, n in counts.items() if key[1] is not None})
+    if sign > 0:
+        _increment(model, fields, counts)
+    else:
+        _decrement(model, fields, counts)
+
+
+def rebuild_rollups(since=None):
+    """
+    Saatlik sayaçları parça ve uçak tablolarından (arşiv dahil) yeniden hesaplar.
+    since verilirse sadece o zamandan sonraki dilimler yeniden yazılır.
+    Silinen ve değiştirilen kayıtlar artımlı sayaçlardan da düşüldüğü için
+    (adjust_rollups) sonuç, tutarlı sayaçlarla aynıdır; sayaçlar kayıtların
+    üretim geçmişini değil, tablolardaki güncel halini yansıtır.
+    Yazılan sayaç satırı sayısını döndürür.
+    """
+    if since is not None:
+        since = hour_bucket(since)
+    time_filter = {} if since is None else {"created_at__gte": since}
+    assembled_filter = {} if since is None else {"assembled_at__gte": since}
+    bucket_filter = {} if since is None else {"bucket__gte": since}
+
+    part_counts = _hourly_counts(
+        [
+            (Part.objects.filter(**time_filter), ("team_id", "type_id")),
+            (ArchivedPart.objects.filter(**time_filter), ("team_id", "type_id")),
+        ],
+        "created_at",
+    )
+    aircraft_counts = _hourly_counts(
+        [
+            (Aircraft.objects.filter(**assembled_filter), ("model_id",)),
+            (ArchivedAircraft.objects.filter(**assembled_filter), ("model_id",)),
+        ],
+        "assembled_at",
+    )
+
+    with transaction.atomic():
+        PartProductionRollup.objects.filter(**bucket_filter).delete()
+        PartProductionRollup.objects.bulk_create(
+            PartProductionRollup(
+                bucket=bucket, team_id=team_id, part_type_id=part_type_id, count=count
+            )
+            # Takımı henüz doldurulmamış parçalar (backfill_part_teams) atlanır
+            for (bucket, team_id, part_type_id), count in part_counts.items()
+            if team_id is not None
+        )
+        AircraftAssemblyRollup.objects.filter(**bucket_filter).delete()
+        AircraftAssemblyRollup.objects.bulk_create(
+            AircraftAssemblyRollup(
+                bucket=bucket, aircraft_model_id=aircraft_model_id, count=count
+            )
+            for (bucket, aircraft_model_id), count in aircraft_counts.items()
+        )
+    return len(part_counts) + len(aircraft_counts)
+
+
+def date_range_bounds(start, end):
+    """
+    Başlangıç ve bitiş tarihlerini (ikisi de dahil) UTC zaman aralığına çevirir.
+    """
+    return (
+        datetime.combine(start, time.min, tzinfo=dt_timezone.utc),
+        datetime.combine(end + timedelta(days=1), time.min, tzinfo=dt_timezone.utc),
+    )
+
+
+def bucket_count(start, end, interval):
+    """
+    Tarih aralığındaki dilim sayısını döndürür.
+    """
+    lower, upper = date_range_bounds(start, end)
+    return int((upper - lower) / INTERVAL_LENGTHS[interval])
+
+
+def rollup_series(queryset, start, end, interval, fields):
+    """
+    Sayaçları verilen aralıkta dilime ve alanlara göre toplar.
+    Sorgu süresi parça sayısına değil, aralıktaki sayaç satırı sayısına bağlıdır.
+    """
+    lower, upper = date_range_bounds(start, end)
+    return list(
+        queryset.filter(bucket__gte=lower, bucket__lt=upper)
+        .annotate(period=INTERVALS[interval]("bucket", tzinfo=dt_timezone.utc))
+        .values("period", *fields)
+        .annotate(count=Sum("count"))
+        .order_by("period", *fields)
+    )
@@ -0,0 +1,131 @@
+import gzip
+import hashlib
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+from django.conf import settings
+
+# Diskte ve bellekte tutulan, sıkıştırılmış ve ETag'li şema çıktısı
+SchemaArtifact = namedtuple("SchemaArtifact", ["version", "body", "gzipped", "etag"])
+
+_artifact = None
+_schema_view = None
+_lock = threading.Lock()
+
+
+def api_info():
+    """
+    API'nin Swagger başlık bilgisini döndürür.
+    """
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title="Uçak Üretim API",
+        default_version="v1",
+        description="JWT tabanlı uçak üretim sistemi",
+    )
+
+
+def get_schema_view():
+    """
+    drf_yasg şema view sınıfını ilk kullanımda oluşturur.
+    drf_yasg.views ağır bağımlılıklar (jsonschema, swagger_spec_validator) getirdiği
+    için uygulama açılışında import edilmez.
+    """
+    global _schema_view
+
+    if _schema_view is None:
+        from drf_yasg.views import get_schema_view as build_schema_view
+
+        _schema_view = build_schema_view(api_info(), public=True)
+    return _schema_view
+
+
+def schema_version():
+    """
+    Şemanın üretildiği kod sürümünü döndürür.
+    APP_VERSION tanımlıysa o kullanılır; değilse API kodunun içeriğinden bir özet üretilir.
+    """
+    version = os.getenv("APP_VERSION")
+    if version:
+        return version
+
+    digest = hashlib.sha256()
+    roots = [Path(settings.BASE_DIR) / "core", Path(settings.BASE_DIR) / "config"]
+    for root in roots:
+        for path in sorted(root.rglob("*.py")):
+            if "migrations" in path.parts:
+                continue
+            digest.update(str(path.relative_to(settings.BASE_DIR)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def generate_schema():
+    """
+    OpenAPI şemasını drf_yasg ile üretir ve JSON olarak döndürür.
+    """
+    from drf_yasg.codecs import OpenAPICodecJson
+
+    generator = get_schema_view().generator_class(
+        info=api_info(), url=settings.SWAGGER_SETTINGS.get("URL")
+    )
+    schema = generator.get_schema(request=None, public=True)
+    return OpenAPICodecJson(validators=[]).encode(schema)
+
+
+def _artifact_path(version):
+    return Path(settings.OPENAPI_SCHEMA_DIR) / f"openapi-{version}.json"
+
+
+def _build_artifact(version, body):
+    gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+    etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+    return SchemaArtifact(version, body, gzipped, etag)
+
+
+def write_schema_artifact(version=None):
+    """
+    Şemayı üretir; JSON ve gzip hâlini sürüm adıyla diske yazar.
+    Eski sürümlere ait dosyalar silinir.
+    """
+    version = version or schema_version()
+    body = generate_schema()
+    artifact = _build_artifact(version, body)
+
+    path = _artifact_path(version)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for target, content in ((path, body), (Path(f"{path}.gz"), artifact.gzipped)):
+        # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz
+        tmp = Path(f"{target}.{os.getpid()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, target)
+
+    for old in path.parent.glob("openapi-*.json*"):
+        if not old.name.startswith(path.name):
+            old.unlink(missing_ok=True)
+
+    return artifact
+
+
+def get_schema_artifact():
+    """
+    Geçerli kod sürümünün şemasını döndürür.
+    Önce bellekteki kopyaya, sonra diske bakılır; ikisi de yoksa şema ilk istekte
+    bir kez üretilip diske yazılır.
+    """
+    global _artifact
+
+    if _artifact is not None:
+        return _artifact
+
+    with _lock:
+        if _artifact is None:
+            version = schema_version()
+            path = _artifact_path(version)
+            if path.exists():
+                _artifact = _build_artifact(version, path.read_bytes())
+            else:
+                _artifact = write_schema_artifact(version)
+    return _artifact
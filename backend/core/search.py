@@ -0,0 +1,162 @@
+import heapq
+import logging
+from functools import reduce
+from operator import or_
+from django.conf import settings
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.contrib.postgres.search import TrigramWordDistance
+from django.db import connections
+from django.db.models import F, Q
+from core.models import Aircraft, Part, Personnel
+
+logger = logging.getLogger(__name__)
+
+# pg_trgm.word_similarity_threshold varsayılanı; yedek (fallback) arama da aynı
+# eşiği kullanır
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+# Aranan alanlar için trigram indeksleri (indeks adı, tablo, sütun). GiST indeksi
+# eşleşmeleri benzerliğe göre sıralı döndürebildiği (KNN) için ilk N sonuç, aday
+# sayısından bağımsız olarak indeksten okunur.
+TRIGRAM_INDEXES = (
+    ("part_serial_trgm_idx", "core_part", "serial_number"),
+    ("aircraft_serial_trgm_idx", "core_aircraft", "serial_number"),
+    ("personnel_name_trgm_idx", "core_personnel", "full_name"),
+)
+
+
+def create_trigram_indexes(using):
+    """
+    PostgreSQL'de pg_trgm eklentisini ve arama indekslerini oluşturur (yoksa).
+    Migration dosyaları depoda tutulmadığı için post_migrate sinyalinden çağrılır.
+    İndeksler tabloyu kilitlememek için CONCURRENTLY ile oluşturulur.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, table, column in TRIGRAM_INDEXES:
+            cursor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gist ({column} gist_trgm_ops)"
+            )
+    logger.info("Arama için trigram indeksleri hazır: %s", using)
+
+
+def _words(text):
+    return "".join(char if char.isalnum() else " " for char in text.lower()).split()
+
+
+def trigrams(text):
+    """
+    Metnin trigramlarını pg_trgm ile aynı kurallarla üretir: küçük harfe çevrilir,
+    harf/rakam dışı karakterlerden kelimelere bölünür, her kelime başına iki ve
+    sonuna bir boşluk eklenir.
+    """
+    result = set()
+    for word in _words(text):
+        padded = f"  {word} "
+        result.update(padded[index : index + 3] for index in range(len(padded) - 2))
+    return result
+
+
+def word_similarity(query_trigrams, text):
+    """
+    Sorgu trigramlarının metinde bulunan oranı. pg_trgm word_similarity'nin
+    yaklaşığıdır; sorgu metnin bir parçasıyla tam eşleşirse 1 olur.
+    """
+    if not query_trigrams:
+        return 0.0
+    return len(query_trigrams & trigrams(text)) / len(query_trigrams)
+
+
+def _fallback_terms(query):
+    """
+    Yedek aramada aday satırları bulmak için kullanılan alt dizgiler: kelime içi
+    trigramlar, üç harften kısa kelimeler için kelimenin kendisi.
+    """
+    terms = {trigram for trigram in trigrams(query) if " " not in trigram}
+    terms.update(word for word in _words(query) if len(word) < 3)
+    return terms
+
+
+def _search_postgresql(queryset, field, query, limit):
+    return [
+        (1 - distance, pk, text)
+        for pk, text, distance in queryset.filter(TrigramWordSimilar(F(field), query))
+        .annotate(distance=TrigramWordDistance(query, field))
+        .order_by("distance", field)
+        .values_list("pk", field, "distance")[:limit]
+    ]
+
+
+def _search_fallback(queryset, field, query, limit):
+    """
+    Trigram indeksi olmayan veritabanları (SQLite) için taşınabilir arama:
+    sorgunun bir trigramını içeren satırlar okunur ve Python'da puanlanır.
+    En fazla SEARCH_FALLBACK_MAX_CANDIDATES aday incelenir.
+    """
+    terms = _fallback_terms(query)
+    if not terms:
+        return []
+    query_trigrams = trigrams(query)
+    candidates = queryset.filter(
+        reduce(or_, (Q(**{f"{field}__icontains": term}) for term in terms))
+    ).values_list("pk", field)[: settings.SEARCH_FALLBACK_MAX_CANDIDATES]
+
+    scored = (
+        (word_similarity(query_trigrams, text), pk, text) for pk, text in candidates
+    )
+    matches = [row for row in scored if row[0] >= WORD_SIMILARITY_THRESHOLD]
+    return heapq.nsmallest(limit, matches, key=lambda row: (-row[0], row[2]))
+
+
+def search_field(queryset, field, query, limit):
+    """
+    Queryset'te field alanı sorguya benzeyen en fazla limit kaydı
+    (puan, kimlik, metin) olarak, en benzerden başlayarak döndürür.
+    """
+    if connections[queryset.db].vendor == "postgresql":
+        return _search_postgresql(queryset, field, query, limit)
+    return _search_fallback(queryset, field, query, limit)
+
+
+def search_sources(personnel):
+    """
+    Personelin görebileceği kayıtlara göre (sonuç tipi, queryset, alan) listesi.
+    Montaj takımı her şeyi görür; diğer takımlar sadece kendi parçalarını ve
+    takım arkadaşlarını görür, uçakları göremez.
+    """
+    if personnel.team.responsibility.lower() == "montaj":
+        return [
+            ("part", Part.objects.all(), "serial_number"),
+            ("aircraft", Aircraft.objects.all(), "serial_number"),
+            ("personnel", Personnel.objects.all(), "full_name"),
+        ]
+    return [
+        ("part", Part.objects.filter(team_id=personnel.team_id), "serial_number"),
+        ("personnel", Personnel.objects.filter(team_id=personnel.team_id), "full_name"),
+    ]
+
+
+def search(personnel, query, limit):
+    """
+    Parça ve uçak seri numaralarında ve personel adlarında arama yapar; sonuçları
+    tipten bağımsız olarak benzerliğe göre sıralı döndürür. Tam eşleşme ve önek
+    eşleşmesi aynı benzerlikteki diğer sonuçların önüne geçer.
+    """
+    query = query.strip()
+    lowered = query.lower()
+    results = []
+    for kind, queryset, field in search_sources(personnel):
+        for score, pk, text in search_field(queryset, field, query, limit):
+            results.append(
+                {"type": kind, "id": pk, "text": text, "score": round(score, 3)}
+            )
+
+    def rank(result):
+        text = result["text"].lower()
+        return (-result["score"], text != lowered, not text.startswith(lowered), text)
+
+    return sorted(results, key=rank)[:limit]
@@ -1,13 +1,14 @@
 from rest_framework import serializers
-from core.models import Part
+from core.models import ArchivedAircraft, Part
 from core.models.aircraft import Aircraft
 from django.db import transaction
 from core.serializers.aircraft_model import AircraftModelSerializer
 from core.serializers.personnel import PersonnelSerializer
 from core.serializers.part import PartMinimalSerializer
+from core.serializers.mixins import ExpandableFieldsMixin
 
 
-class AircraftSerializer(serializers.ModelSerializer):
+class AircraftSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     parts = serializers.ListField(
         child=serializers.CharField(),
         write_only=True,
@@ -45,6 +46,20 @@ class AircraftSerializer(serializers.ModelSerializer):
             "parts",
         ]
         read_only_fields = ["id", "assembled_by", "assembled_at"]
+        # İç içe dönebilen ilişkiler ve ihtiyaç duydukları join'ler
+        expandable = {"model": ("model",), "assembled_by": ("assembled_by",)}
+
+    def validate_serial_number(self, value):
+        # Arşive taşınan uçaklar canlı tablodan silindiği için arşiv tablosu da kontrol edilir
+        if Aircraft.objects.filter(serial_number=value).exists():
+            raise serializers.ValidationError(
+                self.fields["serial_number"].error_messages["unique"]
+            )
+        if ArchivedAircraft.objects.filter(serial_number=value).exists():
+            raise serializers.ValidationError(
+                "Bu seri numarasına sahip arşivlenmiş bir uçak mevcut."
+            )
+        return value
 
     def validate(self, data):
         if "model" not in data:
@@ -103,7 +118,7 @@ class AircraftSerializer(serializers.ModelSerializer):
             return aircraft
 
 
-class AircraftDetailSerializer(serializers.ModelSerializer):
+class AircraftDetailSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     parts = PartMinimalSerializer(many=True, read_only=True)
     model = AircraftModelSerializer(read_only=True)
     assembled_by = PersonnelSerializer(read_only=True)
@@ -119,3 +134,30 @@ class AircraftDetailSerializer(serializers.ModelSerializer):
             "parts",
         ]
         read_only_fields = fields
+        expandable = AircraftSerializer.Meta.expandable
+
+
+class AircraftDisassembleSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        default=list,
+        max_length=1000,
+        help_text="Sökülecek uçakların ID listesi",
+    )
+    serial_numbers = serializers.ListField(
+        child=serializers.CharField(max_length=100),
+        required=False,
+        default=list,
+        max_length=1000,
+        help_text="Sökülecek uçakların seri numarası listesi",
+    )
+
+    def validate(self, data):
+        if not data["ids"] and not data["serial_numbers"]:
+            raise serializers.ValidationError(
+                {
+                    "details": "Sökülecek en az bir uçak ID'si veya seri numarası belirtilmelidir."
+                }
+            )
+        return data
@@ -0,0 +1,88 @@
+from django.conf import settings
+from rest_framework import serializers
+from core.rollups import INTERVAL_DAY, INTERVALS, bucket_count
+
+
+class DateRangeQuerySerializer(serializers.Serializer):
+    start = serializers.DateField(
+        help_text="Başlangıç tarihi (dahil, UTC)",
+        error_messages={
+            "required": "Başlangıç tarihi (start) belirtilmedi.",
+            "invalid": "Tarihler YYYY-MM-DD biçiminde olmalıdır.",
+        },
+    )
+    end = serializers.DateField(
+        help_text="Bitiş tarihi (dahil, UTC)",
+        error_messages={
+            "required": "Bitiş tarihi (end) belirtilmedi.",
+            "invalid": "Tarihler YYYY-MM-DD biçiminde olmalıdır.",
+        },
+    )
+
+    def validate(self, data):
+        if data["end"] < data["start"]:
+            raise serializers.ValidationError(
+                {"details": "Bitiş tarihi başlangıç tarihinden önce olamaz."}
+            )
+        return data
+
+
+class AnalyticsQuerySerializer(DateRangeQuerySerializer):
+    interval = serializers.ChoiceField(
+        choices=sorted(INTERVALS), default=INTERVAL_DAY, help_text="Dilim uzunluğu"
+    )
+
+    def validate(self, data):
+        data = super().validate(data)
+        buckets = bucket_count(data["start"], data["end"], data["interval"])
+        if buckets > settings.ANALYTICS_MAX_BUCKETS:
+            raise serializers.ValidationError(
+                {
+                    "details": f"Aralık en fazla {settings.ANALYTICS_MAX_BUCKETS} dilim "
+                    f"içerebilir ({buckets} istendi)."
+                }
+            )
+        return data
+
+
+class PartAnalyticsQuerySerializer(AnalyticsQuerySerializer):
+    team_id = serializers.IntegerField(
+        required=False, help_text="Sadece bu takımın üretimi (Montaj takımı için)"
+    )
+    part_type_id = serializers.IntegerField(
+        required=False, help_text="Sadece bu parça tipinin üretimi"
+    )
+
+
+class AircraftAnalyticsQuerySerializer(AnalyticsQuerySerializer):
+    aircraft_model_id = serializers.IntegerField(
+        required=False, help_text="Sadece bu uçak modelinin montajları"
+    )
+
+
+class LeadTimeQuerySerializer(DateRangeQuerySerializer):
+    def validate(self, data):
+        data = super().validate(data)
+        days = (data["end"] - data["start"]).days + 1
+        if days > settings.LEAD_TIME_MAX_DAYS:
+            raise serializers.ValidationError(
+                {
+                    "details": f"Aralık en fazla {settings.LEAD_TIME_MAX_DAYS} gün "
+                    f"olabilir ({days} istendi)."
+                }
+            )
+        return data
+
+
+class ProductionRateQuerySerializer(LeadTimeQuerySerializer):
+    window = serializers.IntegerField(
+        default=7,
+        min_value=1,
+        max_value=90,
+        help_text="Kayan ortalama penceresi (gün)",
+        error_messages={
+            "invalid": "Pencere (window) tam sayı olmalıdır.",
+            "min_value": "Pencere (window) en az 1 gün olmalıdır.",
+            "max_value": "Pencere (window) en fazla 90 gün olabilir.",
+        },
+    )
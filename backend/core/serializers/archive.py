@@ -0,0 +1,77 @@
+from rest_framework import serializers
+from core.models import ArchivedAircraft, ArchivedPart
+from core.serializers.aircraft_model import AircraftModelSerializer
+from core.serializers.personnel import PersonnelSerializer
+from core.serializers.mixins import ExpandableFieldsMixin
+from core.serializers.part import (
+    PartTypeSerializer,
+    AircraftModelSerializer as PartAircraftModelSerializer,
+    PersonnelSerializer as PartPersonnelSerializer,
+)
+
+
+class ArchivedAircraftMinimalSerializer(serializers.ModelSerializer):
+    model = serializers.StringRelatedField()
+
+    class Meta:
+        model = ArchivedAircraft
+        fields = ["id", "serial_number", "model"]
+
+
+class ArchivedPartSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
+    type = PartTypeSerializer(read_only=True)
+    aircraft_model = PartAircraftModelSerializer(read_only=True)
+    produced_by = PartPersonnelSerializer(read_only=True)
+    used_in_aircraft = ArchivedAircraftMinimalSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedPart
+        fields = [
+            "id",
+            "serial_number",
+            "type",
+            "aircraft_model",
+            "used_in_aircraft",
+            "produced_by",
+            "created_at",
+            "archived_at",
+        ]
+        read_only_fields = fields
+        expandable = {
+            "type": ("type__allowed_team",),
+            "aircraft_model": ("aircraft_model",),
+            "used_in_aircraft": ("used_in_aircraft__model",),
+            "produced_by": ("produced_by__team",),
+        }
+
+
+class ArchivedPartMinimalSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ArchivedPart
+        fields = ["id", "serial_number", "type"]
+
+
+class ArchivedAircraftSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
+    model = AircraftModelSerializer(read_only=True)
+    assembled_by = PersonnelSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedAircraft
+        fields = [
+            "id",
+            "serial_number",
+            "model",
+            "assembled_by",
+            "assembled_at",
+            "archived_at",
+        ]
+        read_only_fields = fields
+        expandable = {"model": ("model",), "assembled_by": ("assembled_by",)}
+
+
+class ArchivedAircraftDetailSerializer(ArchivedAircraftSerializer):
+    parts = ArchivedPartMinimalSerializer(many=True, read_only=True)
+
+    class Meta(ArchivedAircraftSerializer.Meta):
+        fields = ArchivedAircraftSerializer.Meta.fields + ["parts"]
+        read_only_fields = fields
@@ -1,6 +1,10 @@
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from core.token_revocation import FilteredRefreshToken
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -30,3 +34,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         )
 
         return data
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    # Kara liste kontrolü önce süreç içi iptal filtresinde yapılır
+    token_class = FilteredRefreshToken
@@ -0,0 +1,31 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class BatchItemSerializer(serializers.Serializer):
+    id = serializers.CharField(
+        max_length=100,
+        required=False,
+        help_text="Yanıtta alt isteği eşleştirmek için istemcinin verdiği kimlik",
+    )
+    method = serializers.ChoiceField(
+        choices=["GET"], default="GET", help_text="Sadece GET desteklenir"
+    )
+    path = serializers.CharField(
+        max_length=2000, help_text="Sorgu parametreleriyle birlikte yol (/api/v1/...)"
+    )
+    headers = serializers.DictField(
+        child=serializers.CharField(max_length=1000),
+        required=False,
+        default=dict,
+        help_text="Alt isteğe eklenecek başlıklar (ör. If-None-Match)",
+    )
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = serializers.ListField(
+        child=BatchItemSerializer(),
+        min_length=1,
+        max_length=settings.BATCH_MAX_REQUESTS,
+        help_text="Çalıştırılacak alt istekler",
+    )
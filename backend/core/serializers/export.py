@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    # ?format= DRF tarafından yanıt biçimi seçimi için ayrılmıştır
+    file_format = serializers.ChoiceField(
+        choices=["parquet", "arrow"],
+        default="parquet",
+        help_text="Dosya biçimi: parquet veya arrow (Arrow IPC akışı)",
+        error_messages={"invalid_choice": "Biçim parquet veya arrow olmalıdır."},
+    )
+    start = serializers.DateField(
+        required=False,
+        help_text="Bu günden (dahil, UTC) itibaren üretilen/monte edilen kayıtlar",
+        error_messages={"invalid": "Tarihler YYYY-MM-DD biçiminde olmalıdır."},
+    )
+    end = serializers.DateField(
+        required=False,
+        help_text="Bu güne (dahil, UTC) kadar üretilen/monte edilen kayıtlar",
+        error_messages={"invalid": "Tarihler YYYY-MM-DD biçiminde olmalıdır."},
+    )
+
+    def validate(self, data):
+        if "start" in data and "end" in data and data["end"] < data["start"]:
+            raise serializers.ValidationError(
+                {"details": "Bitiş tarihi başlangıç tarihinden önce olamaz."}
+            )
+        return data
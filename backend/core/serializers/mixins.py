@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+
+class ExpandableFieldsMixin:
+    """
+    ?fields= ve ?expand= seçimine göre alanları kırpan serializer mixin'i.
+
+    Seçim view tarafından serializer context'ine konur (fields, expand); None ise
+    kısıtlama yoktur. Meta.expandable, iç içe nesne olarak dönebilen ilişki alanlarını
+    ve bu ilişkiler için gereken select_related yollarını tanımlar. Genişletilmeyen
+    ilişki alanları sadece ID olarak döner; ID yabancı anahtar sütunundan okunduğu
+    için ilgili tabloyla join yapılmaz.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = self.context.get("fields")
+        expand = self.context.get("expand")
+
+        if fields is not None:
+            for name in list(self.fields):
+                if name not in fields:
+                    self.fields.pop(name)
+
+        if expand is not None:
+            for name in getattr(self.Meta, "expandable", {}):
+                if name in self.fields and name not in expand:
+                    self.fields[name] = serializers.PrimaryKeyRelatedField(
+                        read_only=True
+                    )
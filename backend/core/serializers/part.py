@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from core.models import Part, PartType, AircraftModel, Personnel, Aircraft
+from core.models import Part, PartType, AircraftModel, Personnel, Aircraft, ArchivedPart
+from core.serializers.mixins import ExpandableFieldsMixin
 
 
 class PartTypeSerializer(serializers.ModelSerializer):
@@ -39,7 +40,7 @@ class PartMinimalSerializer(serializers.ModelSerializer):
         fields = ["id", "serial_number", "type"]
 
 
-class PartSerializer(serializers.ModelSerializer):
+class PartSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     type = PartTypeSerializer(read_only=True)
     aircraft_model = AircraftModelSerializer(read_only=True)
     produced_by = PersonnelSerializer(read_only=True)
@@ -66,3 +67,18 @@ class PartSerializer(serializers.ModelSerializer):
             "created_at",
         ]
         read_only_fields = ["id", "created_at", "produced_by"]
+        # İç içe dönebilen ilişkiler ve ihtiyaç duydukları join'ler
+        expandable = {
+            "type": ("type__allowed_team",),
+            "aircraft_model": ("aircraft_model",),
+            "used_in_aircraft": ("used_in_aircraft__model",),
+            "produced_by": ("produced_by__team",),
+        }
+
+    def validate_serial_number(self, value):
+        # Arşive taşınan parçalar canlı tablodan silindiği için arşiv tablosu da kontrol edilir
+        if ArchivedPart.objects.filter(serial_number=value).exists():
+            raise serializers.ValidationError(
+                "Bu seri numarasına sahip arşivlenmiş bir parça mevcut."
+            )
+        return value
@@ -0,0 +1,25 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(
+        max_length=100,
+        allow_blank=True,
+        help_text="Aranacak metin (seri numarasının veya adın bir kısmı)",
+        error_messages={
+            "required": "Arama metni (q) belirtilmedi.",
+            "max_length": "Arama metni en fazla 100 karakter olabilir.",
+        },
+    )
+    limit = serializers.IntegerField(
+        default=10,
+        min_value=1,
+        max_value=settings.SEARCH_MAX_RESULTS,
+        help_text="En fazla sonuç sayısı",
+        error_messages={
+            "invalid": "limit tam sayı olmalıdır.",
+            "min_value": "limit en az 1 olmalıdır.",
+            "max_value": f"limit en fazla {settings.SEARCH_MAX_RESULTS} olabilir.",
+        },
+    )
@@ -0,0 +1,165 @@
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from django.conf import settings
+
+# WSGI uygulamasını yükleyip URL yapılandırmasını çözen başlangıç betiği
+WSGI_BOOTSTRAP = (
+    "import os;"
+    "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings');"
+    "from config.wsgi import application;"
+    "from django.urls import get_resolver;"
+    "get_resolver().url_patterns"
+)
+
+STARTUP_TARGETS = {
+    # manage.py komutlarının açılışı
+    "check": ["manage.py", "check"],
+    # Worker'ın ilk isteği karşılamaya hazır hâle gelmesi
+    "wsgi": ["-c", WSGI_BOOTSTRAP],
+}
+
+
+def run_startup(target, importtime=False):
+    """
+    Hedefi yeni bir Python sürecinde çalıştırır.
+    Geçen süreyi (saniye) ve sürecin stderr çıktısını döndürür.
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += STARTUP_TARGETS[target]
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        command,
+        cwd=settings.BASE_DIR,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"'{target}' açılışı başarısız oldu:\n{result.stderr[-2000:]}"
+        )
+    return elapsed, result.stderr
+
+
+def measure_startup(target, runs=3):
+    """
+    Hedefin soğuk açılış süresini ölçer; gürültüyü azaltmak için en iyi sonucu döndürür.
+    """
+    return min(run_startup(target)[0] for _ in range(runs))
+
+
+def parse_importtime(output):
+    """
+    `python -X importtime` çıktısını modül bazında ayrıştırır.
+    Her modül için (ad, kendi süresi µs, toplam süresi µs) döndürür.
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def group_by_package(modules):
+    """
+    Modüllerin kendi sürelerini üst seviye pakete göre toplar.
+    """
+    totals = defaultdict(int)
+    for name, self_us, _ in modules:
+        totals[name.split(".")[0]] += self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def warm_up_app():
+    """
+    İlk isteğin ödeyeceği tek seferlik yüklemeleri önceden yapar: URL yapılandırması
+    ve view modülleri, DRF/JWT ayarları, parola hash'leyicileri, çeviri katalogları
+    ve OpenAPI şeması. Veritabanına bağlanmaz; fork öncesi master süreçte çalışabilir.
+    """
+    from django.contrib.auth.hashers import get_hashers
+    from django.urls import get_resolver
+    from django.utils import translation
+    from rest_framework.settings import api_settings
+    from core.schema import get_schema_artifact
+
+    # View, serializer ve router modüllerini yükler, reverse() tablosunu doldurur
+    get_resolver().reverse_dict
+    for name in (
+        "DEFAULT_AUTHENTICATION_CLASSES",
+        "DEFAULT_PERMISSION_CLASSES",
+        "DEFAULT_RENDERER_CLASSES",
+        "DEFAULT_PARSER_CLASSES",
+    ):
+        getattr(api_settings, name)
+    from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+    jwt_settings.AUTH_TOKEN_CLASSES
+    get_hashers()
+    with translation.override(settings.LANGUAGE_CODE):
+        translation.gettext("This field is required.")
+    get_schema_artifact()
+
+
+def warm_up_connections():
+    """
+    Worker sürecinde her veritabanı için bir bağlantı açar; havuz kullanılıyorsa
+    havuz da bu sırada açılır ve bağlantı havuza geri verilir.
+    Bağlantı kurulamazsa worker yine de başlar, hata döndürülür.
+    """
+    from django.db import DatabaseError, connections
+
+    errors = []
+    for alias in connections:
+        try:
+            connections[alias].ensure_connection()
+        except DatabaseError as exc:
+            errors.append(f"{alias}: {exc}")
+    connections.close_all()
+    return errors
+
+
+def process_memory(pid):
+    """
+    Sürecin bellek kullanımını (bayt) döndürür: rss, pss (paylaşılan sayfalar süreç
+    sayısına bölünmüş) ve uss (sadece bu sürece ait). Linux'a özgüdür.
+    """
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def current_rss(pid="self"):
+    """
+    Sürecin anlık RSS değerini (bayt) döndürür.
+    """
+    with open(f"/proc/{pid}/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def child_pids(pid):
+    """
+    Sürecin doğrudan alt süreçlerinin PID'lerini döndürür.
+    """
+    children = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        with open(f"/proc/{pid}/task/{task}/children") as file:
+            children.extend(int(child) for child in file.read().split())
+    return children
@@ -0,0 +1,147 @@
+from collections import Counter
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from core.models import AircraftModel, Part, PartStockCount, PartType
+
+# Tam bir uçak için gerekli olan parça tipleri ve miktarları
+REQUIRED_PART_TYPES = {
+    "kanat": 1,
+    "gövde": 1,
+    "kuyruk": 1,
+    "aviyonik": 1,
+}
+
+
+def part_counts(queryset):
+    """
+    Verilen parçaları (uçak modeli, parça tipi) çiftine göre tek sorguda sayar.
+    """
+    return Counter(
+        {
+            (row["aircraft_model_id"], row["type_id"]): row["count"]
+            for row in queryset.order_by()
+            .values("aircraft_model_id", "type_id")
+            .annotate(count=Count("id"))
+        }
+    )
+
+
+def adjust_stock(counts, sign=1):
+    """
+    Stok sayaçlarını (uçak modeli, parça tipi) çiftine göre verilen miktarlar kadar
+    değiştirir. Parça yazan işlemle aynı transaction içinde çağrılmalıdır.
+    Satırlar kilitlenme (deadlock) olmaması için hep aynı sırayla güncellenir.
+    """
+    for (aircraft_model_id, part_type_id), count in sorted(counts.items()):
+        if not count:
+            continue
+        delta = sign * count
+        updated = PartStockCount.objects.filter(
+            aircraft_model_id=aircraft_model_id, part_type_id=part_type_id
+        ).update(count=F("count") + delta)
+        if updated:
+            continue
+
+        # İlk yazmada sayaç satırı oluşturulur
+        try:
+            with transaction.atomic():
+                PartStockCount.objects.create(
+                    aircraft_model_id=aircraft_model_id,
+                    part_type_id=part_type_id,
+                    count=delta,
+                )
+        except IntegrityError:
+            PartStockCount.objects.filter(
+                aircraft_model_id=aircraft_model_id, part_type_id=part_type_id
+            ).update(count=F("count") + delta)
+
+
+def free_counts(parts):
+    """
+    Parça nesnelerinden stokta olanları (uçak modeli, parça tipi) çiftine göre sayar.
+    """
+    return Counter(
+        (part.aircraft_model_id, part.type_id)
+        for part in parts
+        if part.used_in_aircraft_id is None
+    )
+
+
+def rebuild_stock_counts():
+    """
+    Stok sayaçlarını parça tablosundan yeniden hesaplar (ilk doldurma ve sapma onarımı).
+    Sayaç satırları kilitlendiği için sayım sırasında parça yazan işlemler bekler ve
+    sonuç tutarlı olur. Güncellenen sayaç sayısını döndürür.
+    """
+    with transaction.atomic():
+        existing = {
+            (row.aircraft_model_id, row.part_type_id): row
+            for row in PartStockCount.objects.select_for_update().order_by("pk")
+        }
+        counts = part_counts(Part.objects.filter(used_in_aircraft__isnull=True))
+
+        part_type_ids = list(PartType.objects.values_list("pk", flat=True))
+        created = []
+        changed = []
+        for aircraft_model_id in AircraftModel.objects.values_list("pk", flat=True):
+            for part_type_id in part_type_ids:
+                key = (aircraft_model_id, part_type_id)
+                row = existing.get(key)
+                if row is None:
+                    created.append(
+                        PartStockCount(
+                            aircraft_model_id=aircraft_model_id,
+                            part_type_id=part_type_id,
+                            count=counts[key],
+                        )
+                    )
+                elif row.count != counts[key]:
+                    row.count = counts[key]
+                    changed.append(row)
+
+        PartStockCount.objects.bulk_create(created, ignore_conflicts=True)
+        PartStockCount.objects.bulk_update(changed, ["count"])
+    return len(created) + len(changed)
+
+
+def buildable_capacity():
+    """
+    Her uçak modeli için stoktaki parçalarla kaç tam uçak monte edilebileceğini
+    ve kapasiteyi sınırlayan (darboğaz) parça tipini döndürür.
+    Sadece stok sayaçları okunur; parça tablosu taranmaz.
+    """
+    part_types = dict(
+        PartType.objects.filter(name__in=REQUIRED_PART_TYPES).values_list("pk", "name")
+    )
+    counts = {
+        (row["aircraft_model_id"], row["part_type_id"]): row["count"]
+        for row in PartStockCount.objects.filter(part_type_id__in=part_types).values(
+            "aircraft_model_id", "part_type_id", "count"
+        )
+    }
+    type_ids = {name: pk for pk, name in part_types.items()}
+
+    result = []
+    for aircraft_model in AircraftModel.objects.order_by("pk"):
+        parts = []
+        for name, required in REQUIRED_PART_TYPES.items():
+            stock = max(counts.get((aircraft_model.pk, type_ids.get(name)), 0), 0)
+            parts.append(
+                {
+                    "part_type_name": name,
+                    "required": required,
+                    "stock_count": stock,
+                    "buildable": stock // required,
+                }
+            )
+        bottleneck = min(parts, key=lambda part: part["buildable"])
+        result.append(
+            {
+                "aircraft_model_id": aircraft_model.pk,
+                "aircraft_model_name": aircraft_model.name,
+                "buildable": bottleneck["buildable"],
+                "bottleneck": bottleneck["part_type_name"],
+                "parts": parts,
+            }
+        )
+    return result
@@ -1,3 +1,1941 @@
-from django.test import TestCase
+import gzip
+import json
+import logging
+import os
+import runpy
+import signal
+import tempfile
+from contextlib import ExitStack
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from core import profiling
+from core.db.routers import (
+    ReplicaRouter,
+    is_pinned_to_primary,
+    pin_to_primary,
+    replica_aliases,
+    use_replica,
+)
+from core.deletion import cascade_steps, exceeds_inline_limit, run_job
+from core.exports import dictionary_columns, export_schema
+from core.idempotency import IDEMPOTENCY_HEADER, REPLAYED_HEADER
+from core.lead_times import (
+    DENSE_KEY_LIMIT,
+    LEAD_TIME_BUCKETS_HOURS,
+    lead_time_stats,
+    production_rates,
+)
+from core.logs import JsonFormatter, RequestContextFilter
+from core.middleware.admission import BULK, INTERACTIVE, WRITE, classify, get_gate
+from core.middleware.profiling import PROFILE_HEADER
+from core.middleware.request_context import RequestContextMiddleware
+from core.models import (
+    Aircraft,
+    AircraftAssemblyRollup,
+    AircraftModel,
+    ArchivedAircraft,
+    ArchivedPart,
+    DeletionJob,
+    IdempotencyKey,
+    Part,
+    PartProductionRollup,
+    PartStockCount,
+    PartTeamSyncJob,
+    PartType,
+    Personnel,
+    QueryPlan,
+    Team,
+)
+from core.query_plans import (
+    SlowQueryCollector,
+    capture_plans,
+    fingerprint,
+    normalize_sql,
+    record_plan,
+)
+from core.part_teams import claim_next_sync_job, run_sync_job, sync_part_teams
+from core.rollups import rebuild_rollups
+from core.schema import SchemaArtifact
+from core.startup import measure_startup
+from core.token_revocation import (
+    VERSION_KEY,
+    FilteredRefreshToken,
+    RevocationFilter,
+    filter_enabled,
+)
+from core.stock import REQUIRED_PART_TYPES, rebuild_stock_counts
+from core.views.docs import OpenAPISchemaView, accepts_gzip
+from core.watermarks import AIRCRAFT, AIRCRAFT_DETAIL, PARTS, bump
 
-# Create your tests here.
+
+class StartupBudgetTests(SimpleTestCase):
+    """
+    Soğuk açılış süresinin belirlenen bütçeyi aşmadığını doğrular.
+    Bütçeler STARTUP_BUDGET_* ortam değişkenleriyle ayarlanabilir.
+    """
+
+    def test_manage_check_startup_within_budget(self):
+        elapsed = measure_startup("check")
+        self.assertLess(
+            elapsed,
+            settings.STARTUP_BUDGET_CHECK_SECONDS,
+            f"manage.py check açılışı {elapsed:.2f} sn sürdü",
+        )
+
+    def test_wsgi_startup_within_budget(self):
+        elapsed = measure_startup("wsgi")
+        self.assertLess(
+            elapsed,
+            settings.STARTUP_BUDGET_WSGI_SECONDS,
+            f"WSGI uygulaması {elapsed:.2f} sn'de yüklendi",
+        )
+
+
+# Replika bağlantıları test transaction'ının dışında kaldığı için okumalar da
+# birincil veritabanından yapılır
+@override_settings(DB_REPLICA_ALIASES=[])
+class FactoryTestCase(TestCase):
+    """
+    Her takımdan bir personel, gerekli parça tipleri ve bir uçak modeli oluşturan
+    ortak test sınıfı. Süreç içi önbellekler her testten önce temizlenir.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teams = {}
+        cls.personnel = {}
+        for responsibility, label in Team.RESPONSIBILITY_CHOICES:
+            team = Team.objects.create(
+                name=f"{label} Takımı", responsibility=responsibility
+            )
+            user = User.objects.create_user(
+                username=responsibility, password="test-password"
+            )
+            cls.teams[responsibility] = team
+            cls.personnel[responsibility] = Personnel.objects.create(
+                user=user, full_name=f"{label} Personeli", team=team
+            )
+        cls.part_types = {
+            name: PartType.objects.create(name=name, allowed_team=cls.teams[name])
+            for name in REQUIRED_PART_TYPES
+        }
+        cls.aircraft_model = AircraftModel.objects.create(name="TB2")
+
+    def setUp(self):
+        for alias in settings.CACHES:
+            caches[alias].clear()
+
+    def client_for(self, responsibility):
+        client = APIClient()
+        client.force_authenticate(self.personnel[responsibility].user)
+        return client
+
+    def make_part(self, type_name, serial_number, **fields):
+        return Part.objects.create(
+            serial_number=serial_number,
+            type=self.part_types[type_name],
+            aircraft_model=self.aircraft_model,
+            produced_by=self.personnel[type_name],
+            **fields,
+        )
+
+    def produce(self, type_name, serial_number, headers=None):
+        """
+        Parçayı ilgili takımın personeli olarak API üzerinden üretir.
+        """
+        return self.client_for(type_name).post(
+            "/api/v1/parts/",
+            {
+                "serial_number": serial_number,
+                "type_id": self.part_types[type_name].pk,
+                "aircraft_model_id": self.aircraft_model.pk,
+            },
+            format="json",
+            headers=headers,
+        )
+
+    def assemble(self, serial_number):
+        """
+        Her gerekli tipten bir parça üretip montaj takımı olarak uçağı monte eder.
+        """
+        serials = [f"{serial_number}-{name}" for name in REQUIRED_PART_TYPES]
+        for name, serial in zip(REQUIRED_PART_TYPES, serials):
+            self.assertEqual(self.produce(name, serial).status_code, 201)
+        response = self.client_for("montaj").post(
+            "/api/v1/aircraft/",
+            {
+                "serial_number": serial_number,
+                "model_id": self.aircraft_model.pk,
+                "parts": serials,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        return Aircraft.objects.get(pk=response.json()["id"])
+
+    def stock(self):
+        return {
+            row.part_type.name: row.count
+            for row in PartStockCount.objects.filter(
+                aircraft_model=self.aircraft_model
+            ).select_related("part_type")
+        }
+
+
+class IdempotencyTests(FactoryTestCase):
+    """
+    Idempotency-Key ile tekrarlanan parça üretim isteklerini doğrular.
+    """
+
+    def produce_with_key(self, serial_number, key):
+        return self.produce("kanat", serial_number, {IDEMPOTENCY_HEADER: key})
+
+    def test_same_key_and_payload_replays_response(self):
+        first = self.produce_with_key("K-1", "key-1")
+        second = self.produce_with_key("K-1", "key-1")
+
+        self.assertEqual(first.status_code, 201)
+        self.assertNotIn(REPLAYED_HEADER, first)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second[REPLAYED_HEADER], "true")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(Part.objects.filter(serial_number="K-1").count(), 1)
+
+    def test_same_key_with_different_payload_is_rejected(self):
+        self.produce_with_key("K-1", "key-1")
+        response = self.produce_with_key("K-2", "key-1")
+
+        self.assertEqual(response.status_code, 422)
+        self.assertFalse(Part.objects.filter(serial_number="K-2").exists())
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+    def in_flight_record(self, key, age):
+        record = IdempotencyKey.objects.create(
+            user=self.personnel["kanat"].user,
+            key=key,
+            endpoint="POST /api/v1/parts/",
+            fingerprint="önceki-istek",
+            expires_at=timezone.now() + timedelta(days=1),
+        )
+        IdempotencyKey.objects.filter(pk=record.pk).update(
+            created_at=timezone.now() - age
+        )
+        return record
+
+    @override_settings(IDEMPOTENCY_WAIT_SECONDS=0, IDEMPOTENCY_LEASE_SECONDS=60)
+    def test_in_flight_key_within_lease_is_busy(self):
+        self.in_flight_record("key-1", timedelta(seconds=5))
+
+        response = self.produce_with_key("K-1", "key-1")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Part.objects.filter(serial_number="K-1").exists())
+
+    @override_settings(IDEMPOTENCY_WAIT_SECONDS=0, IDEMPOTENCY_LEASE_SECONDS=60)
+    def test_abandoned_key_is_reclaimed(self):
+        abandoned = self.in_flight_record("key-1", timedelta(seconds=61))
+
+        response = self.produce_with_key("K-1", "key-1")
+
+        self.assertEqual(response.status_code, 201)
+        record = IdempotencyKey.objects.get()
+        self.assertNotEqual(record.pk, abandoned.pk)
+        self.assertEqual(record.status_code, 201)
+        self.assertEqual(self.produce_with_key("K-1", "key-1")[REPLAYED_HEADER], "true")
+
+
+class DisassembleTests(FactoryTestCase):
+    """
+    Toplu uçak sökme işleminin parçaları stoğa döndürdüğünü doğrular.
+    """
+
+    def test_disassemble_returns_parts_to_stock(self):
+        first = self.assemble("UCAK-1")
+        second = self.assemble("UCAK-2")
+        self.assertEqual(self.stock(), dict.fromkeys(REQUIRED_PART_TYPES, 0))
+
+        response = self.client_for("montaj").post(
+            "/api/v1/aircraft/disassemble/",
+            {"ids": [first.pk], "serial_numbers": ["UCAK-YOK"]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["disassembled"], ["UCAK-1"])
+        self.assertEqual(data["released_total"], len(REQUIRED_PART_TYPES))
+        self.assertEqual(data["released_parts"], dict.fromkeys(REQUIRED_PART_TYPES, 1))
+        self.assertEqual(data["not_found"], {"ids": [], "serial_numbers": ["UCAK-YOK"]})
+        self.assertFalse(Aircraft.objects.filter(pk=first.pk).exists())
+        self.assertTrue(Aircraft.objects.filter(pk=second.pk).exists())
+        self.assertFalse(
+            Part.objects.filter(serial_number__startswith="UCAK-1-")
+            .exclude(used_in_aircraft=None)
+            .exists()
+        )
+        self.assertEqual(self.stock(), dict.fromkeys(REQUIRED_PART_TYPES, 1))
+
+    def test_disassemble_unknown_aircraft_returns_404(self):
+        response = self.client_for("montaj").post(
+            "/api/v1/aircraft/disassemble/", {"ids": [999]}, format="json"
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class AircraftDetailCacheTests(FactoryTestCase):
+    """
+    Uçak detay önbelleğinin yazmalardan sonra eski yanıt döndürmediğini doğrular.
+    """
+
+    def retrieve(self, aircraft, **headers):
+        return self.client_for("montaj").get(
+            f"/api/v1/aircraft/{aircraft.pk}/", headers=headers
+        )
+
+    def test_matching_etag_returns_304(self):
+        aircraft = self.assemble("UCAK-1")
+        response = self.retrieve(aircraft)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["parts"]), len(REQUIRED_PART_TYPES))
+        cached = self.retrieve(aircraft, **{"If-None-Match": response["ETag"]})
+        self.assertEqual(cached.status_code, 304)
+
+    def test_delete_evicts_cached_detail(self):
+        aircraft = self.assemble("UCAK-1")
+        self.assertEqual(self.retrieve(aircraft).status_code, 200)
+
+        response = self.client_for("montaj").delete(f"/api/v1/aircraft/{aircraft.pk}/")
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.retrieve(aircraft).status_code, 404)
+
+    def test_write_from_another_process_invalidates_entry(self):
+        aircraft = self.assemble("UCAK-1")
+        etag = self.retrieve(aircraft)["ETag"]
+
+        # Başka bir worker'ın yaptığı değişiklik: bu sürecin önbelleği temizlenmez,
+        # sadece veritabanındaki detay sayacı artar
+        part = aircraft.parts.get(type=self.part_types["kanat"])
+        with transaction.atomic():
+            Part.objects.filter(pk=part.pk).update(used_in_aircraft=None)
+            bump(AIRCRAFT, PARTS, AIRCRAFT_DETAIL)
+
+        response = self.retrieve(aircraft, **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertNotIn(part.pk, [item["id"] for item in response.json()["parts"]])
+
+    def test_new_assembly_keeps_other_entries(self):
+        aircraft = self.assemble("UCAK-1")
+        etag = self.retrieve(aircraft)["ETag"]
+        # Önbellekteki kayıt kullanılıyorsa bu değişiklik yanıtta görünmez
+        Aircraft.objects.filter(pk=aircraft.pk).update(serial_number="UCAK-1-X")
+
+        self.assemble("UCAK-2")
+
+        response = self.retrieve(aircraft)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["serial_number"], "UCAK-1")
+
+    def test_admin_release_evicts_only_that_aircraft(self):
+        first = self.assemble("UCAK-1")
+        second = self.assemble("UCAK-2")
+        second_etag = self.retrieve(second)["ETag"]
+        first_etag = self.retrieve(first)["ETag"]
+        self.client.force_login(
+            User.objects.create_superuser("admin", password="test-password")
+        )
+
+        self.client.post(
+            reverse("admin:core_part_changelist"),
+            {
+                "action": "release_from_aircraft",
+                "_selected_action": [first.parts.get(type__name="kanat").pk],
+            },
+        )
+
+        self.assertNotEqual(self.retrieve(first)["ETag"], first_etag)
+        self.assertEqual(self.retrieve(second)["ETag"], second_etag)
+
+    @override_settings(
+        CACHES={
+            **settings.CACHES,
+            "aircraft_detail": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": tempfile.gettempdir() + "/aircraft-detail-test-cache",
+            },
+        }
+    )
+    def test_shared_cache_hit_skips_watermark_and_evicts_per_aircraft(self):
+        caches["aircraft_detail"].clear()
+        first = self.assemble("UCAK-1")
+        second = self.assemble("UCAK-2")
+        self.retrieve(first)
+        self.assertEqual(self.retrieve(second).status_code, 200)
+
+        with CaptureQueriesContext(connections["default"]) as queries:
+            self.assertEqual(self.retrieve(first).status_code, 200)
+        self.assertFalse(
+            any("changewatermark" in query["sql"].lower() for query in queries)
+        )
+
+        # Kayıtlar commit'ten sonra çıkarılır
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_for("montaj").post(
+                "/api/v1/aircraft/disassemble/", {"ids": [first.pk]}, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.retrieve(first).status_code, 404)
+        self.assertIsNotNone(
+            caches["aircraft_detail"].get(f"aircraft:detail:{second.pk}")
+        )
+
+
+class WatermarkETagTests(FactoryTestCase):
+    """
+    Parça listesinin koleksiyon sayacından üretilen ETag ile koşullu dönüşünü doğrular.
+    """
+
+    def list_parts(self, responsibility="kanat", **headers):
+        return self.client_for(responsibility).get("/api/v1/parts/", headers=headers)
+
+    def test_matching_etag_returns_304_until_collection_changes(self):
+        self.produce("kanat", "K-1")
+        first = self.list_parts()
+        etag = first["ETag"]
+
+        self.assertEqual(first.status_code, 200)
+        cached = self.list_parts(**{"If-None-Match": etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], etag)
+        self.assertFalse(cached.content)
+
+        self.produce("kanat", "K-2")
+        changed = self.list_parts(**{"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+        self.assertEqual(changed.json()["total"], 2)
+
+    def test_etag_depends_on_team(self):
+        etag = self.list_parts("kanat")["ETag"]
+        response = self.list_parts("gövde", **{"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+
+
+class PartTeamSyncJobTests(FactoryTestCase):
+    """
+    Parça tipinin takımı admin panelinden değiştirildiğinde parçaların istek içinde
+    değil, arka plandaki işte yeni takıma aktarıldığını doğrular.
+    """
+
+    def test_admin_team_change_enqueues_background_job(self):
+        part = self.make_part("kanat", "K-1", team=self.teams["kanat"])
+        admin_user = User.objects.create_superuser("admin", password="test-password")
+        self.client.force_login(admin_user)
+        part_type = self.part_types["kanat"]
+
+        response = self.client.post(
+            reverse("admin:core_parttype_change", args=[part_type.pk]),
+            {"name": part_type.name, "allowed_team": self.teams["gövde"].pk},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        part.refresh_from_db()
+        self.assertEqual(part.team_id, self.teams["kanat"].pk)
+        job = PartTeamSyncJob.objects.get(part_type=part_type)
+        self.assertEqual(job.status, PartTeamSyncJob.STATUS_PENDING)
+
+        self.assertEqual(claim_next_sync_job(), job)
+        run_sync_job(job)
+
+        part.refresh_from_db()
+        self.assertEqual(part.team_id, self.teams["gövde"].pk)
+        job.refresh_from_db()
+        self.assertEqual(job.status, PartTeamSyncJob.STATUS_DONE)
+        self.assertEqual((job.estimated_total, job.updated_total), (1, 1))
+
+
+class BatchTests(FactoryTestCase):
+    """
+    Toplu istekte her alt isteğin kendi durum koduyla döndüğünü ve toplu isteğin
+    alt isteklerinin en ağır kabul sınıfına girdiğini doğrular.
+    """
+
+    def batch(self, paths, responsibility="montaj", client=None):
+        client = client or self.client_for(responsibility)
+        return client.post(
+            "/api/v1/batch/",
+            {
+                "requests": [
+                    {"id": str(index), "path": path} for index, path in enumerate(paths)
+                ]
+            },
+            format="json",
+        )
+
+    def test_each_item_has_its_own_status(self):
+        part = self.make_part("kanat", "K-1")
+        response = self.batch(
+            [
+                "/api/v1/parts/?limit=10",
+                f"/api/v1/parts/{part.pk}/",
+                "/api/v1/parts/999999/",
+                "/api/v1/yok/",
+                "/admin/",
+                "/api/v1/batch/",
+                "/api/v1/parts/stock/",
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        items = response.json()["responses"]
+        self.assertEqual(
+            [item["id"] for item in items], [str(index) for index in range(7)]
+        )
+        self.assertEqual(
+            [item["status"] for item in items], [200, 200, 404, 404, 400, 400, 200]
+        )
+        self.assertEqual(items[1]["body"]["serial_number"], "K-1")
+        self.assertIn("ETag", items[0]["headers"])
+
+    def test_streaming_response_is_rejected_per_item(self):
+        admin_user = User.objects.create_superuser("admin", password="test-password")
+        client = APIClient()
+        client.force_authenticate(admin_user)
+
+        response = self.batch(
+            ["/api/v1/exports/teams/", "/api/v1/part-types/"], client=client
+        )
+
+        self.assertEqual(response.status_code, 200)
+        statuses = [item["status"] for item in response.json()["responses"]]
+        self.assertEqual(statuses, [415, 200])
+
+    def test_batch_is_classified_by_heaviest_item(self):
+        factory = RequestFactory()
+
+        def batch_request(*paths):
+            return factory.post(
+                "/api/v1/batch/",
+                json.dumps({"requests": [{"path": path} for path in paths]}),
+                content_type="application/json",
+            )
+
+        self.assertEqual(classify(batch_request("/api/v1/parts/")), INTERACTIVE)
+        self.assertEqual(
+            classify(batch_request("/api/v1/parts/", "/api/v1/parts/stock/")), BULK
+        )
+        self.assertEqual(classify(batch_request("/api/v1/parts/?offset=1000000")), BULK)
+        self.assertEqual(classify(factory.post("/api/v1/parts/")), WRITE)
+
+
+class SparseFieldsTests(FactoryTestCase):
+    """
+    ?fields= ve ?expand= parametrelerinin yanıtı kırptığını ve bilinmeyen alanları
+    reddettiğini doğrular.
+    """
+
+    def list_parts(self, query):
+        return self.client_for("kanat").get(f"/api/v1/parts/?{query}")
+
+    def test_fields_returns_only_selected_fields(self):
+        part = self.make_part("kanat", "K-1", team=self.teams["kanat"])
+        response = self.list_parts("fields=id,serial_number")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["data"], [{"id": part.pk, "serial_number": "K-1"}]
+        )
+
+    def test_expand_controls_nested_relations(self):
+        part = self.make_part("kanat", "K-1", team=self.teams["kanat"])
+
+        expanded = self.list_parts("fields=id,type,aircraft_model&expand=type")
+        self.assertEqual(expanded.status_code, 200)
+        item = expanded.json()["data"][0]
+        self.assertEqual(item["type"]["id"], part.type_id)
+        self.assertEqual(item["aircraft_model"], self.aircraft_model.pk)
+
+        flat = self.list_parts("fields=id,type&expand=")
+        self.assertEqual(flat.json()["data"], [{"id": part.pk, "type": part.type_id}])
+
+        detail = self.client_for("kanat").get(
+            f"/api/v1/parts/{part.pk}/?fields=serial_number"
+        )
+        self.assertEqual(detail.json(), {"serial_number": "K-1"})
+
+    def test_unknown_field_returns_400(self):
+        for query in ("fields=id,yok", "expand=serial_number"):
+            response = self.list_parts(query)
+            self.assertEqual(response.status_code, 400, query)
+            self.assertIn("Bilinmeyen alan", str(response.json()))
+
+
+class RevocationFilterTests(FactoryTestCase):
+    """
+    Refresh token iptal filtresinin diğer süreçlerin ve geç commit edilen
+    transaction'ların eklediği kara liste kayıtlarını gördüğünü doğrular.
+    """
+
+    def blacklist(self, jti, pk=None, expires_in=timedelta(days=1)):
+        now = timezone.now()
+        token = OutstandingToken.objects.create(
+            user=self.personnel["montaj"].user,
+            jti=jti,
+            token=jti,
+            created_at=now,
+            expires_at=now + expires_in,
+        )
+        return BlacklistedToken.objects.create(id=pk, token=token)
+
+    def bump_from_another_process(self):
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            cache.set(VERSION_KEY, 1, None)
+
+    def test_sees_rows_added_by_another_process(self):
+        self.blacklist("jti-1")
+        revocation = RevocationFilter()
+
+        self.assertTrue(revocation.might_be_revoked("jti-1"))
+        self.assertFalse(revocation.might_be_revoked("jti-2"))
+
+        self.blacklist("jti-2")
+        self.bump_from_another_process()
+        self.assertTrue(revocation.might_be_revoked("jti-2"))
+
+    def test_late_commit_with_lower_id_is_not_missed(self):
+        self.blacklist("jti-100", pk=100)
+        revocation = RevocationFilter()
+        self.assertFalse(revocation.might_be_revoked("jti-50"))
+
+        # Daha önce kimlik almış ama sonra commit edilmiş transaction
+        self.blacklist("jti-50", pk=50)
+        self.bump_from_another_process()
+        self.assertTrue(revocation.might_be_revoked("jti-50"))
+
+    def test_rebuild_starts_after_expired_rows(self):
+        self.blacklist("jti-eski", pk=5_000_000, expires_in=-timedelta(days=1))
+        BlacklistedToken.objects.update(
+            blacklisted_at=timezone.now() - timedelta(days=2)
+        )
+        revocation = RevocationFilter()
+
+        self.assertFalse(revocation.might_be_revoked("jti-eski"))
+        self.assertEqual(revocation._checkpoints[0][1], 5_000_000)
+        self.assertEqual(revocation._checkpoints[-1][1], 5_000_000)
+
+    def test_process_local_cache_checks_database(self):
+        self.assertFalse(filter_enabled())
+
+        token = FilteredRefreshToken.for_user(self.personnel["montaj"].user)
+        token.blacklist()
+        with self.assertRaises(TokenError):
+            FilteredRefreshToken(str(token))
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": tempfile.gettempdir() + "/revocation-test-cache",
+            }
+        }
+    )
+    def test_shared_cache_enables_filter(self):
+        self.assertTrue(filter_enabled())
+
+
+SHARED_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": tempfile.gettempdir() + "/replica-test-cache",
+    }
+}
+
+
+@override_settings(DB_REPLICA_ALIASES=["replica_1"], CACHES=SHARED_CACHES)
+class ReplicaRouterTests(SimpleTestCase):
+    """
+    Okuma sorgularının replikaya, yazmaların birincil veritabanına yönlendirildiğini
+    ve süreç içi önbellekte replikaların devre dışı kaldığını doğrular.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.router = ReplicaRouter()
+
+    def test_reads_go_to_replica_and_writes_to_primary(self):
+        self.assertEqual(self.router.db_for_read(Part), "default")
+
+        token = use_replica.set(True)
+        try:
+            self.assertEqual(self.router.db_for_read(Part), "replica_1")
+            self.assertEqual(self.router.db_for_write(Part), "default")
+        finally:
+            use_replica.reset(token)
+
+    def test_pin_is_visible_through_shared_cache(self):
+        self.assertFalse(is_pinned_to_primary(42))
+        pin_to_primary(42)
+        self.assertTrue(is_pinned_to_primary(42))
+        self.assertFalse(is_pinned_to_primary(43))
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_process_local_cache_disables_replicas(self):
+        self.assertEqual(replica_aliases(), [])
+
+        token = use_replica.set(True)
+        try:
+            self.assertEqual(self.router.db_for_read(Part), "default")
+        finally:
+            use_replica.reset(token)
+
+
+@skipUnless(
+    settings.DB_REPLICA_ALIASES,
+    "POSTGRES_REPLICA_HOSTS ile en az bir replika tanımlanmalı",
+)
+@override_settings(CACHES=SHARED_CACHES)
+class ReplicaReadTests(TransactionTestCase):
+    """
+    Birincil veritabanının aynası olan replika ile okuma isteklerinin replikadan,
+    yazmaların ve yazma sonrası okumaların birincil veritabanından yapıldığını doğrular.
+    Replika bağlantısı test transaction'ının dışında kaldığı için kayıtlar commit edilir.
+    """
+
+    databases = {"default", *settings.DB_REPLICA_ALIASES}
+
+    def setUp(self):
+        cache.clear()
+        team = Team.objects.create(name="Kanat Takımı", responsibility="kanat")
+        self.personnel = Personnel.objects.create(
+            user=User.objects.create_user(username="kanat", password="test-password"),
+            full_name="Kanat Personeli",
+            team=team,
+        )
+        self.part_type = PartType.objects.create(name="kanat", allowed_team=team)
+        self.aircraft_model = AircraftModel.objects.create(name="TB2")
+        self.client = APIClient()
+        self.client.force_authenticate(self.personnel.user)
+
+    def queries_by_alias(self, method, *args, **kwargs):
+        with ExitStack() as stack:
+            contexts = {
+                alias: stack.enter_context(CaptureQueriesContext(connections[alias]))
+                for alias in self.databases
+            }
+            response = getattr(self.client, method)(*args, **kwargs)
+        return response, {alias: len(context) for alias, context in contexts.items()}
+
+    def test_reads_from_replica_until_user_writes(self):
+        replica = settings.DB_REPLICA_ALIASES[0]
+
+        response, queries = self.queries_by_alias("get", "/api/v1/part-types/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], 1)
+        self.assertGreater(queries[replica], 0)
+
+        response, queries = self.queries_by_alias(
+            "post",
+            "/api/v1/parts/",
+            {
+                "serial_number": "KNT-1",
+                "type_id": self.part_type.pk,
+                "aircraft_model_id": self.aircraft_model.pk,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(queries[replica], 0)
+        self.assertTrue(is_pinned_to_primary(self.personnel.user.pk))
+
+        # Yazma yapan kullanıcı sabitleme süresince birincil veritabanından okur
+        response, queries = self.queries_by_alias("get", "/api/v1/parts/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], 1)
+        self.assertEqual(queries[replica], 0)
+        self.assertGreater(queries["default"], 0)
+
+
+class PruneTokensTests(FactoryTestCase):
+    """
+    prune_tokens komutunun sadece süresi dolmuş token kayıtlarını sildiğini doğrular.
+    """
+
+    def test_deletes_only_expired_tokens(self):
+        user = self.personnel["montaj"].user
+        now = timezone.now()
+        for jti, expires_at in (
+            ("eski-1", now - timedelta(days=1)),
+            ("eski-2", now - timedelta(seconds=1)),
+            ("yeni", now + timedelta(days=1)),
+        ):
+            token = OutstandingToken.objects.create(
+                user=user, jti=jti, token=jti, created_at=now, expires_at=expires_at
+            )
+            BlacklistedToken.objects.create(token=token)
+
+        out = StringIO()
+        call_command("prune_tokens", batch_size=1, stdout=out)
+
+        self.assertIn("2 token kaydı ve 2 kara liste kaydı silindi.", out.getvalue())
+        self.assertEqual(
+            list(OutstandingToken.objects.values_list("jti", flat=True)), ["yeni"]
+        )
+        self.assertEqual(BlacklistedToken.objects.get().token.jti, "yeni")
+
+
+class StockCounterTests(FactoryTestCase):
+    """
+    Stok sayaçlarının parça üretimi, silme, montaj ve uçaktan çıkarma işlemlerinde
+    doğru değiştiğini ve tam yeniden hesaplamayla aynı kaldığını doğrular.
+    """
+
+    def assertMatchesRebuild(self):
+        # Yeniden hesaplama sıfır sayaçları da oluşturur; sadece dolu sayaçlar karşılaştırılır
+        def nonzero():
+            return {name: count for name, count in self.stock().items() if count}
+
+        counted = nonzero()
+        rebuild_stock_counts()
+        self.assertEqual(counted, nonzero())
+
+    def test_counters_follow_part_lifecycle(self):
+        empty = dict.fromkeys(REQUIRED_PART_TYPES, 0)
+        self.produce("kanat", "K-1")
+        self.produce("kanat", "K-2")
+        self.assertEqual(self.stock()["kanat"], 2)
+
+        part = Part.objects.get(serial_number="K-2")
+        response = self.client_for("kanat").delete(f"/api/v1/parts/{part.pk}/")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.stock()["kanat"], 1)
+        self.assertMatchesRebuild()
+
+        # Montaj için üretilen dört parça kullanılır; stok değişmez
+        aircraft = self.assemble("UCAK-1")
+        self.assertEqual(self.stock(), {**empty, "kanat": 1})
+        self.assertMatchesRebuild()
+
+        admin_user = User.objects.create_superuser("admin", password="test-password")
+        self.client.force_login(admin_user)
+        response = self.client.post(
+            reverse("admin:core_part_changelist"),
+            {
+                "action": "release_from_aircraft",
+                "_selected_action": list(aircraft.parts.values_list("pk", flat=True)),
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            self.stock(), {**dict.fromkeys(REQUIRED_PART_TYPES, 1), "kanat": 2}
+        )
+        self.assertMatchesRebuild()
+
+
+class RollupTests(FactoryTestCase):
+    """
+    Artımlı üretim ve montaj sayaçlarının silme ve değişikliklerden sonra
+    rebuild_rollups sonucuyla aynı kaldığını doğrular.
+    """
+
+    def rollups(self):
+        return (
+            {
+                (row.bucket, row.team_id, row.part_type_id): row.count
+                for row in PartProductionRollup.objects.filter(count__gt=0)
+            },
+            {
+                (row.bucket, row.aircraft_model_id): row.count
+                for row in AircraftAssemblyRollup.objects.filter(count__gt=0)
+            },
+        )
+
+    def assertMatchesRebuild(self):
+        counted = self.rollups()
+        rebuild_rollups()
+        self.assertEqual(counted, self.rollups())
+
+    def test_incremental_counters_match_rebuild(self):
+        self.produce("kanat", "K-1")
+        self.produce("kanat", "K-2")
+        first = self.assemble("UCAK-1")
+        self.assemble("UCAK-2")
+        third = self.assemble("UCAK-3")
+        parts, aircraft = self.rollups()
+        self.assertEqual(sum(parts.values()), 14)
+        self.assertEqual(sum(aircraft.values()), 3)
+
+        part = Part.objects.get(serial_number="K-1")
+        montaj = self.client_for("montaj")
+        self.assertEqual(
+            self.client_for("kanat").delete(f"/api/v1/parts/{part.pk}/").status_code,
+            204,
+        )
+        self.assertEqual(
+            montaj.delete(f"/api/v1/aircraft/{first.pk}/").status_code, 204
+        )
+        response = montaj.post(
+            "/api/v1/aircraft/disassemble/", {"ids": [third.pk]}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+
+        parts, aircraft = self.rollups()
+        self.assertEqual(sum(parts.values()), 13)
+        self.assertEqual(sum(aircraft.values()), 1)
+        self.assertMatchesRebuild()
+
+    def test_admin_changes_and_team_sync_match_rebuild(self):
+        self.produce("kanat", "K-1")
+        self.produce("kanat", "K-2")
+        self.produce("gövde", "G-1")
+        admin_user = User.objects.create_superuser("admin", password="test-password")
+        self.client.force_login(admin_user)
+
+        response = self.client.post(
+            reverse("admin:core_part_changelist"),
+            {
+                "action": "recycle_parts",
+                "_selected_action": [Part.objects.get(serial_number="K-2").pk],
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+
+        part_type = self.part_types["kanat"]
+        PartType.objects.filter(pk=part_type.pk).update(
+            allowed_team=self.teams["gövde"]
+        )
+        sync_part_teams(part_type_id=part_type.pk)
+
+        parts, _ = self.rollups()
+        self.assertEqual(
+            {key[1:]: count for key, count in parts.items()},
+            {
+                (self.teams["gövde"].pk, part_type.pk): 1,
+                (self.teams["gövde"].pk, self.part_types["gövde"].pk): 1,
+            },
+        )
+        self.assertMatchesRebuild()
+
+
+class AdminPartActionTests(FactoryTestCase):
+    """
+    Admin panelindeki geri dönüşüm ve uçaktan çıkarma aksiyonlarının stok ve
+    üretim sayaçlarını tam yeniden hesaplamayla tutarlı bıraktığını doğrular.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(
+            User.objects.create_superuser("admin", password="test-password")
+        )
+
+    def run_action(self, action, parts):
+        response = self.client.post(
+            reverse("admin:core_part_changelist"),
+            {"action": action, "_selected_action": [part.pk for part in parts]},
+            follow=True,
+        )
+        self.assertEqual(response.status_code, 200)
+        return [str(message) for message in response.context["messages"]]
+
+    def counters(self):
+        stock = {name: count for name, count in self.stock().items() if count}
+        parts = {
+            (row.bucket, row.team_id, row.part_type_id): row.count
+            for row in PartProductionRollup.objects.filter(count__gt=0)
+        }
+        return stock, parts
+
+    def assertMatchesRebuild(self):
+        counted = self.counters()
+        rebuild_stock_counts()
+        rebuild_rollups()
+        self.assertEqual(counted, self.counters())
+
+    def test_recycle_skips_used_parts_and_keeps_counters(self):
+        self.produce("kanat", "K-1")
+        self.produce("kanat", "K-2")
+        aircraft = self.assemble("UCAK-1")
+        used = aircraft.parts.get(type__name="kanat")
+
+        messages = self.run_action(
+            "recycle_parts", [Part.objects.get(serial_number="K-1"), used]
+        )
+
+        self.assertEqual(
+            messages,
+            ["1 parça geri dönüşüme gönderildi.", "Uçakta kullanılan 1 parça atlandı."],
+        )
+        self.assertTrue(Part.objects.filter(pk=used.pk).exists())
+        self.assertEqual(self.stock()["kanat"], 1)
+        _, parts = self.counters()
+        self.assertEqual(sum(parts.values()), 1 + len(REQUIRED_PART_TYPES))
+        self.assertMatchesRebuild()
+
+    def test_release_returns_parts_to_stock_without_changing_production(self):
+        aircraft = self.assemble("UCAK-1")
+        _, produced = self.counters()
+
+        messages = self.run_action("release_from_aircraft", aircraft.parts.all())
+
+        self.assertEqual(
+            messages, [f"{len(REQUIRED_PART_TYPES)} parça uçaktan çıkarıldı."]
+        )
+        self.assertEqual(self.stock(), dict.fromkeys(REQUIRED_PART_TYPES, 1))
+        self.assertEqual(self.counters()[1], produced)
+        self.assertMatchesRebuild()
+
+        # Serbest kalan parçalar geri dönüşüme gönderilebilir
+        self.run_action("recycle_parts", Part.objects.all())
+        self.assertEqual(self.counters(), ({}, {}))
+        self.assertMatchesRebuild()
+
+
+@override_settings(ADMISSION_CONTROL_ENABLED=True)
+class AdmissionStreamingTests(FactoryTestCase):
+    """
+    Akış yanıtlarının gövdesi tamamen gönderilene kadar kabul kapısında
+    tutulduğunu doğrular.
+    """
+
+    def test_export_holds_gate_until_stream_closes(self):
+        admin_user = User.objects.create_superuser("admin", password="test-password")
+        client = APIClient()
+        client.force_authenticate(admin_user)
+        gate = get_gate(BULK)
+        in_flight = gate.in_flight
+
+        response = client.get("/api/v1/exports/teams/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Admission-Class"], BULK)
+        self.assertEqual(gate.in_flight, in_flight + 1)
+        self.assertTrue(b"".join(response.streaming_content))
+        self.assertEqual(gate.in_flight, in_flight)
+
+
+@override_settings(ADMISSION_CONTROL_ENABLED=True)
+class AdmissionCorsTests(FactoryTestCase):
+    """
+    Reddedilen yanıtların CORS başlıklarını taşıdığını, OPTIONS isteklerinin kapıya
+    girmediğini ve kimlik doğrulama endpoint'lerinin interactive sınıfta çalıştığını doğrular.
+    """
+
+    origin = {"Origin": "https://arayuz.example.com"}
+
+    def test_rejected_response_carries_cors_headers(self):
+        with mock.patch.object(
+            get_gate(INTERACTIVE), "acquire", return_value="overload"
+        ):
+            response = self.client_for("kanat").get(
+                "/api/v1/part-types/", headers=self.origin
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Access-Control-Allow-Origin"], "*")
+
+    def test_options_requests_are_not_gated(self):
+        with mock.patch.object(get_gate(WRITE), "acquire") as acquire:
+            response = self.client.options(
+                "/api/v1/parts/",
+                headers={**self.origin, "Access-Control-Request-Method": "POST"},
+            )
+
+        acquire.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Access-Control-Allow-Origin"], "*")
+
+    def test_auth_endpoints_are_interactive(self):
+        factory = RequestFactory()
+        self.assertEqual(classify(factory.post("/api/v1/auth/")), INTERACTIVE)
+        self.assertEqual(classify(factory.post("/api/v1/auth/refresh/")), INTERACTIVE)
+        self.assertEqual(classify(factory.post("/api/v1/auth/logout/")), WRITE)
+
+        response = self.client.post(
+            "/api/v1/auth/",
+            {"username": "kanat", "password": "test-password"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Admission-Class"], INTERACTIVE)
+
+
+class SearchTests(FactoryTestCase):
+    """
+    Genel aramanın takım görünürlüğünü ve SQLite yedek aramasının sıralamasını doğrular.
+    """
+
+    def search(self, responsibility, query):
+        response = self.client_for(responsibility).get(
+            "/api/v1/search/", {"q": query, "limit": 10}
+        )
+        self.assertEqual(response.status_code, 200)
+        return [(item["type"], item["text"]) for item in response.json()["results"]]
+
+    def make_team_part(self, type_name, serial_number):
+        return self.make_part(type_name, serial_number, team=self.teams[type_name])
+
+    def test_non_assembly_team_sees_only_own_parts_and_teammates(self):
+        self.make_team_part("kanat", "KNT-001")
+        self.make_team_part("gövde", "GVD-001")
+        Aircraft.objects.create(
+            serial_number="UCAK-001",
+            model=self.aircraft_model,
+            assembled_by=self.personnel["montaj"],
+        )
+
+        self.assertEqual(self.search("kanat", "001"), [("part", "KNT-001")])
+        self.assertEqual(
+            self.search("kanat", "personeli"), [("personnel", "Kanat Personeli")]
+        )
+        self.assertEqual(
+            sorted(self.search("montaj", "001")),
+            [("aircraft", "UCAK-001"), ("part", "GVD-001"), ("part", "KNT-001")],
+        )
+
+    def test_fallback_ranks_exact_then_prefix_then_typos(self):
+        for serial in ("KNX-10", "X-KNT-10", "KNT-100", "KNT-10-B", "KNT-10", "ABC-99"):
+            self.make_team_part("kanat", serial)
+
+        self.assertEqual(
+            [text for _, text in self.search("montaj", "knt-10")],
+            ["KNT-10", "KNT-10-B", "X-KNT-10", "KNT-100", "KNX-10"],
+        )
+
+    def test_short_query_returns_no_results(self):
+        self.make_team_part("kanat", "K")
+        self.assertEqual(self.search("montaj", "k"), [])
+
+
+class RequestContextLogTests(FactoryTestCase):
+    """
+    Request id'nin, kullanıcının ve takımın istek sırasında yazılan log kayıtlarına
+    eklendiğini ve X-Request-ID başlığıyla döndüğünü doğrular.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.records = []
+        self.logger = logging.getLogger("core.tests.request_context")
+        self.handler = logging.Handler()
+        self.handler.emit = self.records.append
+        self.handler.addFilter(RequestContextFilter())
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def call(self, request):
+        def view(request):
+            self.logger.warning("istek işleniyor")
+            return HttpResponse("ok")
+
+        return RequestContextMiddleware(view)(request)
+
+    def test_incoming_request_id_is_logged_and_returned(self):
+        request = RequestFactory().get("/", headers={"X-Request-ID": "lb-123.abc"})
+        request.user = User.objects.get(pk=self.personnel["kanat"].user.pk)
+
+        response = self.call(request)
+
+        self.assertEqual(response["X-Request-ID"], "lb-123.abc")
+        [record] = self.records
+        self.assertEqual(record.request_id, "lb-123.abc")
+        self.assertEqual(record.user_id, request.user.pk)
+        # Personel istek sırasında yüklenmediği için takım eklenmez
+        self.assertIsNone(record.team_id)
+        payload = json.loads(JsonFormatter().format(record))
+        self.assertEqual(payload["request_id"], "lb-123.abc")
+
+    def test_invalid_request_id_is_replaced(self):
+        request = RequestFactory().get("/", headers={"X-Request-ID": "a b\nc"})
+
+        response = self.call(request)
+
+        [record] = self.records
+        self.assertRegex(record.request_id, r"^[0-9a-f]{32}$")
+        self.assertEqual(response["X-Request-ID"], record.request_id)
+
+    def test_loaded_personnel_adds_team_without_queries(self):
+        user = User.objects.select_related("personnel").get(
+            pk=self.personnel["kanat"].user.pk
+        )
+        request = RequestFactory().get("/")
+        request.user = user
+
+        with self.assertNumQueries(0):
+            self.call(request)
+
+        [record] = self.records
+        self.assertEqual(record.user_id, user.pk)
+        self.assertEqual(record.team_id, self.teams["kanat"].pk)
+
+    def test_unresolved_lazy_user_is_not_loaded(self):
+        request = RequestFactory().get("/")
+        request.user = SimpleLazyObject(lambda: self.fail("kullanıcı yüklenmemeli"))
+
+        self.call(request)
+
+        [record] = self.records
+        self.assertIsNone(record.user_id)
+
+    def test_records_outside_request_have_no_context(self):
+        self.logger.warning("istek dışı")
+
+        [record] = self.records
+        self.assertIsNone(record.request_id)
+        self.assertIsNone(record.user_id)
+
+    def test_api_response_carries_request_id(self):
+        response = self.client_for("kanat").get(
+            "/api/v1/part-types/", headers={"X-Request-ID": "istemci-1"}
+        )
+
+        self.assertEqual(response["X-Request-ID"], "istemci-1")
+
+
+class OpenAPISchemaViewTests(SimpleTestCase):
+    """
+    Şema dosyasının kodlamaya göre ayrı ETag'lerle sunulduğunu, If-None-Match
+    listelerinin ayrıştırıldığını ve Accept-Encoding q değerlerine uyulduğunu doğrular.
+    """
+
+    artifact = SchemaArtifact("v1", b'{"a": 1}', gzip.compress(b'{"a": 1}'), '"abc"')
+
+    def get(self, **headers):
+        with mock.patch(
+            "core.views.docs.get_schema_artifact", return_value=self.artifact
+        ):
+            return OpenAPISchemaView.as_view()(
+                RequestFactory().get("/docs/openapi.json", headers=headers)
+            )
+
+    def test_accept_encoding_quality_values(self):
+        self.assertTrue(accepts_gzip("gzip"))
+        self.assertTrue(accepts_gzip("br, GZIP;q=0.5"))
+        self.assertTrue(accepts_gzip("br, *"))
+        self.assertFalse(accepts_gzip(""))
+        self.assertFalse(accepts_gzip("gzip;q=0"))
+        self.assertFalse(accepts_gzip("gzip;q=0.0, *"))
+        self.assertFalse(accepts_gzip("identity, *;q=0"))
+
+    def test_each_coding_has_its_own_etag(self):
+        plain = self.get()
+        zipped = self.get(**{"Accept-Encoding": "gzip, deflate"})
+
+        self.assertEqual(plain["ETag"], '"abc"')
+        self.assertEqual(plain.content, self.artifact.body)
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        self.assertEqual(zipped["ETag"], '"abc-gzip"')
+        self.assertEqual(zipped["Content-Encoding"], "gzip")
+        self.assertEqual(zipped.content, self.artifact.gzipped)
+        for response in (plain, zipped):
+            self.assertEqual(response["Vary"], "Accept-Encoding")
+
+    def test_refused_gzip_is_not_sent(self):
+        response = self.get(**{"Accept-Encoding": "gzip;q=0"})
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["ETag"], '"abc"')
+
+    def test_if_none_match_list(self):
+        response = self.get(
+            **{"Accept-Encoding": "gzip", "If-None-Match": 'W/"x", "abc-gzip"'}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], '"abc-gzip"')
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+
+        # Düz gövdenin ETag'i gzip'li gövdeyi doğrulamaz
+        response = self.get(**{"Accept-Encoding": "gzip", "If-None-Match": '"abc"'})
+        self.assertEqual(response.status_code, 200)
+
+        # Ayrıştırılmadan alt metin olarak aranan ETag eşleşmez
+        response = self.get(**{"If-None-Match": '"abcd"'})
+        self.assertEqual(response.status_code, 200)
+
+
+class ArchiveSerialTests(FactoryTestCase):
+    """
+    Arşivdeki seri numaralarıyla yeni kayıt oluşturulamadığını ve çakışan
+    uçakların arşivleme partisini bozmadan atlandığını doğrular.
+    """
+
+    def archive(self, aircraft):
+        Aircraft.objects.filter(pk=aircraft.pk).update(
+            assembled_at=timezone.now() - timedelta(days=400)
+        )
+        out, err = StringIO(), StringIO()
+        call_command("archive_parts", older_than_days=365, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_archived_serials_cannot_be_reused(self):
+        self.archive(self.assemble("UCK-1"))
+
+        response = self.produce("kanat", "UCK-1-kanat")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["details"], "Bu seri kodu başka bir parçada kullanılmış"
+        )
+
+        serials = [f"UCK-2-{name}" for name in REQUIRED_PART_TYPES]
+        for name, serial in zip(REQUIRED_PART_TYPES, serials):
+            self.assertEqual(self.produce(name, serial).status_code, 201)
+        response = self.client_for("montaj").post(
+            "/api/v1/aircraft/",
+            {
+                "serial_number": "UCK-1",
+                "model_id": self.aircraft_model.pk,
+                "parts": serials,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["details"],
+            "Bu seri numarasına sahip arşivlenmiş bir uçak mevcut.",
+        )
+
+    def test_colliding_aircraft_is_skipped(self):
+        self.archive(self.assemble("UCK-1"))
+        # Doğrulamadan önce oluşmuş çakışma: arşivdeki parça seri numarası tekrar kullanılmış
+        colliding = self.assemble("UCK-2")
+        Part.objects.filter(used_in_aircraft=colliding, type__name="kanat").update(
+            serial_number="UCK-1-kanat"
+        )
+        clean = self.assemble("UCK-3")
+        Aircraft.objects.filter(pk=colliding.pk).update(
+            assembled_at=timezone.now() - timedelta(days=400)
+        )
+
+        out, err = self.archive(clean)
+
+        self.assertIn(f"1 uçak, {len(REQUIRED_PART_TYPES)} parça", out)
+        self.assertIn(f"ID: {colliding.pk}", err)
+        self.assertTrue(Aircraft.objects.filter(pk=colliding.pk).exists())
+        self.assertEqual(
+            Part.objects.filter(used_in_aircraft=colliding).count(),
+            len(REQUIRED_PART_TYPES),
+        )
+        self.assertTrue(ArchivedAircraft.objects.filter(pk=clean.pk).exists())
+
+
+class CascadeDeletionTests(FactoryTestCase):
+    """
+    Parça tipi ve uçak modeli silinirken sayaç ve eşitleme işi tablolarının da
+    partiler halinde silindiğini ve satır içi silme sınırına sayıldığını doğrular.
+    """
+
+    def test_part_type_steps_include_rollups_and_sync_jobs(self):
+        self.produce("kanat", "K-1")
+        part_type = self.part_types["kanat"]
+        PartTeamSyncJob.objects.create(part_type=part_type)
+        # Parça, stok sayacı, üretim sayacı ve eşitleme işi
+        self.assertFalse(
+            exceeds_inline_limit(DeletionJob.TARGET_PART_TYPE, part_type.pk, 4)
+        )
+        self.assertTrue(
+            exceeds_inline_limit(DeletionJob.TARGET_PART_TYPE, part_type.pk, 3)
+        )
+
+        job = run_job(
+            DeletionJob.objects.create(
+                target_type=DeletionJob.TARGET_PART_TYPE, target_id=part_type.pk
+            ),
+            batch_size=1,
+        )
+
+        self.assertEqual(job.estimated_total, 4)
+        self.assertEqual(job.progress["core.PartProductionRollup"], 1)
+        self.assertEqual(job.progress["core.PartTeamSyncJob"], 1)
+        self.assertFalse(PartType.objects.filter(pk=part_type.pk).exists())
+        self.assertFalse(
+            PartProductionRollup.objects.filter(part_type=part_type).exists()
+        )
+
+    def test_aircraft_model_steps_include_assembly_rollups(self):
+        self.assemble("UCAK-1")
+        _, steps = cascade_steps(DeletionJob.TARGET_AIRCRAFT_MODEL)
+        self.assertIn((AircraftAssemblyRollup, "aircraft_model_id"), steps)
+
+        job = run_job(
+            DeletionJob.objects.create(
+                target_type=DeletionJob.TARGET_AIRCRAFT_MODEL,
+                target_id=self.aircraft_model.pk,
+            )
+        )
+
+        self.assertEqual(job.progress["core.AircraftAssemblyRollup"], 1)
+        self.assertFalse(AircraftAssemblyRollup.objects.exists())
+        self.assertFalse(Aircraft.objects.exists())
+
+
+class ProfilingGateTests(FactoryTestCase):
+    """
+    Profilin sadece geçerli imzalı X-Profile token'ı veya süper kullanıcının
+    ?_profile=1 isteğiyle alındığını doğrular.
+    """
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        override = override_settings(
+            PROFILING_ENABLED=True,
+            PROFILING_SAMPLE_RATE=0,
+            PROFILING_DIR=directory.name,
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def get(self, client, path="/api/v1/part-types/", **headers):
+        response = client.get(path, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_valid_token_profiles_request(self):
+        token = profiling.create_token(profiling.MODE_CPROFILE)
+
+        response = self.get(self.client_for("kanat"), **{PROFILE_HEADER: token})
+
+        profile_id = response["X-Profile-Id"]
+        [metadata] = profiling.list_profiles()
+        self.assertEqual(metadata["id"], profile_id)
+        self.assertEqual(metadata["mode"], profiling.MODE_CPROFILE)
+        self.assertEqual(metadata["path"], "/api/v1/part-types/")
+        self.assertGreater(profiling.get_profile(profile_id)["sql_count"], 0)
+
+    def test_invalid_or_expired_token_is_ignored(self):
+        client = self.client_for("kanat")
+        token = profiling.create_token()
+
+        for value in (token[:-1] + ("A" if token[-1] != "A" else "B"), "rastgele"):
+            self.assertFalse(
+                self.get(client, **{PROFILE_HEADER: value}).has_header("X-Profile-Id")
+            )
+        # Başka bir amaçla imzalanmış değer kabul edilmez
+        foreign = signing.dumps({"mode": profiling.MODE_CPROFILE})
+        self.assertFalse(
+            self.get(client, **{PROFILE_HEADER: foreign}).has_header("X-Profile-Id")
+        )
+        with override_settings(PROFILING_TOKEN_MAX_AGE=-1):
+            self.assertFalse(
+                self.get(client, **{PROFILE_HEADER: token}).has_header("X-Profile-Id")
+            )
+        self.assertEqual(profiling.list_profiles(), [])
+
+    def test_query_flag_requires_superuser(self):
+        path = "/api/v1/part-types/?_profile=cprofile"
+        self.assertFalse(
+            self.get(self.client_for("kanat"), path).has_header("X-Profile-Id")
+        )
+
+        # Middleware kullanıcıyı JWT'den çözer
+        admin = APIClient()
+        token = FilteredRefreshToken.for_user(
+            User.objects.create_superuser("admin", password="test-password")
+        )
+        admin.credentials(HTTP_AUTHORIZATION=f"Bearer {token.access_token}")
+        self.assertTrue(self.get(admin, path).has_header("X-Profile-Id"))
+
+    @override_settings(PROFILING_ENABLED=False)
+    def test_disabled_profiling_ignores_token(self):
+        token = profiling.create_token(profiling.MODE_CPROFILE)
+
+        response = self.get(self.client_for("kanat"), **{PROFILE_HEADER: token})
+
+        self.assertFalse(response.has_header("X-Profile-Id"))
+
+
+class QueryPlanCaptureTests(FactoryTestCase):
+    """
+    Yavaş sorgu planı yakalamanın örnekleme oranına, eşik süresine, istek başı
+    sınıra ve fingerprint başına yakalama aralığına uyduğunu doğrular.
+    """
+
+    @staticmethod
+    def explained(node_type="Seq Scan", index=None):
+        plan = {
+            "Node Type": node_type,
+            "Relation Name": "core_part",
+            "Total Cost": 10.0,
+            "Shared Read Blocks": 3,
+        }
+        if index:
+            plan["Index Name"] = index
+        return {"Plan": plan, "Execution Time": 1.5}
+
+    def test_normalized_sql_groups_parameters(self):
+        first = normalize_sql("SELECT * FROM p WHERE id IN (%s, %s, %s) AND s = 'a'")
+        second = normalize_sql("SELECT *  FROM p WHERE id IN (%s, %s) AND s = 'b''c'")
+
+        self.assertEqual(first, "SELECT * FROM p WHERE id IN (...) AND s = ?")
+        self.assertEqual(first, second)
+        self.assertEqual(fingerprint("v", first), fingerprint("v", second))
+        self.assertNotEqual(fingerprint("v", first), fingerprint("w", first))
+
+    def test_collector_keeps_only_slow_reads(self):
+        connection = connections["default"]
+        slow, fast = SlowQueryCollector(0), SlowQueryCollector(60_000)
+        with connection.execute_wrapper(slow), connection.execute_wrapper(fast):
+            list(Part.objects.all())
+            Part.objects.filter(pk=0).update(serial_number="X")
+
+        self.assertEqual(fast.queries, [])
+        [(_, alias, sql, _)] = slow.queries
+        self.assertEqual(alias, "default")
+        self.assertTrue(sql.startswith("SELECT"))
+
+    @override_settings(QUERY_PLAN_MAX_PER_REQUEST=1, QUERY_PLAN_CAPTURE_INTERVAL=3600)
+    def test_capture_plans_limits_per_request_and_interval(self):
+        queries = [
+            (300.0, "default", "SELECT * FROM core_part WHERE id = %s", [1]),
+            (900.0, "default", "SELECT * FROM core_aircraft WHERE id = %s", [2]),
+        ]
+        with mock.patch(
+            "core.query_plans.explain", return_value=self.explained()
+        ) as explain:
+            capture_plans("aircraft-detail", queries)
+            # Aynı sorgu aralık dolmadan tekrar yakalanmaz
+            capture_plans("aircraft-detail", queries)
+
+        explain.assert_called_once_with("default", queries[1][2], [2])
+        plan = QueryPlan.objects.get()
+        self.assertEqual(plan.sql, "SELECT * FROM core_aircraft WHERE id = ?")
+        self.assertEqual(plan.duration_ms, 900.0)
+        self.assertEqual(plan.samples, 1)
+
+    def test_record_plan_counts_samples_per_shape(self):
+        sql = "SELECT * FROM core_part WHERE id = %s"
+        record_plan("parts", sql, 250, self.explained(), release="r1")
+        record_plan("parts", sql, 260, self.explained(), release="r1")
+        record_plan(
+            "parts",
+            sql,
+            5,
+            self.explained("Index Scan", "core_part_pkey"),
+            release="r1",
+        )
+        record_plan("parts", sql, 240, self.explained(), release="r2")
+
+        shapes = {
+            (plan.release, plan.plan_shape): plan.samples
+            for plan in QueryPlan.objects.all()
+        }
+        self.assertEqual(
+            shapes,
+            {
+                ("r1", "Seq Scan core_part"): 2,
+                ("r1", "Index Scan core_part core_part_pkey"): 1,
+                ("r2", "Seq Scan core_part"): 1,
+            },
+        )
+
+    def test_middleware_samples_requests(self):
+        class PrefilledCollector(SlowQueryCollector):
+            def __init__(self, threshold_ms):
+                super().__init__(threshold_ms)
+                self.queries = [(500.0, "default", "SELECT 1", None)]
+
+        client = self.client_for("kanat")
+        with mock.patch(
+            "core.middleware.query_plans.SlowQueryCollector", PrefilledCollector
+        ), mock.patch("core.middleware.query_plans.capture_plans") as capture:
+            with override_settings(QUERY_PLAN_SAMPLE_RATE=0):
+                client.get("/api/v1/part-types/")
+            capture.assert_not_called()
+
+            with override_settings(QUERY_PLAN_SAMPLE_RATE=1):
+                client.get("/api/v1/part-types/")
+            capture.assert_called_once_with(
+                "part-types", [(500.0, "default", "SELECT 1", None)]
+            )
+
+            capture.reset_mock()
+            with override_settings(
+                QUERY_PLAN_SAMPLE_RATE=1, QUERY_PLAN_CAPTURE_ENABLED=False
+            ):
+                client.get("/api/v1/part-types/")
+            capture.assert_not_called()
+
+
+class GunicornConfigTests(SimpleTestCase):
+    """
+    gunicorn.conf.py'nin worker sınıfı seçimini ve bellek sınırını aşan
+    worker'ın yeniden başlatılmasını sahte bir worker ile doğrular.
+    """
+
+    MB = 1024 * 1024
+
+    def load_config(self, **env):
+        path = Path(settings.BASE_DIR) / "gunicorn.conf.py"
+        with mock.patch.dict(os.environ, env):
+            return runpy.run_path(str(path))
+
+    @staticmethod
+    def fake_worker():
+        return mock.Mock(pid=4242, alive=True)
+
+    def test_worker_class_selection(self):
+        config = self.load_config(GUNICORN_WORKER_CLASS="gthread", GUNICORN_THREADS="8")
+        self.assertEqual(config["worker_class"], "gthread")
+        self.assertEqual(config["wsgi_app"], "config.wsgi:application")
+        self.assertEqual(config["threads"], 8)
+
+        config = self.load_config(GUNICORN_WORKER_CLASS="async", GUNICORN_THREADS="8")
+        self.assertEqual(config["worker_class"], "uvicorn_worker.UvicornWorker")
+        self.assertEqual(config["wsgi_app"], "config.asgi:application")
+        self.assertEqual(config["threads"], 1)
+
+    def test_post_request_stops_worker_over_rss_limit(self):
+        config = self.load_config(GUNICORN_MAX_WORKER_RSS_MB="100")
+        worker = self.fake_worker()
+
+        with mock.patch("core.startup.current_rss", return_value=100 * self.MB):
+            config["post_request"](worker, None, {}, None)
+        self.assertTrue(worker.alive)
+
+        with mock.patch("core.startup.current_rss", return_value=101 * self.MB):
+            config["post_request"](worker, None, {}, None)
+        self.assertFalse(worker.alive)
+        worker.log.info.assert_called_once()
+
+    def test_post_request_skips_check_when_limit_disabled(self):
+        config = self.load_config(GUNICORN_MAX_WORKER_RSS_MB="0")
+        worker = self.fake_worker()
+
+        with mock.patch("core.startup.current_rss") as current_rss:
+            config["post_request"](worker, None, {}, None)
+        current_rss.assert_not_called()
+        self.assertTrue(worker.alive)
+
+    def test_watcher_terminates_async_worker_over_limit(self):
+        config = self.load_config(
+            GUNICORN_MAX_WORKER_RSS_MB="100", GUNICORN_RSS_CHECK_INTERVAL="2.5"
+        )
+        worker = self.fake_worker()
+
+        with mock.patch(
+            "core.startup.current_rss", side_effect=[50 * self.MB, 150 * self.MB]
+        ), mock.patch("time.sleep") as sleep, mock.patch("os.kill") as kill:
+            config["watch_worker_rss"](worker)
+
+        self.assertEqual(sleep.call_args_list, [mock.call(2.5)] * 2)
+        kill.assert_called_once_with(4242, signal.SIGTERM)
+
+    def test_post_worker_init_starts_watcher_only_for_async(self):
+        worker = self.fake_worker()
+        for kind, started in (("sync", False), ("async", True)):
+            config = self.load_config(
+                GUNICORN_WORKER_CLASS=kind,
+                GUNICORN_MAX_WORKER_RSS_MB="100",
+                GUNICORN_PRELOAD="True",
+            )
+            with self.subTest(kind=kind), mock.patch(
+                "core.startup.warm_up_app"
+            ) as warm_up_app, mock.patch(
+                "core.startup.warm_up_connections", return_value=[]
+            ), mock.patch(
+                "threading.Thread"
+            ) as thread:
+                config["post_worker_init"](worker)
+
+                warm_up_app.assert_not_called()
+                self.assertEqual(thread.called, started)
+                if started:
+                    self.assertIs(
+                        thread.call_args.kwargs["target"], config["watch_worker_rss"]
+                    )
+                    thread.return_value.start.assert_called_once_with()
+
+
+class LeadTimeStatsTests(SimpleTestCase):
+    """
+    Teslim süresi dağılımını ve personel üretim hızlarını elle hesaplanmış
+    küçük bir veri kümesiyle karşılaştırır.
+    """
+
+    def test_lead_time_stats_matches_hand_computed_groups(self):
+        # (parça tipi 1, model 1): 0.5, 1, 4, 10 saat; (parça tipi 2, model 3): 3000 saat
+        type_ids = np.array([1, 2, 1, 1, 1], dtype=np.int32)
+        model_ids = np.array([1, 3, 1, 1, 1], dtype=np.int32)
+        hours = np.array([10.0, 3000.0, 0.5, 4.0, 1.0], dtype=np.float32)
+
+        first, second = lead_time_stats(type_ids, model_ids, hours)
+
+        histogram = dict.fromkeys(
+            [f"<= {edge}" for edge in LEAD_TIME_BUCKETS_HOURS] + ["> 2160"], 0
+        )
+        # Dilim üst sınırları dahildir: 1 saat "<= 1" dilimine düşer
+        self.assertEqual(
+            first,
+            {
+                "part_type_id": 1,
+                "aircraft_model_id": 1,
+                "count": 4,
+                "mean_hours": 3.88,
+                "min_hours": 0.5,
+                "max_hours": 10.0,
+                # Doğrusal ara değer: p50 = (1 + 4) / 2, p90 = 4 + 0.7 * 6 ...
+                "p50_hours": 2.5,
+                "p90_hours": 8.2,
+                "p95_hours": 9.1,
+                "p99_hours": 9.82,
+                "histogram": {**histogram, "<= 1": 2, "<= 4": 1, "<= 24": 1},
+            },
+        )
+        self.assertEqual(
+            (second["part_type_id"], second["aircraft_model_id"], second["count"]),
+            (2, 3, 1),
+        )
+        self.assertEqual(second["p99_hours"], 3000.0)
+        self.assertEqual(second["histogram"], {**histogram, "> 2160": 1})
+
+    def test_lead_time_stats_large_keys_and_empty_input(self):
+        empty = np.empty(0, dtype=np.int32)
+        self.assertEqual(lead_time_stats(empty, empty, empty.astype(np.float32)), [])
+
+        # Büyük anahtarlar bincount yerine np.unique ile gruplanır
+        type_ids = np.array([DENSE_KEY_LIMIT, 1], dtype=np.int64)
+        model_ids = np.array([2, 2], dtype=np.int32)
+        rows = lead_time_stats(type_ids, model_ids, np.array([5.0, 7.0]))
+        self.assertEqual(
+            [(row["part_type_id"], row["mean_hours"]) for row in rows],
+            [(1, 7.0), (DENSE_KEY_LIMIT, 5.0)],
+        )
+
+    def test_production_rates_rolling_window_edges(self):
+        start, end = date(2026, 1, 1), date(2026, 1, 4)
+        lower = datetime(2026, 1, 1, tzinfo=dt_timezone.utc).timestamp()
+        day, upper = 86400, lower + 4 * 86400
+        # Personel 7 günlük: [2, 1, 0, 1]; personel 9: aralığın ilk ve son saniyesi
+        personnel_ids = np.array([7, 9, 7, 7, 9, 7], dtype=np.int64)
+        created = np.array(
+            [lower + 60, lower, lower + 3600, lower + day, upper - 1, lower + 3 * day]
+        )
+
+        self.assertEqual(
+            production_rates(personnel_ids, created, start, end, window_days=2),
+            [
+                {
+                    "personnel_id": 7,
+                    "total": 4,
+                    "active_days": 3,
+                    "mean_per_day": 1.0,
+                    # Kayan toplamlar: [3, 1, 1] / 2
+                    "current_rate": 0.5,
+                    "peak_rate": 1.5,
+                },
+                {
+                    "personnel_id": 9,
+                    "total": 2,
+                    "active_days": 2,
+                    "mean_per_day": 0.5,
+                    "current_rate": 0.5,
+                    "peak_rate": 0.5,
+                },
+            ],
+        )
+
+        # Aralıktan uzun pencere aralık uzunluğuna indirilir
+        [first, _] = production_rates(
+            personnel_ids, created, start, end, window_days=10
+        )
+        self.assertEqual((first["current_rate"], first["peak_rate"]), (1.0, 1.0))
+        self.assertEqual(
+            production_rates(personnel_ids[:0], created[:0], start, end, 2), []
+        )
+
+
+class ExportTests(FactoryTestCase):
+    """
+    Akıtılan Parquet dosyasının ve Arrow IPC akışının pyarrow ile şema, sözlük
+    kodlaması, arşiv bayrağı ve satır sayısı korunarak okunabildiğini doğrular.
+    """
+
+    def setUp(self):
+        super().setUp()
+        archived = self.assemble("UCK-1")
+        Aircraft.objects.filter(pk=archived.pk).update(
+            assembled_at=timezone.now() - timedelta(days=400)
+        )
+        call_command("archive_parts", older_than_days=365, stdout=StringIO())
+        self.assemble("UCK-2")
+        self.make_part("kanat", "K-BOS")
+
+        self.admin = APIClient()
+        self.admin.force_authenticate(
+            User.objects.create_user("yonetici", password="x", is_staff=True)
+        )
+
+    def download(self, dataset, file_format):
+        response = self.admin.get(
+            f"/api/v1/exports/{dataset}/", {"file_format": file_format}
+        )
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content)
+
+    def test_parquet_stream_round_trips(self):
+        data = self.download("parts", "parquet")
+
+        table = pq.read_table(pa.BufferReader(data))
+        self.assertEqual(table.schema.remove_metadata(), export_schema("parts"))
+        self.assertEqual(table.num_rows, 2 * len(REQUIRED_PART_TYPES) + 1)
+        self.assertEqual(
+            table.column("archived").to_pylist().count(True),
+            len(REQUIRED_PART_TYPES),
+        )
+        self.assertEqual(
+            set(table.column("part_type").to_pylist()), set(REQUIRED_PART_TYPES)
+        )
+        self.assertEqual(set(table.column("aircraft_model").to_pylist()), {"TB2"})
+
+        # Sadece düşük kardinaliteli sütunlar sözlük kodlanır
+        row_group = pq.ParquetFile(pa.BufferReader(data)).metadata.row_group(0)
+        encodings = {
+            row_group.column(index).path_in_schema: row_group.column(index).encodings
+            for index in range(row_group.num_columns)
+        }
+        for column in dictionary_columns("parts"):
+            self.assertIn("RLE_DICTIONARY", encodings[column])
+        self.assertNotIn("RLE_DICTIONARY", encodings["serial_number"])
+
+    def test_arrow_stream_round_trips(self):
+        table = pa.ipc.open_stream(self.download("aircraft", "arrow")).read_all()
+
+        self.assertEqual(table.schema, export_schema("aircraft"))
+        self.assertTrue(
+            pa.types.is_dictionary(table.schema.field("aircraft_model").type)
+        )
+        self.assertEqual(
+            table.select(["serial_number", "archived"]).to_pylist(),
+            [
+                {"serial_number": "UCK-2", "archived": False},
+                {"serial_number": "UCK-1", "archived": True},
+            ],
+        )
+
+
+class ExportPartitionTests(TransactionTestCase):
+    """
+    export_data komutunun kayıtları UTC güne göre Hive biçiminde (date=YYYY-MM-DD)
+    bölümlediğini doğrular. pyarrow partileri kendi thread'inde okuduğu için
+    kayıtlar commit edilir.
+    """
+
+    def setUp(self):
+        team = Team.objects.create(name="Kanat Takımı", responsibility="kanat")
+        self.personnel = Personnel.objects.create(
+            user=User.objects.create_user(username="kanat", password="test-password"),
+            full_name="Kanat Personeli",
+            team=team,
+        )
+        self.part_type = PartType.objects.create(name="kanat", allowed_team=team)
+        self.aircraft_model = AircraftModel.objects.create(name="TB2")
+
+    def make_part(self, serial_number, created_at):
+        part = Part.objects.create(
+            serial_number=serial_number,
+            type=self.part_type,
+            aircraft_model=self.aircraft_model,
+            produced_by=self.personnel,
+        )
+        Part.objects.filter(pk=part.pk).update(created_at=created_at)
+        return part
+
+    def test_export_data_partitions_by_day(self):
+        first_day = datetime(2026, 1, 1, 12, tzinfo=dt_timezone.utc)
+        archived = ArchivedAircraft.objects.create(
+            id=1,
+            serial_number="UCK-1",
+            model=self.aircraft_model,
+            assembled_at=first_day,
+        )
+        for index in range(3):
+            ArchivedPart.objects.create(
+                id=index + 1,
+                serial_number=f"K-ARSIV-{index}",
+                type=self.part_type,
+                aircraft_model=self.aircraft_model,
+                produced_by=self.personnel,
+                used_in_aircraft=archived,
+                created_at=first_day,
+                team=self.personnel.team,
+            )
+        for index in range(2):
+            self.make_part(f"K-{index}", first_day)
+        # Gün sınırı UTC'dir: 23:30 bir sonraki güne taşmaz
+        second_day = datetime(2026, 1, 2, 23, 30, tzinfo=dt_timezone.utc)
+        self.make_part("K-BOS", second_day)
+
+        with tempfile.TemporaryDirectory() as directory:
+            out = StringIO()
+            call_command("export_data", output=directory, dataset=["parts"], stdout=out)
+            self.assertIn("parts: 6 satır", out.getvalue())
+
+            root = Path(directory) / "parts"
+            self.assertEqual(
+                sorted(
+                    path.relative_to(root).as_posix()
+                    for path in root.rglob("*.parquet")
+                ),
+                [
+                    "date=2026-01-01/parts-0.parquet",
+                    "date=2026-01-02/parts-0.parquet",
+                ],
+            )
+
+            def rows_per_day():
+                table = ds.dataset(
+                    root, format="parquet", partitioning="hive"
+                ).to_table()
+                days = table.column("date").cast(pa.string()).to_pylist()
+                return {day: days.count(day) for day in set(days)}
+
+            self.assertEqual(rows_per_day(), {"2026-01-01": 5, "2026-01-02": 1})
+
+            # Yeniden yazılan günün dosyaları değiştirilir, diğer günlere dokunulmaz
+            self.make_part("K-YENI", second_day)
+            call_command(
+                "export_data",
+                output=directory,
+                dataset=["parts"],
+                start="2026-01-02",
+                end="2026-01-02",
+                stdout=StringIO(),
+            )
+            self.assertEqual(rows_per_day(), {"2026-01-01": 5, "2026-01-02": 2})
@@ -0,0 +1,231 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+# Kara listeye eklemelerde artırılan sürüm sayacının önbellek anahtarı
+VERSION_KEY = "token-revocation:version"
+# Eşzamanlı transaction'lar kimlikleri sırasız commit edebilir; her eşitlemede
+# son bu kadar saniyede görülen kimliklerden sonraki kayıtlar tekrar okunur
+LATE_COMMIT_WINDOW = 10
+
+
+class BloomFilter:
+    """
+    Sabit boyutlu Bloom filtresi. "Yok" cevabı kesindir; "olabilir" cevabı
+    error_rate olasılıkla yanlış pozitif olabilir.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.size = max(
+            64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        added = False
+        for position in self._positions(value):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        # Aynı değer tekrar eklendiğinde sayaç artmaz
+        if added:
+            self.count += 1
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(value)
+        )
+
+
+class RevocationFilter:
+    """
+    Kara listedeki refresh token JTI'larını süreç içinde tutan Bloom filtresi.
+
+    Filtrede olmayan bir JTI için veritabanına gidilmez. Filtre, VERSION_KEY
+    değiştiğinde veya son eşitlemeden TOKEN_REVOCATION_FILTER_SYNC_INTERVAL saniye
+    geçtiğinde yeni kara liste kayıtlarıyla güncellenir. Geç commit edilen kayıtları
+    kaçırmamak için her eşitlemede son LATE_COMMIT_WINDOW saniyelik kimlik aralığı
+    tekrar okunur. Kapasite aşılınca süresi dolmamış kayıtlardan yeniden kurulur.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._last_id = 0
+        # (monotonic zaman, o ana kadar görülen en büyük kimlik) kontrol noktaları;
+        # ilk eleman her zaman en az LATE_COMMIT_WINDOW saniye eskidir
+        self._checkpoints = deque()
+        self._version = None
+        self._synced_at = 0.0
+
+    def _rebuild(self):
+        now = timezone.now()
+        queryset = BlacklistedToken.objects.filter(token__expires_at__gt=now)
+        capacity = settings.TOKEN_REVOCATION_FILTER_CAPACITY
+        # Süresi dolmamış kayıtlar kapasiteyi aşıyorsa filtre büyütülür
+        count = queryset.count()
+        while count > capacity // 2:
+            capacity *= 2
+        self._bloom = BloomFilter(capacity, settings.TOKEN_REVOCATION_FILTER_ERROR_RATE)
+
+        # Kurulumdan önce başlayıp sonra commit edilen kayıtlar için alt sınır,
+        # pencereden önce eklenmiş kayıtların en büyük kimliğidir
+        floor = BlacklistedToken.objects.filter(
+            blacklisted_at__lt=now - timedelta(seconds=LATE_COMMIT_WINDOW)
+        ).aggregate(last_id=Max("id"))["last_id"]
+        # Süresi dolmuş kayıtlar da sayılır; aksi halde sonraki eşitleme tüm
+        # tabloyu tekrar okur
+        self._last_id = (
+            BlacklistedToken.objects.aggregate(last_id=Max("id"))["last_id"] or 0
+        )
+        for _, jti in self._rows(queryset):
+            self._bloom.add(jti)
+
+        started = time.monotonic()
+        self._checkpoints = deque(
+            [(started - LATE_COMMIT_WINDOW, floor or 0), (started, self._last_id)]
+        )
+
+    def _rows(self, queryset):
+        return queryset.order_by("id").values_list("id", "token__jti").iterator()
+
+    def _load_new(self):
+        """
+        Pencereden eski son kontrol noktasındaki kimlikten sonraki kayıtları okur.
+        Pencere içindeki kayıtlar birkaç kez okunur; filtreye tekrar eklemek zararsızdır.
+        """
+        now = time.monotonic()
+        checkpoints = self._checkpoints
+        while len(checkpoints) > 1 and now - checkpoints[1][0] >= LATE_COMMIT_WINDOW:
+            checkpoints.popleft()
+
+        for pk, jti in self._rows(
+            BlacklistedToken.objects.filter(id__gt=checkpoints[0][1])
+        ):
+            self._bloom.add(jti)
+            self._last_id = max(self._last_id, pk)
+
+        # Sık eşitlemelerde her seferinde kontrol noktası eklenmez; liste pencere
+        # başına en fazla on eleman tutar. Atlanan nokta alt sınırı sadece geride bırakır.
+        if now - checkpoints[-1][0] >= LATE_COMMIT_WINDOW / 10:
+            checkpoints.append((now, self._last_id))
+
+    def _sync(self, version):
+        if self._bloom is None or self._bloom.count > self._bloom.capacity:
+            self._rebuild()
+        else:
+            self._load_new()
+        self._version = version
+        self._synced_at = time.monotonic()
+
+    def might_be_revoked(self, jti):
+        """
+        JTI kara listede olabilirse True, kesinlikle yoksa False döndürür.
+        """
+        # Sürüm eşitlemeden önce okunur; eşitleme sırasında eklenen kayıt
+        # bir sonraki kontrolde sürüm farkından yakalanır
+        version = cache.get(VERSION_KEY, 0)
+        with self._lock:
+            if (
+                self._bloom is None
+                or version != self._version
+                or time.monotonic() - self._synced_at
+                > settings.TOKEN_REVOCATION_FILTER_SYNC_INTERVAL
+            ):
+                self._sync(version)
+            return jti in self._bloom
+
+    def add(self, jti):
+        """
+        Kara listeye eklenen JTI'yı filtreye ekler ve diğer süreçleri haberdar eder.
+        """
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+        transaction.on_commit(self._bump_version)
+
+    def _bump_version(self):
+        try:
+            version = cache.incr(VERSION_KEY)
+        except ValueError:
+            if cache.add(VERSION_KEY, 1, None):
+                version = 1
+            else:
+                version = cache.incr(VERSION_KEY)
+        with self._lock:
+            # Arada başka süreç sayacı artırmadıysa bu süreç için eşitleme gerekmez
+            if self._version is not None and version == self._version + 1:
+                self._version = version
+
+
+revocation_filter = RevocationFilter()
+
+_local_cache_warned = False
+
+
+def filter_enabled():
+    """
+    İptal filtresinin kullanılıp kullanılmayacağını döndürür.
+    Sürüm sayacı süreç içi bir önbellekte (LocMem, Dummy) tutulursa diğer
+    worker'ların eklediği kayıtlar hemen görülmez; bu durumda kara liste her
+    yenilemede veritabanından kontrol edilir.
+    """
+    global _local_cache_warned
+
+    if not settings.TOKEN_REVOCATION_FILTER_ENABLED:
+        return False
+    if isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache)):
+        if not _local_cache_warned:
+            _local_cache_warned = True
+            logger.warning(
+                "Token iptal filtresi ortak bir önbellek gerektirir "
+                "(DJANGO_CACHE_BACKEND); kara liste veritabanından kontrol edilecek."
+            )
+        return False
+    return True
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    Kara liste kontrolünü önce süreç içi iptal filtresinde yapan refresh token.
+    """
+
+    def check_blacklist(self):
+        if filter_enabled() and not revocation_filter.might_be_revoked(
+            self.payload[api_settings.JTI_CLAIM]
+        ):
+            return
+        super().check_blacklist()
+
+    def blacklist(self):
+        result = super().blacklist()
+        if filter_enabled():
+            revocation_filter.add(self.payload[api_settings.JTI_CLAIM])
+        return result
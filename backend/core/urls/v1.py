@@ -4,6 +4,23 @@ from core.views.auth import AuthView, RefreshTokenView, MeView
 from core.views.part import PartViewSet
 from core.views.part_type import PartTypeViewSet
 from core.views.aircraft_model import AircraftModelViewSet
+from core.views.batch import BatchView
+from core.views.analytics import (
+    AircraftAssemblyAnalyticsView,
+    LeadTimeAnalyticsView,
+    PartProductionAnalyticsView,
+    ProductionRateAnalyticsView,
+)
+from core.views.export import ExportView
+from core.views.search import SearchView
+from core.views.system import (
+    DbPoolStatsView,
+    LoggingStatsView,
+    AdmissionStatsView,
+    ProfileListView,
+    ProfileDetailView,
+    ProfileDownloadView,
+)
 
 urlpatterns = [
     path("auth/", AuthView.as_view(), name="token_obtain_pair"),
@@ -27,6 +44,16 @@ urlpatterns = [
         AircraftViewSet.as_view({"get": "list", "post": "create"}),
         name="aircraft",
     ),
+    path(
+        "aircraft/capacity/",
+        AircraftViewSet.as_view({"get": "capacity"}),
+        name="aircraft-capacity",
+    ),
+    path(
+        "aircraft/disassemble/",
+        AircraftViewSet.as_view({"post": "disassemble"}),
+        name="aircraft-disassemble",
+    ),
     path(
         "aircraft/<int:pk>/",
         AircraftViewSet.as_view({"get": "retrieve", "delete": "destroy"}),
@@ -48,4 +75,41 @@ urlpatterns = [
         AircraftModelViewSet.as_view({"get": "retrieve"}),
         name="aircraft-models-detail",
     ),
+    path("batch/", BatchView.as_view(), name="batch"),
+    path(
+        "analytics/parts/",
+        PartProductionAnalyticsView.as_view(),
+        name="analytics-parts",
+    ),
+    path(
+        "analytics/aircraft/",
+        AircraftAssemblyAnalyticsView.as_view(),
+        name="analytics-aircraft",
+    ),
+    path(
+        "analytics/lead-times/",
+        LeadTimeAnalyticsView.as_view(),
+        name="analytics-lead-times",
+    ),
+    path(
+        "analytics/production-rates/",
+        ProductionRateAnalyticsView.as_view(),
+        name="analytics-production-rates",
+    ),
+    path("search/", SearchView.as_view(), name="search"),
+    path("exports/<str:dataset>/", ExportView.as_view(), name="exports"),
+    path("system/db-pool/", DbPoolStatsView.as_view(), name="system-db-pool"),
+    path("system/logging/", LoggingStatsView.as_view(), name="system-logging"),
+    path("system/admission/", AdmissionStatsView.as_view(), name="system-admission"),
+    path("system/profiles/", ProfileListView.as_view(), name="system-profiles"),
+    path(
+        "system/profiles/<str:profile_id>/",
+        ProfileDetailView.as_view(),
+        name="system-profile-detail",
+    ),
+    path(
+        "system/profiles/<str:profile_id>/download/",
+        ProfileDownloadView.as_view(),
+        name="system-profile-download",
+    ),
 ]
@@ -4,6 +4,8 @@ from rest_framework.exceptions import (
     NotAuthenticated,
     ValidationError,
 )
+from django.http import HttpResponse
+from django.utils.http import parse_etags
 from rest_framework.response import Response
 from rest_framework.pagination import LimitOffsetPagination
 
@@ -41,3 +43,20 @@ class CustomPagination(LimitOffsetPagination):
 
     def get_paginated_response(self, data):
         return Response({"total": self.count, "data": data})
+
+
+def etag_response(request, body, etag, cache_control="no-cache"):
+    """
+    Hazır JSON gövdesini ETag ile döndürür.
+    İstemcinin If-None-Match başlığı ETag ile eşleşirse gövdesiz 304 döner.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and (
+        if_none_match.strip() == "*" or etag in parse_etags(if_none_match)
+    ):
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = cache_control
+    return response
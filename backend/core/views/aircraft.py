@@ -1,33 +1,57 @@
 from core.models.aircraft import Aircraft
+from core.models.archived_aircraft import ArchivedAircraft
 from core.models.part import Part
 from core.models.part_type import PartType
 from core.permission import IsTeamAuthorizedForAircraft
+from core.views.mixins import (
+    ReplicaReadMixin,
+    SparseFieldsMixin,
+    WatermarkETagMixin,
+    wants_archived,
+)
+from core.watermarks import AIRCRAFT, PARTS, bump
+from core.rollups import adjust_rollups, record_aircraft_assembled
+from core.stock import (
+    REQUIRED_PART_TYPES,
+    adjust_stock,
+    buildable_capacity,
+    free_counts,
+    part_counts,
+)
+from django.db import transaction
+from django.db.models import Count, Q
 from rest_framework import viewsets, permissions, status
-from rest_framework.exceptions import ValidationError
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
-from core.serializers.aircraft import AircraftSerializer, AircraftDetailSerializer
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
+from core.serializers.aircraft import (
+    AircraftSerializer,
+    AircraftDetailSerializer,
+    AircraftDisassembleSerializer,
+)
+from core.serializers.archive import (
+    ArchivedAircraftSerializer,
+    ArchivedAircraftDetailSerializer,
+)
+from core.api_docs import lazy_swagger_auto_schema
+from core.idempotency import idempotent
+from core.aircraft_cache import (
+    cache_aircraft_detail,
+    current_version,
+    evict_aircraft_detail,
+    get_aircraft_detail,
+)
+from core.utils import etag_response
 import logging
 
 # Loglama için logger tanımlaması
 logger = logging.getLogger(__name__)
 
-# Tam bir uçak için gerekli olan parça tipleri ve miktarları
-REQUIRED_PART_TYPES = {
-    "kanat": 1,
-    "gövde": 1,
-    "kuyruk": 1,
-    "aviyonik": 1,
-}
 
-
-@swagger_auto_schema(
-    tags=["Aircraft"],
-    operation_summary="Uçak İşlemleri",
-    operation_description="Uçak montajı ve detaylarını görüntüleme işlemleri. Sadece Montaj takımı üyeleri erişebilir.",
-)
-class AircraftViewSet(viewsets.ModelViewSet):
+@lazy_swagger_auto_schema("core.api_docs.aircraft.viewset_schema")
+class AircraftViewSet(
+    ReplicaReadMixin, WatermarkETagMixin, SparseFieldsMixin, viewsets.ModelViewSet
+):
     """
     Uçak işlemleri için kullanılan viewset.
     Bu viewset uçakların listelenmesi, detaylarının görüntülenmesi ve yeni uçak montajı işlemlerini yönetir.
@@ -38,45 +62,41 @@ class AircraftViewSet(viewsets.ModelViewSet):
     serializer_class = AircraftSerializer
     # Kimlik doğrulama ve montaj takımı yetkisi kontrolü
     permission_classes = [permissions.IsAuthenticated, IsTeamAuthorizedForAircraft]
+    # Liste ETag'i uçak koleksiyonunun sayacından üretilir
+    watermark_names = (AIRCRAFT,)
 
     def get_queryset(self):
         """
         Tüm uçakları getiren queryset.
+        ?archived=true ile arşivlenmiş uçaklar getirilir.
         """
-        user = self.request.user
+        # Şema üretimi sırasında istek bulunmaz
+        if getattr(self, "swagger_fake_view", False):
+            return Aircraft.objects.none()
+        if wants_archived(self.request):
+            return ArchivedAircraft.objects.all()
         return Aircraft.objects.all()
 
     def get_serializer_class(self):
         """
         İşlem tipine göre uygun serializer'ı döndürür.
         Detay görüntüleme için AircraftDetailSerializer, diğer işlemler için AircraftSerializer kullanılır.
+        Arşiv okumalarında bunların arşiv karşılıkları kullanılır.
+        Şema üretiminde istek olmadığı için canlı tablo serializer'ları kullanılır.
         """
+        # Şema üretimi sırasında istek bulunmaz
+        schema_request = (
+            getattr(self, "swagger_fake_view", False) or self.request is None
+        )
+        if not schema_request and wants_archived(self.request):
+            if self.action == "retrieve":
+                return ArchivedAircraftDetailSerializer
+            return ArchivedAircraftSerializer
         if self.action == "retrieve":
             return AircraftDetailSerializer
         return self.serializer_class
 
-    @swagger_auto_schema(
-        operation_summary="Uçak Listesi",
-        operation_description="Tüm uçakların listesini getirir. Sadece Montaj takımı üyeleri erişebilir.",
-        responses={200: AircraftDetailSerializer(many=True)},
-        manual_parameters=[
-            openapi.Parameter(
-                "limit",
-                openapi.IN_QUERY,
-                description="Sayfalama için limit değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-            openapi.Parameter(
-                "offset",
-                openapi.IN_QUERY,
-                description="Sayfalama için offset değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-        ],
-        tags=["Aircraft"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.aircraft.list_schema")
     def list(self, request, *args, **kwargs):
         """
         Tüm uçakların listesini getirir.
@@ -84,49 +104,31 @@ class AircraftViewSet(viewsets.ModelViewSet):
         """
         return super().list(request, *args, **kwargs)
 
-    @swagger_auto_schema(
-        operation_summary="Uçak Detaylarını Getir",
-        operation_description="Belirtilen ID'ye sahip uçağın detaylarını getirir. Sadece Montaj takımı üyeleri erişebilir.",
-        responses={200: AircraftDetailSerializer},
-        tags=["Aircraft"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.aircraft.retrieve_schema")
     def retrieve(self, request, *args, **kwargs):
         """
         Belirli bir uçağın detaylı bilgilerini getirir.
         Uçak ID'si URL'de belirtilmelidir.
+
+        Monte edilmiş uçak silinene kadar değişmediği için yanıt önbellekten döner.
+        Kayıtlar uçak bazında çıkarılır; ortak önbellekte veritabanı hiç okunmaz, süreç içi
+        önbellekte sadece detay sayacı okunur. Yanıtın ETag'i If-None-Match ile gönderilirse
+        gövdesiz 304 döner.
         """
-        return super().retrieve(request, *args, **kwargs)
-
-    @swagger_auto_schema(
-        operation_summary="Yeni Uçak Montajı",
-        operation_description="""
-Montaj takımı, parçaları birleştirerek yeni bir uçak oluşturur.
-
-Kurallar:
-- Parçalar, sadece tanımlı uçak modeli için üretilmiş olmalıdır
-- Aynı parça başka uçakta daha önce kullanılmamış olmalıdır
-- Parça seri kodları geçerli olmalıdır
-        """,
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=["serial_number", "model_id", "parts"],
-            properties={
-                "serial_number": openapi.Schema(
-                    type=openapi.TYPE_STRING, description="Uçak seri numarası"
-                ),
-                "model_id": openapi.Schema(
-                    type=openapi.TYPE_INTEGER, description="Uçak modeli ID"
-                ),
-                "parts": openapi.Schema(
-                    type=openapi.TYPE_ARRAY,
-                    items=openapi.Schema(type=openapi.TYPE_STRING),
-                    description="Bu uçak ile ilişkilendirilecek parçaların seri numaralarının listesi",
-                ),
-            },
-        ),
-        responses={201: AircraftSerializer},
-        tags=["Aircraft"],
-    )
+        # Önbellekte tam yanıt tutulur; alan seçimi yapılan istekler veritabanından okunur
+        if wants_archived(request) or self.has_field_selection():
+            return super().retrieve(request, *args, **kwargs)
+
+        # Sayaç (varsa) uçaktan önce okunur; arada yapılan yazma bir sonraki istekte görülür
+        version = current_version()
+        entry = get_aircraft_detail(self.kwargs[self.lookup_field], version)
+        if entry is None:
+            entry = cache_aircraft_detail(self.get_object(), version)
+        # Yanıt kimlik doğrulamalıdır; ara önbellekler her kullanımda doğrulatmalıdır
+        return etag_response(request, entry["body"], entry["etag"], "public, no-cache")
+
+    @lazy_swagger_auto_schema("core.api_docs.aircraft.create_schema")
+    @idempotent
     def create(self, request, *args, **kwargs):
         """
         Yeni bir uçak montajı yapar.
@@ -191,24 +193,44 @@ Kurallar:
                 logger.error(f"Validation error: {error_msg}")
                 raise ValidationError({"details": error_msg})
 
-        # Uçağı oluştur
-        aircraft = serializer.save(assembled_by=personnel)
+        # Takılacak parçalar (hepsi stokta olduğu doğrulandı) stoktan düşülür
+        installed = free_counts(parts)
 
-        # Parçaları yeni uçakla ilişkilendir
-        for part in parts:
-            part.used_in_aircraft = aircraft
-            part.save()
+        with transaction.atomic():
+            # Uçağı oluştur
+            aircraft = serializer.save(assembled_by=personnel)
+            adjust_stock(installed, sign=-1)
+            record_aircraft_assembled([aircraft])
+
+            # Parçaları yeni uçakla ilişkilendir
+            for part in parts:
+                part.used_in_aircraft = aircraft
+                part.save()
+
+            bump(AIRCRAFT, PARTS)
+
+        # Detay yanıtı ilk görüntülemeden önce önbelleğe alınır
+        transaction.on_commit(lambda: cache_aircraft_detail(aircraft))
 
         return Response(
             self.get_serializer(aircraft).data, status=status.HTTP_201_CREATED
         )
 
-    @swagger_auto_schema(
-        operation_summary="Uçak Sil",
-        operation_description="Belirtilen ID'ye sahip uçağı siler. Sadece Montaj takımı üyeleri erişebilir.",
-        responses={204: "Uçak başarıyla silindi"},
-        tags=["Aircraft"],
-    )
+    def perform_destroy(self, instance):
+        """
+        Uçağı siler. Parçaların uçak ilişkisi de kaldırıldığı için iki koleksiyonun sayacı artırılır
+        ve parçalar stoğa eklenir; uçak montaj sayaçlarından düşülür, detay yanıtı önbellekten çıkarılır.
+        """
+        with transaction.atomic():
+            released = part_counts(Part.objects.filter(used_in_aircraft=instance))
+            adjust_rollups(Aircraft.objects.filter(pk=instance.pk), sign=-1)
+            aircraft_id = instance.pk
+            instance.delete()
+            adjust_stock(released)
+            bump(AIRCRAFT, PARTS)
+            evict_aircraft_detail([aircraft_id])
+
+    @lazy_swagger_auto_schema("core.api_docs.aircraft.destroy_schema")
     def destroy(self, request, *args, **kwargs):
         """
         Belirli bir uçağı siler.
@@ -217,3 +239,91 @@ Kurallar:
         instance = self.get_object()
         self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @lazy_swagger_auto_schema("core.api_docs.aircraft.capacity_schema")
+    @action(detail=False, methods=["get"], url_path="capacity")
+    def capacity(self, request):
+        """
+        Her uçak modeli için stoktaki parçalarla monte edilebilecek tam uçak sayısını
+        ve darboğaz parça tipini döndürür.
+
+        Hesap parça tablosu taranmadan stok sayaçlarından (core_partstockcount) yapılır.
+        """
+        result = buildable_capacity()
+
+        # Sayfalama uygula
+        page = self.paginate_queryset(result)
+        if page is not None:
+            return self.get_paginated_response(page)
+
+        return Response(result)
+
+    @lazy_swagger_auto_schema("core.api_docs.aircraft.disassemble_schema")
+    @action(detail=False, methods=["post"], url_path="disassemble")
+    def disassemble(self, request):
+        """
+        Birden fazla uçağı söker ve parçalarını stoğa geri döndürür.
+
+        Sorgu sayısı uçak ve parça sayısından bağımsızdır:
+        1. Uçaklar ID veya seri numarasına göre tek sorguda bulunur
+        2. Stoğa dönecek parçalar model ve tipine göre tek sorguda sayılır
+        3. Parçaların uçak ilişkisi tek UPDATE ile kaldırılır, stok sayaçları artırılır
+        4. Uçaklar ORM üzerinden tek DELETE ile silinir
+        """
+        serializer = AircraftDisassembleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        serial_numbers = serializer.validated_data["serial_numbers"]
+
+        with transaction.atomic():
+            found = list(
+                Aircraft.objects.select_for_update()
+                .filter(Q(id__in=ids) | Q(serial_number__in=serial_numbers))
+                .values_list("id", "serial_number")
+            )
+            if not found:
+                raise NotFound({"details": "Belirtilen uçaklar bulunamadı."})
+
+            aircraft_ids = [aircraft_id for aircraft_id, _ in found]
+            parts = Part.objects.filter(used_in_aircraft_id__in=aircraft_ids)
+            released = {}
+            stock = {}
+            for row in parts.values(
+                "aircraft_model_id", "type_id", "type__name"
+            ).annotate(count=Count("id")):
+                name = row["type__name"]
+                released[name] = released.get(name, 0) + row["count"]
+                stock[(row["aircraft_model_id"], row["type_id"])] = row["count"]
+            parts.update(used_in_aircraft=None)
+            adjust_stock(stock)
+
+            # Parçalar yukarıda serbest bırakıldığı için silme toplayıcısının
+            # SET NULL güncellemesi hiçbir satırı etkilemez
+            adjust_rollups(Aircraft.objects.filter(id__in=aircraft_ids), sign=-1)
+            Aircraft.objects.filter(id__in=aircraft_ids).delete()
+            bump(AIRCRAFT, PARTS)
+            evict_aircraft_detail(aircraft_ids)
+
+        found_ids = set(aircraft_ids)
+        found_serials = {serial for _, serial in found}
+        logger.info(
+            "%s uçak söküldü, %s parça stoğa döndü.",
+            len(found),
+            sum(released.values()),
+        )
+        return Response(
+            {
+                "disassembled_count": len(found),
+                "disassembled": sorted(found_serials),
+                "released_parts": released,
+                "released_total": sum(released.values()),
+                "not_found": {
+                    "ids": [i for i in ids if i not in found_ids],
+                    "serial_numbers": [
+                        serial
+                        for serial in serial_numbers
+                        if serial not in found_serials
+                    ],
+                },
+            }
+        )
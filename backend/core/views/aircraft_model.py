@@ -1,12 +1,12 @@
 from core.models.aircraft_model import AircraftModel
 from rest_framework import viewsets, permissions
 from core.serializers.aircraft_model import AircraftModelSerializer
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
+from core.api_docs import lazy_swagger_auto_schema
 from rest_framework.response import Response
+from core.views.mixins import ReplicaReadMixin
 
 
-class AircraftModelViewSet(viewsets.ReadOnlyModelViewSet):
+class AircraftModelViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """
     Uçak modellerini görüntülemek için kullanılan viewset.
     Bu viewset sadece okuma işlemlerine izin verir (listeleme ve detay görüntüleme).
@@ -19,57 +19,7 @@ class AircraftModelViewSet(viewsets.ReadOnlyModelViewSet):
     # Sadece kimliği doğrulanmış kullanıcıların erişimine izin veren izin sınıfı
     permission_classes = [permissions.IsAuthenticated]
 
-    @swagger_auto_schema(
-        operation_summary="Uçak Modellerini Listele",
-        operation_description="Sistemdeki tüm uçak modellerini listeler",
-        responses={
-            200: openapi.Response(
-                description="Başarılı yanıt",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "total": openapi.Schema(
-                            type=openapi.TYPE_INTEGER, description="Toplam kayıt sayısı"
-                        ),
-                        "data": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "id": openapi.Schema(
-                                        type=openapi.TYPE_INTEGER,
-                                        description="Uçak modeli ID",
-                                    ),
-                                    "name": openapi.Schema(
-                                        type=openapi.TYPE_STRING,
-                                        description="Uçak modeli adı",
-                                    ),
-                                },
-                            ),
-                            description="Uçak modelleri listesi",
-                        ),
-                    },
-                ),
-            )
-        },
-        manual_parameters=[
-            openapi.Parameter(
-                "limit",
-                openapi.IN_QUERY,
-                description="Sayfalama için limit değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-            openapi.Parameter(
-                "offset",
-                openapi.IN_QUERY,
-                description="Sayfalama için offset değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-        ],
-        tags=["Aircraft Models"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.aircraft_model.list_schema")
     def list(self, request, *args, **kwargs):
         """
         Tüm uçak modellerini listeler.
@@ -99,27 +49,7 @@ class AircraftModelViewSet(viewsets.ReadOnlyModelViewSet):
         total_count = self.get_queryset().count()
         return Response({"total": total_count, "data": serializer.data})
 
-    @swagger_auto_schema(
-        operation_summary="Uçak Model Detayı",
-        operation_description="Belirli bir uçak modelinin detaylarını gösterir",
-        responses={
-            200: openapi.Response(
-                description="Başarılı yanıt",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "id": openapi.Schema(
-                            type=openapi.TYPE_INTEGER, description="Uçak modeli ID"
-                        ),
-                        "name": openapi.Schema(
-                            type=openapi.TYPE_STRING, description="Uçak modeli adı"
-                        ),
-                    },
-                ),
-            )
-        },
-        tags=["Aircraft Models"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.aircraft_model.retrieve_schema")
     def retrieve(self, request, *args, **kwargs):
         """
         Belirli bir uçak modelinin detaylı bilgilerini getirir.
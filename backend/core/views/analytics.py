@@ -0,0 +1,174 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import PermissionDenied
+from core.api_docs import lazy_swagger_auto_schema
+from core.models import AircraftAssemblyRollup, PartProductionRollup
+from core.permission import IsTeamAuthorizedForAircraft
+from core.rollups import rollup_series
+from core.serializers.analytics import (
+    AircraftAnalyticsQuerySerializer,
+    LeadTimeQuerySerializer,
+    PartAnalyticsQuerySerializer,
+    ProductionRateQuerySerializer,
+)
+from core.views.mixins import ReplicaReadMixin
+
+
+def _series_response(query, rows, names):
+    """
+    Sayaç satırlarını yanıt biçimine çevirir; alan adları names ile yeniden adlandırılır.
+    """
+    data = [
+        {
+            "period": row["period"].isoformat(),
+            **{name: row[field] for field, name in names.items()},
+            "count": row["count"],
+        }
+        for row in rows
+    ]
+    return Response(
+        {
+            "start": query["start"],
+            "end": query["end"],
+            "interval": query["interval"],
+            "total": sum(item["count"] for item in data),
+            "data": data,
+        }
+    )
+
+
+class PartProductionAnalyticsView(ReplicaReadMixin, APIView):
+    """
+    Takım ve parça tipi bazında dilim başına üretilen parça sayısını döndüren view.
+    Montaj takımı tüm takımları, diğer takımlar sadece kendi üretimlerini görür.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @lazy_swagger_auto_schema("core.api_docs.analytics.part_production_schema")
+    def get(self, request):
+        """
+        Verilen tarih aralığındaki üretimi saatlik veya günlük dilimlerle getirir.
+        """
+        serializer = PartAnalyticsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data
+
+        personnel = getattr(request.user, "personnel", None)
+        if not personnel or not personnel.team:
+            raise PermissionDenied(
+                {"details": "Bu işlem için bir takıma ait olmanız gerekmektedir."}
+            )
+
+        queryset = PartProductionRollup.objects.all()
+        if personnel.team.responsibility.lower() != "montaj":
+            queryset = queryset.filter(team_id=personnel.team_id)
+        elif "team_id" in query:
+            queryset = queryset.filter(team_id=query["team_id"])
+        if "part_type_id" in query:
+            queryset = queryset.filter(part_type_id=query["part_type_id"])
+
+        names = {
+            "team_id": "team_id",
+            "team__name": "team_name",
+            "part_type_id": "part_type_id",
+            "part_type__name": "part_type_name",
+        }
+        rows = rollup_series(
+            queryset, query["start"], query["end"], query["interval"], list(names)
+        )
+        return _series_response(query, rows, names)
+
+
+class AircraftAssemblyAnalyticsView(ReplicaReadMixin, APIView):
+    """
+    Uçak modeli bazında dilim başına monte edilen uçak sayısını döndüren view.
+    Sadece montaj takımı üyeleri erişebilir.
+    """
+
+    permission_classes = [IsAuthenticated, IsTeamAuthorizedForAircraft]
+
+    @lazy_swagger_auto_schema("core.api_docs.analytics.aircraft_assembly_schema")
+    def get(self, request):
+        """
+        Verilen tarih aralığındaki montajları saatlik veya günlük dilimlerle getirir.
+        """
+        serializer = AircraftAnalyticsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data
+
+        queryset = AircraftAssemblyRollup.objects.all()
+        if "aircraft_model_id" in query:
+            queryset = queryset.filter(aircraft_model_id=query["aircraft_model_id"])
+
+        names = {
+            "aircraft_model_id": "aircraft_model_id",
+            "aircraft_model__name": "aircraft_model_name",
+        }
+        rows = rollup_series(
+            queryset, query["start"], query["end"], query["interval"], list(names)
+        )
+        return _series_response(query, rows, names)
+
+
+class LeadTimeAnalyticsView(ReplicaReadMixin, APIView):
+    """
+    Parça tipi ve uçak modeli bazında parçanın üretiminden uçağa montajına kadar
+    geçen sürenin dağılımını döndüren view. Sadece montaj takımı üyeleri erişebilir.
+    """
+
+    permission_classes = [IsAuthenticated, IsTeamAuthorizedForAircraft]
+
+    @lazy_swagger_auto_schema("core.api_docs.analytics.lead_time_schema")
+    def get(self, request):
+        """
+        Verilen tarih aralığında monte edilen uçakların parça teslim sürelerini getirir.
+        """
+        # NumPy açılışta değil, ilk rapor isteğinde yüklenir
+        from core.lead_times import lead_time_report
+
+        serializer = LeadTimeQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data
+
+        data = lead_time_report(query["start"], query["end"])
+        return Response(
+            {
+                "start": query["start"],
+                "end": query["end"],
+                "total": sum(row["count"] for row in data),
+                "data": data,
+            }
+        )
+
+
+class ProductionRateAnalyticsView(ReplicaReadMixin, APIView):
+    """
+    Personel başına günlük üretim ve kayan ortalama üretim hızını döndüren view.
+    Sadece montaj takımı üyeleri erişebilir.
+    """
+
+    permission_classes = [IsAuthenticated, IsTeamAuthorizedForAircraft]
+
+    @lazy_swagger_auto_schema("core.api_docs.analytics.production_rate_schema")
+    def get(self, request):
+        """
+        Verilen tarih aralığında personel başına üretim hızlarını getirir.
+        """
+        from core.lead_times import production_rate_report
+
+        serializer = ProductionRateQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data
+
+        data = production_rate_report(query["start"], query["end"], query["window"])
+        return Response(
+            {
+                "start": query["start"],
+                "end": query["end"],
+                "window": query["window"],
+                "total": sum(row["total"] for row in data),
+                "data": data,
+            }
+        )
@@ -0,0 +1,26 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from core.api_docs import lazy_swagger_auto_schema
+from core.batch import run_batch
+from core.serializers.batch import BatchSerializer
+
+
+class BatchView(APIView):
+    """
+    Birden fazla okuma isteğini tek HTTP isteğinde çalıştıran view.
+    Arayüzün açılışta yaptığı istekler (me, parça tipleri, uçak modelleri, stok,
+    parçalar) tek kimlik doğrulaması ve tek gidiş-dönüşle alınır.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @lazy_swagger_auto_schema("core.api_docs.batch.batch_schema")
+    def post(self, request):
+        """
+        Alt istekleri çalıştırır; her biri için durum kodu ve gövde döndürür.
+        """
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = run_batch(request, serializer.validated_data["requests"])
+        return Response({"responses": results})
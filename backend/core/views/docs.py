@@ -0,0 +1,81 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.views import View
+from core.schema import get_schema_artifact, get_schema_view
+
+
+def accepts_gzip(accept_encoding):
+    """
+    Accept-Encoding başlığına göre istemcinin gzip kabul edip etmediğini döndürür.
+    q=0 ile reddedilen kodlamalar kabul edilmez; gzip açıkça belirtilmemişse
+    "*" değeri kullanılır.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+
+    quality = qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0)))
+    return quality > 0
+
+
+class OpenAPISchemaView(View):
+    """
+    Önceden üretilmiş OpenAPI şemasını statik bir dosya gibi sunan view.
+    Şema her istekte yeniden üretilmez; ETag ile doğrulama ve gzip desteği vardır.
+    Gzip'li ve düz gövdeler farklı bayt dizileri olduğu için her kodlamanın ayrı ETag'i vardır.
+    """
+
+    def get(self, request):
+        artifact = get_schema_artifact()
+
+        if accepts_gzip(request.headers.get("Accept-Encoding", "")):
+            body = artifact.gzipped
+            etag = artifact.etag[:-1] + '-gzip"'
+        else:
+            body = artifact.body
+            etag = artifact.etag
+
+        # İstemcideki kopya güncelse gövde gönderilmez
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and (
+            if_none_match.strip() == "*" or etag in parse_etags(if_none_match)
+        ):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(body, content_type="application/json")
+            if body is artifact.gzipped:
+                response["Content-Encoding"] = "gzip"
+            response["X-Schema-Version"] = artifact.version
+
+        response["ETag"] = etag
+        response["Cache-Control"] = "public, max-age=300"
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
+
+
+# Swagger arayüzü view'ı ilk istekte oluşturulur
+_swagger_ui_view = None
+
+
+def swagger_ui_view(request, *args, **kwargs):
+    """
+    Swagger arayüzünü sunar. drf_yasg view'ı ilk istekte oluşturulur, böylece
+    URL yapılandırması yüklenirken drf_yasg.views import edilmez.
+    """
+    global _swagger_ui_view
+
+    if _swagger_ui_view is None:
+        _swagger_ui_view = get_schema_view().with_ui("swagger", cache_timeout=0)
+    return _swagger_ui_view(request, *args, **kwargs)
@@ -0,0 +1,57 @@
+from django.db import router
+from django.http import Http404, StreamingHttpResponse
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAdminUser
+from core.api_docs import lazy_swagger_auto_schema
+from core.models import Part
+from core.serializers.export import ExportQuerySerializer
+from core.views.mixins import ReplicaReadMixin
+
+# Biçim başına yanıt içerik tipi ve dosya uzantısı
+CONTENT_TYPES = {
+    "parquet": ("application/vnd.apache.parquet", ".parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", ".arrows"),
+}
+
+
+class ExportView(ReplicaReadMixin, APIView):
+    """
+    Parça, uçak, personel ve takım verilerini Parquet dosyası veya Arrow IPC akışı
+    olarak indiren view. Dosya bellekte oluşturulmaz, satır grubu satır grubu akıtılır.
+    Sadece yöneticiler erişebilir.
+    """
+
+    # Sadece yönetici (is_staff) kullanıcıların erişimine izin ver
+    permission_classes = [IsAdminUser]
+
+    @lazy_swagger_auto_schema("core.api_docs.export.export_schema")
+    def get(self, request, dataset):
+        """
+        Veri setini ek (attachment) olarak akıtır.
+        """
+        # pyarrow açılışta değil, ilk dışa aktarma isteğinde yüklenir
+        from core.exports import EXPORTS, stream_export
+
+        if dataset not in EXPORTS:
+            raise Http404("Veri seti bulunamadı.")
+
+        serializer = ExportQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data
+
+        # Yanıt gövdesi view döndükten sonra üretildiği için okuma veritabanı
+        # (replika yönlendirmesi) burada belirlenir
+        using = router.db_for_read(Part)
+        content_type, extension = CONTENT_TYPES[query["file_format"]]
+        response = StreamingHttpResponse(
+            stream_export(
+                dataset,
+                query["file_format"],
+                start=query.get("start"),
+                end=query.get("end"),
+                using=using,
+            ),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{dataset}{extension}"'
+        return response
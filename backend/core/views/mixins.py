@@ -0,0 +1,148 @@
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from core.db.routers import (
+    use_replica,
+    replica_aliases,
+    pin_to_primary,
+    is_pinned_to_primary,
+)
+from core.watermarks import collection_etag
+
+
+def wants_archived(request):
+    """
+    İsteğin arşivlenmiş kayıtları açıkça isteyip istemediğini döndürür (?archived=true).
+    Sadece okuma isteklerinde geçerlidir.
+    """
+    return request.method in SAFE_METHODS and request.query_params.get(
+        "archived", ""
+    ).lower() in ("1", "true")
+
+
+class ReplicaReadMixin:
+    """
+    Güvenli (GET, HEAD, OPTIONS) istekleri okuma replikalarına yönlendiren viewset mixin'i.
+    Yazma yapan kullanıcı DB_PRIMARY_STICKY_SECONDS süresince birincil veritabanından
+    okur (read-your-writes).
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        # Kimlik doğrulama ve yetki kontrolleri birincil veritabanında yapılır
+        if (
+            request.method in SAFE_METHODS
+            and replica_aliases()
+            and not is_pinned_to_primary(request.user.pk)
+        ):
+            self._replica_token = use_replica.set(True)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, "_replica_token", None)
+        if token is not None:
+            use_replica.reset(token)
+            self._replica_token = None
+        elif (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and replica_aliases()
+        ):
+            pin_to_primary(request.user.pk)
+
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class WatermarkETagMixin:
+    """
+    Liste yanıtlarına koleksiyon sayaçlarından üretilen ETag ekleyen viewset mixin'i.
+    If-None-Match eşleşirse ana tablolara sorgu atılmadan gövdesiz 304 döner.
+    """
+
+    # ETag'e dahil edilecek koleksiyonlar (core.watermarks)
+    watermark_names = ()
+
+    def list(self, request, *args, **kwargs):
+        personnel = getattr(request.user, "personnel", None)
+        # Sayaç listeden önce okunur; arada yazılan veri bir sonraki istekte görülür
+        etag = collection_etag(
+            self.watermark_names, request, getattr(personnel, "team_id", None)
+        )
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and etag in parse_etags(if_none_match):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().list(request, *args, **kwargs)
+
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = etag
+            response["Cache-Control"] = "private, no-cache"
+        return response
+
+
+def _parse_names(value):
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class SparseFieldsMixin:
+    """
+    Okuma yanıtlarını ?fields= ve ?expand= parametreleriyle kırpan viewset mixin'i.
+
+    - ?fields=id,serial_number: Sadece verilen alanlar döner
+    - ?expand=type: Sadece verilen ilişkiler iç içe nesne olarak döner, diğerleri ID olarak
+      döner (?expand= boş verilirse tüm ilişkiler ID olur)
+
+    Parametre verilmezse yanıt değişmez. Queryset'e sadece seçilen ve genişletilen
+    ilişkilerin join'leri (serializer Meta.expandable) eklenir.
+    """
+
+    def get_field_selection(self):
+        """
+        Seçilen alanları ve genişletilecek ilişkileri döndürür; kısıt yoksa None.
+        """
+        # Şema üretimi sırasında istek bulunmaz
+        if getattr(self, "swagger_fake_view", False) or self.request is None:
+            return None, None
+        if self.request.method not in SAFE_METHODS:
+            return None, None
+
+        params = self.request.query_params
+        meta = self.get_serializer_class().Meta
+        expandable = getattr(meta, "expandable", {})
+        fields = _parse_names(params["fields"]) if "fields" in params else None
+        expand = _parse_names(params["expand"]) if "expand" in params else None
+
+        unknown = (fields or set()) - set(meta.fields)
+        unknown |= (expand or set()) - set(expandable)
+        if unknown:
+            raise ValidationError(
+                {"details": f"Bilinmeyen alan: {', '.join(sorted(unknown))}"}
+            )
+        return fields, expand
+
+    def has_field_selection(self):
+        params = self.request.query_params
+        return "fields" in params or "expand" in params
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"], context["expand"] = self.get_field_selection()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+
+        fields, expand = self.get_field_selection()
+        expandable = getattr(self.get_serializer_class().Meta, "expandable", {})
+        paths = [
+            path
+            for name, related in expandable.items()
+            if (fields is None or name in fields) and (expand is None or name in expand)
+            for path in related
+        ]
+        return queryset.select_related(*paths) if paths else queryset
@@ -1,10 +1,20 @@
 from rest_framework import viewsets, permissions
 from rest_framework.response import Response
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
-from core.models import Part, AircraftModel, PartType
+from core.api_docs import lazy_swagger_auto_schema
+from core.idempotency import idempotent
+from core.models import Part, AircraftModel, PartType, ArchivedPart
 from core.serializers.part import PartSerializer
+from core.serializers.archive import ArchivedPartSerializer
 from core.permission import IsTeamAuthorizedForPartType
+from core.views.mixins import (
+    ReplicaReadMixin,
+    SparseFieldsMixin,
+    WatermarkETagMixin,
+    wants_archived,
+)
+from core.watermarks import PARTS, bump
+from core.stock import adjust_stock, free_counts
+from core.rollups import adjust_rollups, record_parts_produced
 from rest_framework.exceptions import NotFound, ValidationError, PermissionDenied
 from django.shortcuts import get_object_or_404
 from django.db.models import (
@@ -22,10 +32,12 @@ from django.db.models import (
 from rest_framework.decorators import action
 from itertools import product
 from django.db.models.functions import Coalesce
-from django.db import connection
+from django.db import connections, router, transaction
 
 
-class PartViewSet(viewsets.ModelViewSet):
+class PartViewSet(
+    ReplicaReadMixin, WatermarkETagMixin, SparseFieldsMixin, viewsets.ModelViewSet
+):
     """
     Parça işlemlerini yöneten viewset.
     Parçaların listelenmesi, detaylarının görüntülenmesi, oluşturulması ve silinmesi işlemlerini yönetir.
@@ -34,6 +46,8 @@ class PartViewSet(viewsets.ModelViewSet):
 
     # Parça verilerini JSON formatına dönüştüren serializer
     serializer_class = PartSerializer
+    # Liste ETag'i parça koleksiyonunun sayacından üretilir
+    watermark_names = (PARTS,)
 
     def get_permissions(self):
         """
@@ -50,19 +64,31 @@ class PartViewSet(viewsets.ModelViewSet):
         - Montaj takımı tüm parçaları görebilir
         - Diğer takımlar sadece kendi yetkili oldukları parçaları görebilir
         - Uçak ID'si ile filtreleme yapılabilir
+        - ?archived=true ile arşivlenmiş parçalar listelenir
         """
+        # Şema üretimi sırasında istek bulunmaz
+        if getattr(self, "swagger_fake_view", False):
+            return Part.objects.none()
+
         user = self.request.user
         personnel = getattr(user, "personnel", None)
 
         if not personnel or not personnel.team:
             return Part.objects.none()
 
+        # Arşiv sadece açıkça istendiğinde okunur
+        model = ArchivedPart if wants_archived(self.request) else Part
+
         # Montaj takımı tüm parçaları görebilir
         if personnel.team.responsibility.lower() == "montaj":
-            queryset = Part.objects.all()
+            queryset = model.objects.all()
         else:
-            # Diğer takımlar sadece kendi takımlarına izin verilen parçaları görebilir
-            queryset = Part.objects.filter(type__allowed_team=personnel.team)
+            # Diğer takımlar sadece kendi takımlarına izin verilen parçaları görebilir.
+            # Parçadaki team alanı sayesinde parça tipi tablosuyla join yapılmaz;
+            # en yeni parçalar önce, (team, created_at) indeksinden sıralı okunur.
+            queryset = model.objects.filter(team_id=personnel.team_id).order_by(
+                "-created_at"
+            )
 
         # Eğer sorgu parametrelerinde uçak ID'si varsa filtrele
         aircraft_id = self.request.query_params.get("aircraft_id", None)
@@ -71,12 +97,38 @@ class PartViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def get_serializer_class(self):
+        """
+        Arşiv okumalarında arşiv serializer'ını, diğer işlemlerde PartSerializer'ı döndürür.
+        Şema üretiminde istek olmadığı için PartSerializer kullanılır.
+        """
+        # Şema üretimi sırasında istek bulunmaz
+        if getattr(self, "swagger_fake_view", False) or self.request is None:
+            return self.serializer_class
+        if wants_archived(self.request):
+            return ArchivedPartSerializer
+        return self.serializer_class
+
     def perform_create(self, serializer):
         """
         Yeni parça oluşturulurken üreten personeli ve kullanım durumunu kaydeder.
         """
         personnel = self.request.user.personnel
-        serializer.save(produced_by=personnel, used_in_aircraft=None)
+        with transaction.atomic():
+            part = serializer.save(produced_by=personnel, used_in_aircraft=None)
+            adjust_stock(free_counts([part]))
+            record_parts_produced([part])
+            bump(PARTS)
+
+    def perform_destroy(self, instance):
+        """
+        Parçayı siler; stok, üretim ve parça koleksiyonu sayaçlarını aynı transaction'da günceller.
+        """
+        with transaction.atomic():
+            adjust_rollups(Part.objects.filter(pk=instance.pk), sign=-1)
+            instance.delete()
+            adjust_stock(free_counts([instance]), sign=-1)
+            bump(PARTS)
 
     def get_object(self):
         """
@@ -88,136 +140,10 @@ class PartViewSet(viewsets.ModelViewSet):
 
         try:
             return queryset.get(pk=pk)
-        except Part.DoesNotExist:
+        except queryset.model.DoesNotExist:
             raise NotFound("Verilen sorguya uygun bir Parça bulunamadı.")
 
-    @swagger_auto_schema(
-        operation_summary="Parçaları Listele",
-        operation_description="Tüm üretilmiş parçaların listesini döner. Montaj takımı tüm parçaları görebilirken, diğer takımlar sadece kendilerine ait parçaları görürler.",
-        responses={
-            200: openapi.Response(
-                description="Parçalar başarıyla listelendi",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "total": openapi.Schema(
-                            type=openapi.TYPE_INTEGER, description="Toplam kayıt sayısı"
-                        ),
-                        "data": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "id": openapi.Schema(
-                                        type=openapi.TYPE_INTEGER,
-                                        description="Parça ID",
-                                    ),
-                                    "serial_number": openapi.Schema(
-                                        type=openapi.TYPE_STRING,
-                                        description="Parça seri numarası",
-                                    ),
-                                    "type": openapi.Schema(
-                                        type=openapi.TYPE_OBJECT,
-                                        properties={
-                                            "id": openapi.Schema(
-                                                type=openapi.TYPE_INTEGER,
-                                                description="Parça tipi ID",
-                                            ),
-                                            "name": openapi.Schema(
-                                                type=openapi.TYPE_STRING,
-                                                description="Parça tipi adı",
-                                            ),
-                                            "allowed_team": openapi.Schema(
-                                                type=openapi.TYPE_STRING,
-                                                description="Yetkili takım",
-                                            ),
-                                        },
-                                    ),
-                                    "aircraft_model": openapi.Schema(
-                                        type=openapi.TYPE_OBJECT,
-                                        properties={
-                                            "id": openapi.Schema(
-                                                type=openapi.TYPE_INTEGER,
-                                                description="Uçak modeli ID",
-                                            ),
-                                            "name": openapi.Schema(
-                                                type=openapi.TYPE_STRING,
-                                                description="Uçak modeli adı",
-                                            ),
-                                        },
-                                    ),
-                                    "used_in_aircraft": openapi.Schema(
-                                        type=openapi.TYPE_OBJECT,
-                                        properties={
-                                            "id": openapi.Schema(
-                                                type=openapi.TYPE_INTEGER,
-                                                description="Uçak ID",
-                                            ),
-                                            "serial_number": openapi.Schema(
-                                                type=openapi.TYPE_STRING,
-                                                description="Uçak seri numarası",
-                                            ),
-                                            "model": openapi.Schema(
-                                                type=openapi.TYPE_STRING,
-                                                description="Uçak modeli adı",
-                                            ),
-                                        },
-                                        nullable=True,
-                                    ),
-                                    "produced_by": openapi.Schema(
-                                        type=openapi.TYPE_OBJECT,
-                                        properties={
-                                            "id": openapi.Schema(
-                                                type=openapi.TYPE_INTEGER,
-                                                description="Personel ID",
-                                            ),
-                                            "full_name": openapi.Schema(
-                                                type=openapi.TYPE_STRING,
-                                                description="Personel adı",
-                                            ),
-                                            "team": openapi.Schema(
-                                                type=openapi.TYPE_STRING,
-                                                description="Personel takımı",
-                                            ),
-                                        },
-                                    ),
-                                    "created_at": openapi.Schema(
-                                        type=openapi.TYPE_STRING,
-                                        format="date-time",
-                                        description="Oluşturulma tarihi",
-                                    ),
-                                },
-                            ),
-                        ),
-                    },
-                ),
-            )
-        },
-        manual_parameters=[
-            openapi.Parameter(
-                "aircraft_id",
-                openapi.IN_QUERY,
-                description="Belirli bir uçağa ait parçaları filtrelemek için uçak ID'si",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-            openapi.Parameter(
-                "limit",
-                openapi.IN_QUERY,
-                description="Sayfalama için limit değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-            openapi.Parameter(
-                "offset",
-                openapi.IN_QUERY,
-                description="Sayfalama için offset değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-        ],
-        tags=["Parts"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.part.list_schema")
     def list(self, request, *args, **kwargs):
         """
         Tüm parçaların listesini getirir.
@@ -225,11 +151,7 @@ class PartViewSet(viewsets.ModelViewSet):
         """
         return super().list(request, *args, **kwargs)
 
-    @swagger_auto_schema(
-        operation_summary="Parça Detayı",
-        operation_description="Belirli bir parçanın detay bilgisini döner.",
-        tags=["Parts"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.part.retrieve_schema")
     def retrieve(self, request, *args, **kwargs):
         """
         Belirli bir parçanın detaylı bilgilerini getirir.
@@ -239,30 +161,8 @@ class PartViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
-    @swagger_auto_schema(
-        operation_summary="Parça Oluştur",
-        operation_description="""
-Takımınızın yetkili olduğu bir parça türü ile parça üretebilirsiniz.
-
-Eğer takımınız type ile eşleşmiyorsa **403 hatası** döner.
-        """,
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=["serial_number", "type_id", "aircraft_model_id"],
-            properties={
-                "serial_number": openapi.Schema(
-                    type=openapi.TYPE_STRING, description="Parça seri numarası"
-                ),
-                "type_id": openapi.Schema(
-                    type=openapi.TYPE_INTEGER, description="Parça türü ID"
-                ),
-                "aircraft_model_id": openapi.Schema(
-                    type=openapi.TYPE_INTEGER, description="Uçak modeli ID"
-                ),
-            },
-        ),
-        tags=["Parts"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.part.create_schema")
+    @idempotent
     def create(self, request, *args, **kwargs):
         """
         Yeni bir parça oluşturur.
@@ -277,11 +177,7 @@ Eğer takımınız type ile eşleşmiyorsa **403 hatası** döner.
                 )
             raise e
 
-    @swagger_auto_schema(
-        operation_summary="Parça Sil (Geri Dönüşüm)",
-        operation_description="Belirli bir parçayı veritabanından kalıcı olarak siler. Eğer parça bir uçakta kullanılıyorsa silinemez.",
-        tags=["Parts"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.part.destroy_schema")
     def destroy(self, request, *args, **kwargs):
         """
         Bir parçayı siler.
@@ -298,7 +194,7 @@ Eğer takımınız type ile eşleşmiyorsa **403 hatası** döner.
                 {"details": "Bu işlem için bir takıma ait olmanız gerekmektedir."}
             )
 
-        if instance.type.allowed_team != personnel.team:
+        if instance.team_id != personnel.team_id:
             raise PermissionDenied(
                 {
                     "details": "Sadece kendi takımınıza ait parçaları geri dönüşüme yollayabilirsiniz."
@@ -314,84 +210,7 @@ Eğer takımınız type ile eşleşmiyorsa **403 hatası** döner.
 
         return super().destroy(request, *args, **kwargs)
 
-    @swagger_auto_schema(
-        operation_summary="Parça Stok Durumu",
-        operation_description="""Parçaların uçak modeline göre stok durumunu listeler. 
-        Her uçak modeli için:
-        - Parça tipi adı
-        - Toplam üretilen parça sayısı
-        - Kullanılan parça sayısı
-        - Stokta kalan parça sayısı
-        
-        bilgilerini içeren bir rapor oluşturur.
-        """,
-        responses={
-            200: openapi.Response(
-                description="Stok durumu başarıyla getirildi",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "total": openapi.Schema(
-                            type=openapi.TYPE_INTEGER, description="Toplam kayıt sayısı"
-                        ),
-                        "data": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "aircraft_model_name": openapi.Schema(
-                                        type=openapi.TYPE_STRING,
-                                        description="Uçak modeli adı",
-                                    ),
-                                    "parts": openapi.Schema(
-                                        type=openapi.TYPE_ARRAY,
-                                        items=openapi.Schema(
-                                            type=openapi.TYPE_OBJECT,
-                                            properties={
-                                                "part_type_name": openapi.Schema(
-                                                    type=openapi.TYPE_STRING,
-                                                    description="Parça tipi adı",
-                                                ),
-                                                "total_produced": openapi.Schema(
-                                                    type=openapi.TYPE_INTEGER,
-                                                    description="Toplam üretilen parça sayısı",
-                                                ),
-                                                "used_count": openapi.Schema(
-                                                    type=openapi.TYPE_INTEGER,
-                                                    description="Kullanılan parça sayısı",
-                                                ),
-                                                "stock_count": openapi.Schema(
-                                                    type=openapi.TYPE_INTEGER,
-                                                    description="Stokta kalan parça sayısı",
-                                                ),
-                                            },
-                                        ),
-                                    ),
-                                },
-                            ),
-                        ),
-                    },
-                ),
-            )
-        },
-        manual_parameters=[
-            openapi.Parameter(
-                "limit",
-                openapi.IN_QUERY,
-                description="Sayfalama için limit değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-            openapi.Parameter(
-                "offset",
-                openapi.IN_QUERY,
-                description="Sayfalama için offset değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-        ],
-        tags=["Parts"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.part.stock_schema")
     @action(detail=False, methods=["get"], url_path="stock")
     def stock(self, request):
         """
@@ -402,19 +221,21 @@ Eğer takımınız type ile eşleşmiyorsa **403 hatası** döner.
         - Kullanılan parça sayısı
         - Stokta kalan parça sayısı
 
+        Arşive taşınan parçalar (hepsi kullanılmıştır) core_archivedpartcount
+        özet tablosundan eklenir, arşiv tablosu taranmaz.
+
         bilgilerini içeren bir rapor oluşturur.
         """
-        # Ham SQL sorgusu çalıştır
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
+        # Ham SQL sorgusu çalıştır (okuma yönlendirmesine uygun veritabanında)
+        with connections[router.db_for_read(Part)].cursor() as cursor:
+            cursor.execute("""
                 SELECT
                     acm.id AS aircraft_model_id,
                     acm.name AS aircraft_model_name,
                     pt.id AS part_type_id,
                     pt.name AS part_type_name,
-                    COUNT(cp.id) AS total_count,
-                    COUNT(cp.used_in_aircraft_id) AS used_count,
+                    COUNT(cp.id) + COALESCE(MAX(apc.count), 0) AS total_count,
+                    COUNT(cp.used_in_aircraft_id) + COALESCE(MAX(apc.count), 0) AS used_count,
                     COUNT(cp.id) - COUNT(cp.used_in_aircraft_id) AS remaining_count
                 FROM
                     core_aircraftmodel acm
@@ -422,12 +243,14 @@ Eğer takımınız type ile eşleşmiyorsa **403 hatası** döner.
                     core_parttype pt
                 LEFT JOIN
                     core_part cp ON cp.aircraft_model_id = acm.id AND cp.type_id = pt.id
+                LEFT JOIN
+                    core_archivedpartcount apc
+                    ON apc.aircraft_model_id = acm.id AND apc.part_type_id = pt.id
                 GROUP BY
                     acm.id, acm.name, pt.id, pt.name
                 ORDER BY
                     acm.id, pt.id
-            """
-            )
+            """)
             columns = [col[0] for col in cursor.description]
             stock_data = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
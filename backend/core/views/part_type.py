@@ -1,12 +1,12 @@
 from core.models.part_type import PartType
 from rest_framework import viewsets, permissions
 from core.serializers.part_type import PartTypeSerializer
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
+from core.api_docs import lazy_swagger_auto_schema
 from rest_framework.response import Response
+from core.views.mixins import ReplicaReadMixin
 
 
-class PartTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class PartTypeViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """
     Parça tiplerini görüntülemek için kullanılan viewset.
     Bu viewset sadece okuma işlemlerine izin verir (listeleme ve detay görüntüleme).
@@ -19,70 +19,7 @@ class PartTypeViewSet(viewsets.ReadOnlyModelViewSet):
     # Sadece kimliği doğrulanmış kullanıcıların erişimine izin veren izin sınıfı
     permission_classes = [permissions.IsAuthenticated]
 
-    @swagger_auto_schema(
-        operation_summary="Parça Tiplerini Listele",
-        operation_description="Sistemdeki tüm parça tiplerini listeler",
-        responses={
-            200: openapi.Response(
-                description="Başarılı yanıt",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "total": openapi.Schema(
-                            type=openapi.TYPE_INTEGER, description="Toplam kayıt sayısı"
-                        ),
-                        "data": openapi.Schema(
-                            type=openapi.TYPE_ARRAY,
-                            items=openapi.Schema(
-                                type=openapi.TYPE_OBJECT,
-                                properties={
-                                    "id": openapi.Schema(
-                                        type=openapi.TYPE_INTEGER,
-                                        description="Parça tipi ID",
-                                    ),
-                                    "name": openapi.Schema(
-                                        type=openapi.TYPE_STRING,
-                                        description="Parça tipi adı",
-                                    ),
-                                    "allowed_team": openapi.Schema(
-                                        type=openapi.TYPE_OBJECT,
-                                        properties={
-                                            "id": openapi.Schema(
-                                                type=openapi.TYPE_INTEGER,
-                                                description="Takım ID",
-                                            ),
-                                            "name": openapi.Schema(
-                                                type=openapi.TYPE_STRING,
-                                                description="Takım adı",
-                                            ),
-                                        },
-                                    ),
-                                },
-                            ),
-                            description="Parça tipleri listesi",
-                        ),
-                    },
-                ),
-            )
-        },
-        manual_parameters=[
-            openapi.Parameter(
-                "limit",
-                openapi.IN_QUERY,
-                description="Sayfalama için limit değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-            openapi.Parameter(
-                "offset",
-                openapi.IN_QUERY,
-                description="Sayfalama için offset değeri",
-                type=openapi.TYPE_INTEGER,
-                required=False,
-            ),
-        ],
-        tags=["Part Types"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.part_type.list_schema")
     def list(self, request, *args, **kwargs):
         """
         Tüm parça tiplerini listeler.
@@ -112,38 +49,7 @@ class PartTypeViewSet(viewsets.ReadOnlyModelViewSet):
         total_count = self.get_queryset().count()
         return Response({"total": total_count, "data": serializer.data})
 
-    @swagger_auto_schema(
-        operation_summary="Parça Tipi Detayı",
-        operation_description="Belirli bir parça tipinin detaylarını gösterir",
-        responses={
-            200: openapi.Response(
-                description="Başarılı yanıt",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        "id": openapi.Schema(
-                            type=openapi.TYPE_INTEGER, description="Parça tipi ID"
-                        ),
-                        "name": openapi.Schema(
-                            type=openapi.TYPE_STRING, description="Parça tipi adı"
-                        ),
-                        "allowed_team": openapi.Schema(
-                            type=openapi.TYPE_OBJECT,
-                            properties={
-                                "id": openapi.Schema(
-                                    type=openapi.TYPE_INTEGER, description="Takım ID"
-                                ),
-                                "name": openapi.Schema(
-                                    type=openapi.TYPE_STRING, description="Takım adı"
-                                ),
-                            },
-                        ),
-                    },
-                ),
-            )
-        },
-        tags=["Part Types"],
-    )
+    @lazy_swagger_auto_schema("core.api_docs.part_type.retrieve_schema")
     def retrieve(self, request, *args, **kwargs):
         """
         Belirli bir parça tipinin detaylı bilgilerini getirir.
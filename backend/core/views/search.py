@@ -0,0 +1,43 @@
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import PermissionDenied
+from core.api_docs import lazy_swagger_auto_schema
+from core.search import search
+from core.serializers.search import SearchQuerySerializer
+from core.views.mixins import ReplicaReadMixin
+
+
+class SearchView(ReplicaReadMixin, APIView):
+    """
+    Parça ve uçak seri numaralarında ve personel adlarında bulanık (fuzzy) arama
+    yapan view. Kullanıcı sadece takımının görebildiği kayıtları bulur.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @lazy_swagger_auto_schema("core.api_docs.search.search_schema")
+    def get(self, request):
+        """
+        Sorguya en çok benzeyen kayıtları benzerliğe göre sıralı getirir.
+        """
+        serializer = SearchQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data["q"].strip()
+
+        personnel = getattr(request.user, "personnel", None)
+        if not personnel or not personnel.team:
+            raise PermissionDenied(
+                {"details": "Bu işlem için bir takıma ait olmanız gerekmektedir."}
+            )
+
+        # Yazarken yapılan kısa sorgular veritabanına gitmez
+        results = []
+        if len(query) >= settings.SEARCH_MIN_LENGTH:
+            results = search(personnel, query, serializer.validated_data["limit"])
+
+        response = Response({"query": query, "results": results})
+        # Aynı sorguya geri dönüldüğünde (silip yeniden yazma) tarayıcı önbelleği kullanılır
+        response["Cache-Control"] = f"private, max-age={settings.SEARCH_CACHE_SECONDS}"
+        return response
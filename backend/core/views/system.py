@@ -0,0 +1,117 @@
+import os
+from django.http import FileResponse, Http404
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+from core.api_docs import lazy_swagger_auto_schema
+from core.db.pool import get_all_pool_stats
+from core.logs import get_logging_stats
+from core.middleware.admission import get_admission_stats
+from core import profiling
+
+
+class DbPoolStatsView(APIView):
+    """
+    Veritabanı bağlantı havuzu istatistiklerini döndüren view.
+    Havuz boyutlandırması için kullanılır. Sadece yöneticiler erişebilir.
+    """
+
+    # Sadece yönetici (is_staff) kullanıcıların erişimine izin ver
+    permission_classes = [IsAdminUser]
+
+    @lazy_swagger_auto_schema("core.api_docs.system.db_pool_stats_schema")
+    def get(self, request):
+        """
+        Havuz kullanan tüm veritabanı bağlantılarının istatistiklerini getirir.
+        """
+        return Response({"pid": os.getpid(), "pools": get_all_pool_stats()})
+
+
+class LoggingStatsView(APIView):
+    """
+    Loglama hattının istatistiklerini döndüren view.
+    İstek thread'indeki loglama maliyetini ölçmek için kullanılır. Sadece yöneticiler erişebilir.
+    """
+
+    # Sadece yönetici (is_staff) kullanıcıların erişimine izin ver
+    permission_classes = [IsAdminUser]
+
+    @lazy_swagger_auto_schema("core.api_docs.system.logging_stats_schema")
+    def get(self, request):
+        """
+        Log kuyruğu ve örnekleme istatistiklerini getirir.
+        """
+        return Response({"pid": os.getpid(), **get_logging_stats()})
+
+
+class AdmissionStatsView(APIView):
+    """
+    Kabul kontrolü kararlarını (kabul, bekleme, ret, zaman aşımı) döndüren view.
+    Sadece yöneticiler erişebilir.
+    """
+
+    # Sadece yönetici (is_staff) kullanıcıların erişimine izin ver
+    permission_classes = [IsAdminUser]
+
+    @lazy_swagger_auto_schema("core.api_docs.system.admission_stats_schema")
+    def get(self, request):
+        """
+        Öncelik sınıfı bazında kabul kontrolü istatistiklerini getirir.
+        """
+        return Response({"pid": os.getpid(), **get_admission_stats()})
+
+
+class ProfileListView(APIView):
+    """
+    Kaydedilmiş istek profillerini listeleyen view. Sadece yöneticiler erişebilir.
+    """
+
+    # Sadece yönetici (is_staff) kullanıcıların erişimine izin ver
+    permission_classes = [IsAdminUser]
+
+    @lazy_swagger_auto_schema("core.api_docs.system.profile_list_schema")
+    def get(self, request):
+        """
+        Profillerin özetlerini yeniden eskiye getirir.
+        """
+        return Response(profiling.list_profiles())
+
+
+class ProfileDetailView(APIView):
+    """
+    Tek bir profilin özetini ve SQL zaman çizelgesini döndüren view.
+    Sadece yöneticiler erişebilir.
+    """
+
+    # Sadece yönetici (is_staff) kullanıcıların erişimine izin ver
+    permission_classes = [IsAdminUser]
+
+    @lazy_swagger_auto_schema("core.api_docs.system.profile_detail_schema")
+    def get(self, request, profile_id):
+        """
+        Profil özetini ve istek boyunca çalışan SQL sorgularını getirir.
+        """
+        metadata = profiling.get_profile(profile_id)
+        if metadata is None:
+            raise Http404("Profil bulunamadı.")
+        return Response(metadata)
+
+
+class ProfileDownloadView(APIView):
+    """
+    Profil dosyasını indiren view. Örnekleme profilleri folded stacks (.folded),
+    cProfile profilleri pstats (.prof) formatındadır. Sadece yöneticiler erişebilir.
+    """
+
+    # Sadece yönetici (is_staff) kullanıcıların erişimine izin ver
+    permission_classes = [IsAdminUser]
+
+    @lazy_swagger_auto_schema("core.api_docs.system.profile_download_schema")
+    def get(self, request, profile_id):
+        """
+        Profil dosyasını ek (attachment) olarak döndürür.
+        """
+        path = profiling.get_profile_file(profile_id)
+        if path is None:
+            raise Http404("Profil bulunamadı.")
+        return FileResponse(open(path, "rb"), as_attachment=True, filename=path.name)
@@ -0,0 +1,60 @@
+import hashlib
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from core.models import ChangeWatermark
+
+# Koleksiyon adları
+PARTS = "parts"
+AIRCRAFT = "aircraft"
+# Mevcut uçakların detay yanıtlarını değiştiren yazmalar (yeni montajlar artırmaz)
+AIRCRAFT_DETAIL = "aircraft-detail"
+
+
+def bump(*names):
+    """
+    Verilen koleksiyonların sayaçlarını artırır.
+    Yazma işlemiyle aynı transaction içinde çağrılmalıdır; böylece sayaç ve veri
+    birlikte görünür hale gelir.
+    """
+    names = sorted(set(names))
+    updated = ChangeWatermark.objects.filter(name__in=names).update(
+        version=F("version") + 1, updated_at=timezone.now()
+    )
+    if updated == len(names):
+        return
+
+    # İlk yazmada sayaç satırı oluşturulur
+    for name in names:
+        try:
+            with transaction.atomic():
+                ChangeWatermark.objects.get_or_create(name=name)
+        except IntegrityError:
+            pass
+    ChangeWatermark.objects.filter(name__in=names).update(
+        version=F("version") + 1, updated_at=timezone.now()
+    )
+
+
+def get_versions(names):
+    """
+    Koleksiyonların güncel sayaçlarını tek sorguda döndürür.
+    """
+    versions = dict(
+        ChangeWatermark.objects.filter(name__in=names).values_list("name", "version")
+    )
+    return [versions.get(name, 0) for name in names]
+
+
+def collection_etag(names, request, team_id):
+    """
+    Koleksiyon sayaçları, sorgu parametreleri ve çağıranın takımından zayıf bir ETag üretir.
+    """
+    params = "&".join(
+        f"{key}={value}"
+        for key, values in sorted(request.query_params.lists())
+        for value in values
+    )
+    versions = ",".join(str(version) for version in get_versions(names))
+    raw = f"{request.path}?{params}|{versions}|{team_id}"
+    return f'W/"{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
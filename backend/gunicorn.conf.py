@@ -0,0 +1,126 @@
+"""
+Üretim sunucusu (gunicorn) yapılandırması.
+
+Uygulama master süreçte bir kez yüklenir (preload) ve worker'lar fork ile oluşturulur;
+Django, DRF ve view modülleri worker'lar arasında copy-on-write olarak paylaşılır.
+Worker'lar trafik almadan önce veritabanı bağlantılarını açar ve bellek sınırını
+aşınca mevcut isteği bitirip yeniden başlatılır.
+
+Çalıştırmak için: gunicorn (bu dosya çalışma dizininden otomatik okunur)
+"""
+
+import gc
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parent / ".env")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", str(multiprocessing.cpu_count() * 2 + 1)))
+
+# sync: worker başına tek istek, gthread: worker başına GUNICORN_THREADS thread,
+# async: ASGI uygulaması uvicorn worker'ı ile çalışır
+WORKER_CLASSES = {
+    "sync": ("sync", "config.wsgi:application"),
+    "gthread": ("gthread", "config.wsgi:application"),
+    "async": ("uvicorn_worker.UvicornWorker", "config.asgi:application"),
+}
+worker_kind = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+worker_class, wsgi_app = WORKER_CLASSES[worker_kind]
+threads = int(os.getenv("GUNICORN_THREADS", "4")) if worker_kind == "gthread" else 1
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "True") == "True"
+
+# İstek sayısına göre yeniden başlatma; jitter tüm worker'ların aynı anda
+# yeniden başlamasını önler
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "5000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "500"))
+# Bu RSS değerini (MB) aşan worker mevcut isteği bitirip yeniden başlatılır (0 = kapalı)
+max_worker_rss_mb = int(os.getenv("GUNICORN_MAX_WORKER_RSS_MB", "512"))
+# async worker'da post_request kancası çağrılmaz; bellek arka plandaki bir thread
+# tarafından bu aralıkla (saniye) kontrol edilir
+rss_check_interval = float(os.getenv("GUNICORN_RSS_CHECK_INTERVAL", "10"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG") or None
+errorlog = "-"
+
+
+def when_ready(server):
+    """
+    Worker'lar oluşturulmadan önce master süreçte çalışır.
+    """
+    if not preload_app:
+        return
+
+    from core.startup import warm_up_app
+
+    warm_up_app()
+    # Yüklenen nesneler kalıcı nesil olarak işaretlenir; çöp toplayıcı worker'larda
+    # bu nesnelere dokunmaz ve paylaşılan sayfalar kopyalanmaz
+    gc.freeze()
+    server.log.info("Uygulama önceden yüklendi ve ısıtıldı")
+
+
+def post_worker_init(worker):
+    """
+    Worker trafik almadan önce bağlantıları (ve preload yoksa uygulamayı) ısıtır.
+    """
+    from core.startup import warm_up_app, warm_up_connections
+
+    if not preload_app:
+        warm_up_app()
+    for error in warm_up_connections():
+        worker.log.warning("Veritabanı bağlantısı ısıtılamadı: %s", error)
+
+    if worker_kind == "async" and max_worker_rss_mb:
+        threading.Thread(
+            target=watch_worker_rss, args=(worker,), name="rss-watcher", daemon=True
+        ).start()
+
+
+def _rss_over_limit(worker):
+    from core.startup import current_rss
+
+    rss_mb = current_rss() / (1024 * 1024)
+    if rss_mb <= max_worker_rss_mb:
+        return False
+    worker.log.info(
+        "Worker %s bellek sınırını aştı (%.0f MB > %s MB), yeniden başlatılıyor",
+        worker.pid,
+        rss_mb,
+        max_worker_rss_mb,
+    )
+    return True
+
+
+def watch_worker_rss(worker):
+    """
+    Async (uvicorn) worker'ın belleğini periyodik olarak kontrol eder. Sınır
+    aşılınca worker'a SIGTERM gönderilir; uvicorn süren istekleri bitirip kapanır
+    ve master yerine yenisini başlatır.
+    """
+    while True:
+        time.sleep(rss_check_interval)
+        if _rss_over_limit(worker):
+            os.kill(worker.pid, signal.SIGTERM)
+            return
+
+
+def post_request(worker, req, environ, resp):
+    """
+    Bellek sınırını aşan worker'ı mevcut istek bittikten sonra kapatır;
+    master yerine yenisini başlatır.
+    """
+    if max_worker_rss_mb and _rss_over_limit(worker):
+        worker.alive = False